@@ -5,6 +5,7 @@ from sqlalchemy import pool
 
 from alembic import context
 from app.models.user_model import Base  # adjust "myapp.models" to the actual location of your Base
+from app.models import audit_log_model, email_outbox_model, event_model, notification_model  # noqa: F401  registers their tables on Base.metadata
 
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,41 @@
+"""add notifications
+
+Revision ID: 4f8a6b3d92e1
+Revises: c5e2a9d17f03
+Create Date: 2026-10-19 11:31:06.871243
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a6b3d92e1'
+down_revision: Union[str, None] = 'c5e2a9d17f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notifications',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('kind', sa.Enum('EVENT_UPDATE', 'SYSTEM', name='NotificationKind'), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('body', sa.String(length=2000), nullable=True),
+    sa.Column('event_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('read_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notifications_user_created_at', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_created_at', table_name='notifications')
+    op.drop_table('notifications')
+    sa.Enum(name='NotificationKind').drop(op.get_bind(), checkfirst=True)
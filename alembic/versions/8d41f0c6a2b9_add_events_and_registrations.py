@@ -0,0 +1,59 @@
+"""add events and registrations
+
+Revision ID: 8d41f0c6a2b9
+Revises: 3b7c9e2a41d5
+Create Date: 2026-10-19 10:03:17.502914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f0c6a2b9'
+down_revision: Union[str, None] = '3b7c9e2a41d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.String(length=2000), nullable=True),
+    sa.Column('event_type', sa.Enum('COMPANY_TOUR', 'MOCK_INTERVIEW', 'GUEST_LECTURE', 'WORKSHOP', 'NETWORKING', 'OTHER', name='EventType'), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('starts_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('registered_count', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'APPROVED', 'REJECTED', name='EventStatus'), nullable=False),
+    sa.Column('created_by', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.CheckConstraint('capacity > 0', name='ck_events_capacity_positive'),
+    sa.CheckConstraint('registered_count >= 0 AND registered_count <= capacity', name='ck_events_registered_within_capacity'),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('event_registrations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('event_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('event_id', 'user_id', name='uq_event_registrations_event_user')
+    )
+    op.create_index(op.f('ix_event_registrations_user_id'), 'event_registrations', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_event_registrations_user_id'), table_name='event_registrations')
+    op.drop_table('event_registrations')
+    op.drop_table('events')
+    sa.Enum(name='EventStatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='EventType').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,39 @@
+"""add user notification preferences
+
+Revision ID: 9a3d5c7e1f24
+Revises: 4f8a6b3d92e1
+Create Date: 2026-10-19 13:02:44.519307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3d5c7e1f24'
+down_revision: Union[str, None] = '4f8a6b3d92e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Bit values of app.models.user_model.NotificationPreference
+PREFERENCE_BITS = {
+    'event_updates_email': 1,
+    'event_updates_dashboard': 2,
+    'event_approval_email': 4,
+    'pro_status_email': 8,
+}
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('notification_preferences', sa.Integer(), server_default=sa.text('15'), nullable=False))
+    for name, bit in PREFERENCE_BITS.items():
+        op.create_index(f'ix_users_opted_in_{name}', 'users', ['id'], unique=False,
+                        postgresql_where=sa.text(f'(notification_preferences & {bit}) <> 0'))
+
+
+def downgrade() -> None:
+    for name in PREFERENCE_BITS:
+        op.drop_index(f'ix_users_opted_in_{name}', table_name='users')
+    op.drop_column('users', 'notification_preferences')
@@ -0,0 +1,35 @@
+"""add unread notification counts
+
+Revision ID: a8c4e2f6b710
+Revises: e7b3c1d9f254
+Create Date: 2026-10-19 18:11:37.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c4e2f6b710'
+down_revision: Union[str, None] = 'e7b3c1d9f254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('unread_notification_count', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.create_index('ix_notifications_user_unread_created_at', 'notifications', ['user_id', 'created_at', 'id'], unique=False,
+                    postgresql_where=sa.text('read_at IS NULL'))
+    # Seed the counters from the notifications already stored; from here on they are maintained incrementally
+    op.execute(
+        "UPDATE users SET unread_notification_count = unread.count "
+        "FROM (SELECT user_id, count(*) AS count FROM notifications WHERE read_at IS NULL GROUP BY user_id) AS unread "
+        "WHERE users.id = unread.user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_unread_created_at', table_name='notifications')
+    op.drop_column('users', 'unread_notification_count')
@@ -0,0 +1,36 @@
+"""index admin triage lists
+
+Revision ID: b4d7e1a9c362
+Revises: f3a9d6b2c851
+Create Date: 2026-10-19 15:04:37.219640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d7e1a9c362'
+down_revision: Union[str, None] = 'f3a9d6b2c851'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRO_CANDIDATE = ("email_verified AND NOT is_locked AND NOT is_professional "
+                 "AND (linkedin_profile_url IS NOT NULL OR github_profile_url IS NOT NULL)")
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_locked_updated_at', 'users', ['updated_at', 'id'], unique=False,
+                    postgresql_where=sa.text('is_locked'))
+    op.create_index('ix_users_unverified_created_at', 'users', ['created_at', 'id'], unique=False,
+                    postgresql_where=sa.text('NOT email_verified'))
+    op.create_index('ix_users_pro_candidates_created_at', 'users', ['created_at', 'id'], unique=False,
+                    postgresql_where=sa.text(PRO_CANDIDATE))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_pro_candidates_created_at', table_name='users')
+    op.drop_index('ix_users_unverified_created_at', table_name='users')
+    op.drop_index('ix_users_locked_updated_at', table_name='users')
@@ -0,0 +1,52 @@
+"""add audit log
+
+Revision ID: b6e1f8d2c473
+Revises: 9a3d5c7e1f24
+Create Date: 2026-10-19 14:10:37.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1f8d2c473'
+down_revision: Union[str, None] = '9a3d5c7e1f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Monthly partitions are created by the application as entries for a new month arrive
+    op.create_table('audit_log',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('action', sa.Enum('ROLE_CHANGED', 'ACCOUNT_LOCKED', 'ACCOUNT_UNLOCKED', 'USER_DELETED', 'PROFESSIONAL_STATUS_CHANGED', name='AuditAction'), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('actor', sa.String(length=255), nullable=True),
+    sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.create_index('ix_audit_log_created_at', 'audit_log', ['created_at', 'id'], unique=False)
+    op.create_index('ix_audit_log_user_created_at', 'audit_log', ['user_id', 'created_at', 'id'], unique=False)
+    op.execute('CREATE TABLE IF NOT EXISTS audit_log_default PARTITION OF audit_log DEFAULT')
+    op.execute("""
+    CREATE OR REPLACE FUNCTION audit_log_append_only() RETURNS trigger AS $$
+    BEGIN
+        RAISE EXCEPTION 'audit_log is append-only';
+    END;
+    $$ LANGUAGE plpgsql
+    """)
+    op.execute('CREATE TRIGGER audit_log_append_only BEFORE UPDATE OR DELETE ON audit_log '
+               'FOR EACH ROW EXECUTE FUNCTION audit_log_append_only()')
+
+
+def downgrade() -> None:
+    # Dropping the parent drops every partition and the trigger with it
+    op.drop_table('audit_log')
+    op.execute('DROP FUNCTION IF EXISTS audit_log_append_only()')
+    sa.Enum(name='AuditAction').drop(op.get_bind(), checkfirst=True)
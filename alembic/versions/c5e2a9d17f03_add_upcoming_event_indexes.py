@@ -0,0 +1,30 @@
+"""add upcoming event indexes
+
+Revision ID: c5e2a9d17f03
+Revises: 8d41f0c6a2b9
+Create Date: 2026-10-19 10:48:51.334072
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e2a9d17f03'
+down_revision: Union[str, None] = '8d41f0c6a2b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_approved_starts_at', 'events', ['starts_at', 'id'], unique=False, postgresql_where=sa.text("status = 'APPROVED'"))
+    op.create_index('ix_events_approved_type_starts_at', 'events', ['event_type', 'starts_at', 'id'], unique=False, postgresql_where=sa.text("status = 'APPROVED'"))
+    op.create_index('ix_events_approved_location_starts_at', 'events', [sa.text('lower(location)'), 'starts_at', 'id'], unique=False, postgresql_where=sa.text("status = 'APPROVED'"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_approved_location_starts_at', table_name='events')
+    op.drop_index('ix_events_approved_type_starts_at', table_name='events')
+    op.drop_index('ix_events_approved_starts_at', table_name='events')
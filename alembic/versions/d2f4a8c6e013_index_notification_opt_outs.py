@@ -0,0 +1,41 @@
+"""index notification opt-outs instead of opt-ins
+
+Revision ID: d2f4a8c6e013
+Revises: b6e1f8d2c473
+Create Date: 2026-10-19 16:22:05.113842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f4a8c6e013'
+down_revision: Union[str, None] = 'b6e1f8d2c473'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Bit values of app.models.user_model.NotificationPreference
+PREFERENCE_BITS = {
+    'event_updates_email': 1,
+    'event_updates_dashboard': 2,
+    'event_approval_email': 4,
+    'pro_status_email': 8,
+}
+
+
+def upgrade() -> None:
+    # Users default to every bit set, so the opt-in indexes covered nearly the whole table
+    for name, bit in PREFERENCE_BITS.items():
+        op.drop_index(f'ix_users_opted_in_{name}', table_name='users')
+        op.create_index(f'ix_users_opted_out_{name}', 'users', ['id'], unique=False,
+                        postgresql_where=sa.text(f'(notification_preferences & {bit}) = 0'))
+
+
+def downgrade() -> None:
+    for name, bit in PREFERENCE_BITS.items():
+        op.drop_index(f'ix_users_opted_out_{name}', table_name='users')
+        op.create_index(f'ix_users_opted_in_{name}', 'users', ['id'], unique=False,
+                        postgresql_where=sa.text(f'(notification_preferences & {bit}) <> 0'))
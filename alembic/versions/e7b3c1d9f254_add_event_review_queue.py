@@ -0,0 +1,41 @@
+"""add event review queue
+
+Revision ID: e7b3c1d9f254
+Revises: d2f4a8c6e013
+Create Date: 2026-10-19 17:05:48.390215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c1d9f254'
+down_revision: Union[str, None] = 'd2f4a8c6e013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('claimed_by', sa.UUID(), nullable=True))
+    op.add_column('events', sa.Column('claimed_until', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('events', sa.Column('reviewed_by', sa.UUID(), nullable=True))
+    op.add_column('events', sa.Column('reviewed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('events', sa.Column('review_feedback', sa.String(length=1000), nullable=True))
+    op.create_foreign_key('events_claimed_by_fkey', 'events', 'users', ['claimed_by'], ['id'], ondelete='SET NULL')
+    op.create_foreign_key('events_reviewed_by_fkey', 'events', 'users', ['reviewed_by'], ['id'], ondelete='SET NULL')
+    op.create_index('ix_events_pending_created_at', 'events', ['created_at', 'id'], unique=False,
+                    postgresql_where=sa.text("status = 'PENDING'"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_pending_created_at', table_name='events')
+    op.drop_constraint('events_reviewed_by_fkey', 'events', type_='foreignkey')
+    op.drop_constraint('events_claimed_by_fkey', 'events', type_='foreignkey')
+    op.drop_column('events', 'review_feedback')
+    op.drop_column('events', 'reviewed_at')
+    op.drop_column('events', 'reviewed_by')
+    op.drop_column('events', 'claimed_until')
+    op.drop_column('events', 'claimed_by')
@@ -0,0 +1,41 @@
+"""case-insensitive user emails
+
+Revision ID: f3a9d6b2c851
+Revises: a8c4e2f6b710
+Create Date: 2026-10-19 11:30:12.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9d6b2c851'
+down_revision: Union[str, None] = 'a8c4e2f6b710'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    # Accounts that differ only in letter case cannot be merged automatically; stop before changing anything
+    duplicates = connection.execute(sa.text(
+        "SELECT lower(btrim(email)) FROM users GROUP BY 1 HAVING count(*) > 1 ORDER BY 1 LIMIT 20"
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Cannot make emails case-insensitive: these addresses belong to more than one account "
+            f"when letter case is ignored: {', '.join(duplicates)}. Merge or rename those accounts first."
+        )
+    op.execute("UPDATE users SET email = lower(btrim(email)) WHERE email <> lower(btrim(email))")
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    # Superseded: the functional index is the stricter constraint and serves the lookups
+    op.drop_index('ix_users_email', table_name='users')
+
+
+def downgrade() -> None:
+    # Emails stay lower-cased; they are still valid and unique as stored
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_index('ix_users_email_lower', table_name='users')
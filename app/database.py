@@ -1,5 +1,9 @@
+import asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base, sessionmaker
+from app.utils.metrics import metrics
+from app.utils.query_stats import instrument_engine
 
 Base = declarative_base()
 
@@ -13,6 +17,7 @@ class Database:
         """Initialize the async engine and sessionmaker."""
         if cls._engine is None:  # Ensure engine is created once
             cls._engine = create_async_engine(database_url, echo=echo, future=True)
+            instrument_engine(cls._engine)
             cls._session_factory = sessionmaker(
                 bind=cls._engine, class_=AsyncSession, expire_on_commit=False, future=True
             )
@@ -23,3 +28,38 @@ class Database:
         if cls._session_factory is None:
             raise ValueError("Database not initialized. Call `initialize()` first.")
         return cls._session_factory
+
+    @classmethod
+    async def warm_up(cls, connections: int) -> int:
+        """
+        Open up to ``connections`` pooled connections at once and leave them idle in the pool,
+        so the first requests do not each pay for a connect and authentication round trip.
+        Capped at the pool size: connections beyond it would be closed again on return.
+        """
+        engine = cls._engine
+        if engine is None:
+            raise ValueError("Database not initialized. Call `initialize()` first.")
+        count = min(connections, engine.pool.size())
+
+        async def open_one(_):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(open_one(index) for index in range(count)))
+        return count
+
+    @classmethod
+    def pool_status(cls):
+        """The connection pool's size and usage, or None before ``initialize()``; ``max_overflow`` is -1 when unbounded."""
+        if cls._engine is None:
+            return None
+        pool = cls._engine.pool
+        return {"size": pool.size(), "checked_out": pool.checkedout(), "overflow": pool.overflow(), "max_overflow": pool._max_overflow}
+
+def _pool_value(key: str):
+    status = Database.pool_status()
+    return status[key] if status else None
+
+metrics.gauge("db_pool_size", "Connections the pool keeps open", callback=lambda: _pool_value("size"))
+metrics.gauge("db_pool_checked_out", "Pooled connections currently in use", callback=lambda: _pool_value("checked_out"))
+metrics.gauge("db_pool_overflow", "Connections open beyond the pool size (negative while the pool is still filling)", callback=lambda: _pool_value("overflow"))
@@ -1,4 +1,5 @@
 from builtins import Exception, dict, str
+from functools import lru_cache
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,7 +14,9 @@ def get_settings() -> Settings:
     """Return application settings."""
     return Settings()
 
+@lru_cache
 def get_email_service() -> EmailService:
+    """Return the process-wide EmailService so its SMTP connection pool is shared across requests."""
     template_manager = TemplateManager()
     return EmailService(template_manager=template_manager)
 
@@ -1,10 +1,48 @@
 from builtins import Exception
+import time
+_import_started = time.perf_counter()
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette.responses import JSONResponse
 from app.database import Database
-from app.dependencies import get_settings
-from app.routers import user_routes
+from app.dependencies import get_email_service, get_settings
+from app.routers import audit_routes, event_routes, health_routes, metrics_routes, notification_routes, user_routes
+from app.services.audit_service import audit_log
+from app.services.notification_broker import notification_broker
+from app.services.outbox_service import OutboxWorker
 from app.utils.api_description import getDescription
+from app.utils.common import RequestIdMiddleware, setup_logging, stop_logging
+from app.utils.metrics import MetricsMiddleware
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.query_stats import QueryStatsMiddleware
+from app.utils.tracing import TracingMiddleware, configure_tracer, tracer
+from app.utils.warmup import record_startup, warm_up
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    settings = get_settings()
+    setup_logging()
+    configure_tracer()
+    Database.initialize(settings.database_url, settings.debug)
+    audit_log.start()
+    if settings.notification_stream_enabled:
+        notification_broker.start(settings.database_url)
+    if settings.outbox_worker_enabled:
+        app.state.outbox_worker = OutboxWorker(Database.get_session_factory(), get_email_service())
+        app.state.outbox_worker.start()
+    warmup_timings = await warm_up(app) if settings.startup_warmup_enabled else {}
+    record_startup(app.state.import_seconds, time.perf_counter() - started, warmup_timings)
+    yield
+    outbox_worker = getattr(app.state, "outbox_worker", None)
+    if outbox_worker is not None:
+        await outbox_worker.stop()
+    await notification_broker.stop()
+    await audit_log.stop()
+    await get_email_service().close()
+    tracer.exporter.close()
+    stop_logging()
+
 app = FastAPI(
     title="User Management",
     description=getDescription(),
@@ -15,17 +53,26 @@ app = FastAPI(
         "email": "support@example.com",
     },
     license_info={"name": "MIT", "url": "https://opensource.org/licenses/MIT"},
+    lifespan=lifespan,
 )
 
-@app.on_event("startup")
-async def startup_event():
-    settings = get_settings()
-    Database.initialize(settings.database_url, settings.debug)
-
 @app.exception_handler(Exception)
 async def exception_handler(request, exc):
     return JSONResponse(status_code=500, content={"message": "An unexpected error occurred."})
 
 app.include_router(user_routes.router)
+app.include_router(event_routes.router)
+app.include_router(audit_routes.router)
+app.include_router(notification_routes.router)
+app.include_router(metrics_routes.router)
+app.include_router(health_routes.router)
 
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+if get_settings().metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
+# Time from the first line of this module to a fully assembled app, reported at startup
+app.state.import_seconds = time.perf_counter() - _import_started
@@ -0,0 +1,60 @@
+from builtins import str
+from datetime import datetime
+from enum import Enum
+import uuid
+from sqlalchemy import Column, String, DateTime, DDL, Index, event, Enum as SQLAlchemyEnum
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class AuditAction(Enum):
+    """Account changes recorded in the audit trail, stored as ENUM in the database."""
+    ROLE_CHANGED = "ROLE_CHANGED"
+    ACCOUNT_LOCKED = "ACCOUNT_LOCKED"
+    ACCOUNT_UNLOCKED = "ACCOUNT_UNLOCKED"
+    USER_DELETED = "USER_DELETED"
+    PROFESSIONAL_STATUS_CHANGED = "PROFESSIONAL_STATUS_CHANGED"
+
+class AuditLogEntry(Base):
+    """
+    One audited change to a user account, corresponding to the 'audit_log' table.
+
+    The table is range partitioned by month on ``created_at`` (the time of the change,
+    not of the write) so old months can be detached or dropped without touching the
+    rest, and a trigger rejects updates and deletes so entries cannot be rewritten.
+    ``user_id`` deliberately has no foreign key: entries must outlive deleted users.
+    """
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_created_at", "created_at", "id"),
+        Index("ix_audit_log_user_created_at", "user_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = Column(DateTime(timezone=True), primary_key=True)
+    action: Mapped[AuditAction] = Column(SQLAlchemyEnum(AuditAction, name='AuditAction'), nullable=False)
+    user_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), nullable=False)
+    actor: Mapped[str] = Column(String(255), nullable=True)
+    details: Mapped[dict] = Column(JSONB, nullable=False, default=dict)
+
+    def __repr__(self) -> str:
+        """Provides a readable representation of an audit entry."""
+        return f"<AuditLogEntry {self.action.name} user={self.user_id} by={self.actor}>"
+
+# The default partition and append-only trigger, also created by the b6e1f8d2c473 migration
+AUDIT_LOG_DEFAULT_PARTITION = "CREATE TABLE IF NOT EXISTS audit_log_default PARTITION OF audit_log DEFAULT"
+AUDIT_LOG_APPEND_ONLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION audit_log_append_only() RETURNS trigger AS $$
+BEGIN
+    RAISE EXCEPTION 'audit_log is append-only';
+END;
+$$ LANGUAGE plpgsql
+"""
+AUDIT_LOG_APPEND_ONLY_TRIGGER = (
+    "CREATE TRIGGER audit_log_append_only BEFORE UPDATE OR DELETE ON audit_log "
+    "FOR EACH ROW EXECUTE FUNCTION audit_log_append_only()"
+)
+
+for _statement in (AUDIT_LOG_DEFAULT_PARTITION, AUDIT_LOG_APPEND_ONLY_FUNCTION, AUDIT_LOG_APPEND_ONLY_TRIGGER):
+    event.listen(AuditLogEntry.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
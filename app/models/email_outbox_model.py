@@ -0,0 +1,47 @@
+from builtins import int, str
+from datetime import datetime
+from enum import Enum
+import uuid
+from sqlalchemy import (
+    Column, String, Integer, DateTime, Index, func, text, Enum as SQLAlchemyEnum
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class OutboxStatus(Enum):
+    """Delivery state of a queued email, stored as ENUM in the database."""
+    PENDING = "PENDING"
+    SENT = "SENT"
+    FAILED = "FAILED"
+
+class EmailOutbox(Base):
+    """
+    An email waiting to be delivered, corresponding to the 'email_outbox' table.
+
+    Rows are written in the same transaction as the change that triggers the email and
+    delivered later by the outbox worker. ``available_at`` is when the row may next be
+    claimed: it is pushed forward while a worker holds the row and on retry backoff.
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index(
+            "ix_email_outbox_pending_available_at", "available_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    email_type: Mapped[str] = Column(String(50), nullable=False)
+    recipient: Mapped[str] = Column(String(255), nullable=False)
+    context: Mapped[dict] = Column(JSONB, nullable=False, default=dict)
+    status: Mapped[OutboxStatus] = Column(SQLAlchemyEnum(OutboxStatus, name='OutboxStatus'), default=OutboxStatus.PENDING, nullable=False)
+    attempts: Mapped[int] = Column(Integer, default=0, nullable=False)
+    last_error: Mapped[str] = Column(String(500), nullable=True)
+    available_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        """Provides a readable representation of an outbox entry."""
+        return f"<EmailOutbox {self.email_type} to {self.recipient}, Status: {self.status.name}>"
@@ -0,0 +1,97 @@
+from builtins import int, str
+from datetime import datetime
+from enum import Enum
+import uuid
+from sqlalchemy import (
+    Column, String, Integer, DateTime, ForeignKey, CheckConstraint, Index, UniqueConstraint, func, text, Enum as SQLAlchemyEnum
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class EventType(Enum):
+    """Kinds of events offered on the platform, stored as ENUM in the database."""
+    COMPANY_TOUR = "COMPANY_TOUR"
+    MOCK_INTERVIEW = "MOCK_INTERVIEW"
+    GUEST_LECTURE = "GUEST_LECTURE"
+    WORKSHOP = "WORKSHOP"
+    NETWORKING = "NETWORKING"
+    OTHER = "OTHER"
+
+class EventStatus(Enum):
+    """Review state of an event; only approved events are visible to users."""
+    PENDING = "PENDING"
+    APPROVED = "APPROVED"
+    REJECTED = "REJECTED"
+
+class Event(Base):
+    """
+    Represents an event users can register for, corresponding to the 'events' table.
+
+    ``registered_count`` is maintained by EventService as an atomic counter so capacity
+    checks never need to count registrations, and the check constraint guarantees the
+    event can never be overbooked even if a caller bypasses the service.
+
+    New events wait in the managers' review queue as PENDING. ``claimed_by`` and
+    ``claimed_until`` record which manager is reviewing an event and for how long the
+    claim holds; ``reviewed_*`` and ``review_feedback`` record the decision.
+    """
+    __tablename__ = "events"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        CheckConstraint("capacity > 0", name="ck_events_capacity_positive"),
+        CheckConstraint("registered_count >= 0 AND registered_count <= capacity", name="ck_events_registered_within_capacity"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    title: Mapped[str] = Column(String(200), nullable=False)
+    description: Mapped[str] = Column(String(2000), nullable=True)
+    event_type: Mapped[EventType] = Column(SQLAlchemyEnum(EventType, name='EventType'), default=EventType.OTHER, nullable=False)
+    location: Mapped[str] = Column(String(255), nullable=True)
+    starts_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=False)
+    ends_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
+    capacity: Mapped[int] = Column(Integer, nullable=False)
+    registered_count: Mapped[int] = Column(Integer, default=0, nullable=False)
+    status: Mapped[EventStatus] = Column(SQLAlchemyEnum(EventStatus, name='EventStatus'), default=EventStatus.PENDING, nullable=False)
+    created_by: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    claimed_by: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    claimed_until: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
+    reviewed_by: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    reviewed_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
+    review_feedback: Mapped[str] = Column(String(1000), nullable=True)
+    created_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        """Provides a readable representation of an event object."""
+        return f"<Event {self.title}, Status: {self.status.name}>"
+
+    @property
+    def seats_left(self) -> int:
+        return self.capacity - self.registered_count
+
+# Partial indexes for the public "upcoming approved events" listing. Each ends in
+# (starts_at, id) so keyset pagination over any filter is a single index range scan,
+# and only approved rows are indexed so pending or rejected events cost nothing.
+_approved_only = text("status = 'APPROVED'")
+Index("ix_events_approved_starts_at", Event.starts_at, Event.id, postgresql_where=_approved_only)
+Index("ix_events_approved_type_starts_at", Event.event_type, Event.starts_at, Event.id, postgresql_where=_approved_only)
+Index("ix_events_approved_location_starts_at", func.lower(Event.location), Event.starts_at, Event.id, postgresql_where=_approved_only)
+# The review queue, oldest first; decided events leave the index
+Index("ix_events_pending_created_at", Event.created_at, Event.id, postgresql_where=text("status = 'PENDING'"))
+
+class EventRegistration(Base):
+    """A user's seat at an event, corresponding to the 'event_registrations' table."""
+    __tablename__ = "event_registrations"
+    __table_args__ = (
+        UniqueConstraint("event_id", "user_id", name="uq_event_registrations_event_user"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    event_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        """Provides a readable representation of a registration."""
+        return f"<EventRegistration event={self.event_id} user={self.user_id}>"
@@ -0,0 +1,38 @@
+from builtins import str
+from datetime import datetime
+from enum import Enum
+import uuid
+from sqlalchemy import (
+    Column, String, DateTime, ForeignKey, Index, func, text, Enum as SQLAlchemyEnum
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+
+class NotificationKind(Enum):
+    """What a dashboard notification is about, stored as ENUM in the database."""
+    EVENT_UPDATE = "EVENT_UPDATE"
+    SYSTEM = "SYSTEM"
+
+class Notification(Base):
+    """A message shown on a user's dashboard, corresponding to the 'notifications' table."""
+    __tablename__ = "notifications"
+    __table_args__ = (
+        # Serves the per-user feed newest first with keyset pagination
+        Index("ix_notifications_user_created_at", "user_id", "created_at", "id"),
+        # Only unread rows, so the unread-only feed stays small however much history a user has
+        Index("ix_notifications_user_unread_created_at", "user_id", "created_at", "id", postgresql_where=text("read_at IS NULL")),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    kind: Mapped[NotificationKind] = Column(SQLAlchemyEnum(NotificationKind, name='NotificationKind'), nullable=False)
+    title: Mapped[str] = Column(String(200), nullable=False)
+    body: Mapped[str] = Column(String(2000), nullable=True)
+    event_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="SET NULL"), nullable=True)
+    created_at: Mapped[datetime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    read_at: Mapped[datetime] = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        """Provides a readable representation of a notification."""
+        return f"<Notification {self.kind.name} for {self.user_id}>"
@@ -1,12 +1,12 @@
-from builtins import bool, int, str
+from builtins import bool, classmethod, dict, int, str
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntFlag
 import uuid
 from sqlalchemy import (
-    Column, String, Integer, DateTime, Boolean, func, Enum as SQLAlchemyEnum
+    Column, String, Integer, DateTime, Boolean, Index, and_, func, not_, or_, literal_column, text, Enum as SQLAlchemyEnum
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 from app.database import Base
 
 class UserRole(Enum):
@@ -16,6 +16,26 @@ class UserRole(Enum):
     MANAGER = "MANAGER"
     ADMIN = "ADMIN"
 
+class NotificationPreference(IntFlag):
+    """Notification opt-ins, stored together as bits of ``User.notification_preferences``."""
+    EVENT_UPDATES_EMAIL = 1
+    EVENT_UPDATES_DASHBOARD = 2
+    EVENT_APPROVAL_EMAIL = 4
+    PRO_STATUS_EMAIL = 8
+
+ALL_NOTIFICATION_PREFERENCES = (
+    NotificationPreference.EVENT_UPDATES_EMAIL | NotificationPreference.EVENT_UPDATES_DASHBOARD
+    | NotificationPreference.EVENT_APPROVAL_EMAIL | NotificationPreference.PRO_STATUS_EMAIL
+)
+
+def normalize_email(email: str) -> str:
+    """The stored form of an email address: trimmed and lower-cased, as ``lower(email)`` sees it in SQL."""
+    return email.strip().lower()
+
+def notification_preferences_as_dict(mask: int) -> dict:
+    """Expands a preference bitmask into named booleans, e.g. ``{"event_updates_email": True, ...}``."""
+    return {preference.name.lower(): bool(mask & preference) for preference in NotificationPreference}
+
 class User(Base):
     """
     Represents a user within the application, corresponding to the 'users' table in the database.
@@ -25,7 +45,8 @@ class User(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     nickname: Mapped[str] = Column(String(50), unique=True, nullable=False, index=True)
-    email: Mapped[str] = Column(String(255), unique=True, nullable=False, index=True)
+    # Unique case-insensitively through ix_users_email_lower below; stored normalized
+    email: Mapped[str] = Column(String(255), nullable=False)
     first_name: Mapped[str] = Column(String(100), nullable=True)
     last_name: Mapped[str] = Column(String(100), nullable=True)
     bio: Mapped[str] = Column(String(500), nullable=True)
@@ -43,11 +64,18 @@ class User(Base):
     verification_token = Column(String, nullable=True)
     email_verified: Mapped[bool] = Column(Boolean, default=False, nullable=False)
     hashed_password: Mapped[str] = Column(String(255), nullable=False)
+    notification_preferences: Mapped[int] = Column(Integer, default=int(ALL_NOTIFICATION_PREFERENCES), server_default=text(str(int(ALL_NOTIFICATION_PREFERENCES))), nullable=False)
+    # Kept in step with notifications.read_at by NotificationService so the dashboard badge is a column read
+    unread_notification_count: Mapped[int] = Column(Integer, default=0, server_default=text("0"), nullable=False)
 
     def __repr__(self) -> str:
         """Provides a readable representation of a user object."""
         return f"<User {self.nickname}, Role: {self.role.name}>"
 
+    @validates("email")
+    def _normalize_email(self, key: str, email: str) -> str:
+        return normalize_email(email) if email is not None else email
+
     def lock_account(self):
         """Locks the user account."""
         self.is_locked = True
@@ -68,3 +96,72 @@ class User(Base):
         """Updates the professional status and logs the update time."""
         self.is_professional = status
         self.professional_status_updated_at = func.now()
+
+    def wants_notification(self, preference: NotificationPreference) -> bool:
+        """Checks if the user has opted in to a kind of notification."""
+        return bool(self.notification_preferences & preference)
+
+    @classmethod
+    def email_matches(cls, email: str):
+        """SQL predicate for the account with ``email`` in any letter case; a probe of ``ix_users_email_lower``."""
+        return func.lower(cls.email) == normalize_email(email)
+
+    @classmethod
+    def _preference_bits(cls, preference: NotificationPreference):
+        # Literal operands (not bound parameters) let the planner match the partial indexes below
+        return cls.notification_preferences.op("&")(literal_column(str(int(preference))))
+
+    @classmethod
+    def opted_in(cls, preference: NotificationPreference):
+        """
+        SQL predicate for users opted in to ``preference`` (to any of them, for combined flags).
+
+        Everyone starts opted in, so this matches most users and is meant as a cheap filter
+        on rows already found another way (e.g. an event's registrants), not as an index probe.
+        """
+        return cls._preference_bits(preference) != literal_column("0")
+
+    @classmethod
+    def opted_out(cls, preference: NotificationPreference):
+        """SQL predicate for users who switched ``preference`` off; served by ``ix_users_opted_out_*``."""
+        return cls._preference_bits(preference) == literal_column("0")
+
+    @classmethod
+    def locked(cls):
+        """SQL predicate for locked accounts; served by ``ix_users_locked_updated_at``."""
+        return cls.is_locked
+
+    @classmethod
+    def unverified(cls):
+        """SQL predicate for accounts that never confirmed their email; served by ``ix_users_unverified_created_at``."""
+        return not_(cls.email_verified)
+
+    @classmethod
+    def pro_candidate(cls):
+        """
+        SQL predicate for users a manager could upgrade to professional: verified, active,
+        not professional yet and with a LinkedIn or GitHub profile to review. Served by
+        ``ix_users_pro_candidates_created_at``.
+        """
+        return and_(
+            cls.email_verified, not_(cls.is_locked), not_(cls.is_professional),
+            or_(cls.linkedin_profile_url.isnot(None), cls.github_profile_url.isnot(None)),
+        )
+
+# Emails are compared case-insensitively: this one index enforces uniqueness and serves
+# every lookup by email, through User.email_matches
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
+
+# Opt-outs are the selective side, so only they are indexed: one small partial index per
+# preference finds everyone who turned it off without scanning users.
+for _preference in NotificationPreference:
+    Index(
+        f"ix_users_opted_out_{_preference.name.lower()}", User.id,
+        postgresql_where=text(f"(notification_preferences & {int(_preference)}) = 0"),
+    )
+
+# The admin triage lists are small slices of the table; each has a partial index in its
+# page order, so a page is a short range scan however many users there are.
+Index("ix_users_locked_updated_at", User.updated_at, User.id, postgresql_where=User.locked())
+Index("ix_users_unverified_created_at", User.created_at, User.id, postgresql_where=User.unverified())
+Index("ix_users_pro_candidates_created_at", User.created_at, User.id, postgresql_where=User.pro_candidate())
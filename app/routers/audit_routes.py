@@ -0,0 +1,64 @@
+"""
+Admin access to the audit trail of account changes (User Story 1.2): role changes, locks,
+unlocks, deletions and professional status upgrades made through UserService.
+
+Entries are buffered in memory and written in batches, so the endpoint flushes this
+process's buffer before reading; entries buffered by other workers show up within their
+flush interval.
+"""
+
+from builtins import dict, len, str
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies import get_db, require_role
+from app.models.audit_log_model import AuditAction as AuditActionModel
+from app.schemas.audit_schemas import AuditAction, AuditLogEntryResponse, AuditLogListResponse
+from app.schemas.pagination_schema import PaginationLink
+from app.services.audit_service import AuditLogService, audit_log
+from app.utils.cursor_pagination import decode_cursor
+
+router = APIRouter()
+
+def _parse_audit_cursor(cursor: Optional[str]):
+    try:
+        values = decode_cursor(cursor)
+        return (datetime.fromisoformat(values[0]), UUID(values[1])) if values else None
+    except (ValueError, IndexError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+@router.get("/admin/audit-log", response_model=AuditLogListResponse, name="list_audit_log", tags=["Audit Trail Requires (Admin Role)"])
+async def list_audit_log(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    user_id: Optional[UUID] = None,
+    action: Optional[AuditAction] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(require_role(["ADMIN"])),
+):
+    """
+    List audit entries, newest first.
+
+    - **user_id**, **action**: only entries about this user / of this kind.
+    - **since** / **until**: restrict to a time range; narrow ranges only read the partitions they cover.
+    - **cursor**: the `next_cursor` of the previous page.
+    """
+    await audit_log.flush()
+    entries, next_cursor = await AuditLogService.list_entries(
+        db, limit=limit, after=_parse_audit_cursor(cursor), user_id=user_id,
+        action=AuditActionModel[action.value] if action else None, since=since, until=until,
+    )
+    links = [PaginationLink(rel="self", href=str(request.url))]
+    if next_cursor:
+        links.append(PaginationLink(rel="next", href=str(request.url.include_query_params(cursor=next_cursor))))
+    return AuditLogListResponse(
+        items=[AuditLogEntryResponse.model_validate(entry) for entry in entries],
+        size=len(entries),
+        next_cursor=next_cursor,
+        links=links,
+    )
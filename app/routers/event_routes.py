@@ -0,0 +1,193 @@
+"""
+Event endpoints: the public listing users browse to find events (User Story 2.2), event
+creation and updates for managers (User Story 2.1), the managers' review queue for new
+events (User Story 3.1), and the registrant notifications sent when an event changes (Epic 3).
+
+The first page of the default listing (no filters, no cursor) is the landing page's data
+source and the busiest read in the API, so it is served from an in-process cache of
+serialized responses, one per page size. Listing links are built from the configured
+``server_base_url`` and the recognised query parameters only, so a cached body never
+carries another caller's host or stray parameters. The cache is cleared by EventService whenever an event is created,
+changed, approved or deleted, and a short TTL lets events that have started drop off
+without any write.
+"""
+
+from builtins import dict, int, len, str
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from starlette.datastructures import URL
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import Database
+from app.dependencies import get_db, require_role
+from app.models.event_model import EventStatus
+from app.schemas.event_schemas import (
+    EventApproval, EventCreate, EventListResponse, EventRejection, EventResponse, EventType, EventUpdate,
+    PendingEventListResponse, PendingEventResponse,
+)
+from app.schemas.pagination_schema import PaginationLink
+from app.services.event_service import EventService, EventUpdateConflict, upcoming_events_cache
+from app.services.notification_service import NotificationService
+from app.services.user_service import UserService
+from app.utils.cursor_pagination import decode_cursor
+from settings.config import settings
+
+router = APIRouter()
+
+def _parse_event_cursor(cursor: Optional[str]):
+    try:
+        values = decode_cursor(cursor)
+        return (datetime.fromisoformat(values[0]), UUID(values[1])) if values else None
+    except (ValueError, IndexError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+@router.get("/events", response_model=EventListResponse, name="list_events", tags=["Events"])
+async def list_events(
+    request: Request,
+    limit: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = None,
+    starts_after: Optional[datetime] = None,
+    starts_before: Optional[datetime] = None,
+    event_type: Optional[EventType] = None,
+    location: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List upcoming approved events, soonest first.
+
+    - **starts_after** / **starts_before**: restrict to a date range.
+    - **event_type**, **location**: exact filters (location is case-insensitive).
+    - **cursor**: the `next_cursor` of the previous page.
+    """
+    cacheable = cursor is None and starts_after is None and starts_before is None and event_type is None and not location
+    cache_key = limit
+    if cacheable:
+        cached = upcoming_events_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        generation = upcoming_events_cache.generation
+
+    events, next_cursor = await EventService.list_upcoming(
+        db, limit=limit, after=_parse_event_cursor(cursor), starts_after=starts_after,
+        starts_before=starts_before, event_type=event_type, location=location,
+    )
+    params = {"limit": limit}
+    for name, value in (("starts_after", starts_after), ("starts_before", starts_before), ("location", location)):
+        if value:
+            params[name] = value.isoformat() if isinstance(value, datetime) else value
+    if event_type is not None:
+        params["event_type"] = event_type.value
+    listing_url = URL(str(settings.server_base_url).rstrip("/") + request.app.url_path_for("list_events")).include_query_params(**params)
+    links = [PaginationLink(rel="self", href=str(listing_url.include_query_params(cursor=cursor) if cursor else listing_url))]
+    if next_cursor:
+        links.append(PaginationLink(rel="next", href=str(listing_url.include_query_params(cursor=next_cursor))))
+    body = EventListResponse(
+        items=[EventResponse.model_validate(event) for event in events],
+        size=len(events),
+        next_cursor=next_cursor,
+        links=links,
+    ).model_dump_json()
+    if cacheable:
+        upcoming_events_cache.set(cache_key, body, generation)
+    return Response(content=body, media_type="application/json")
+
+@router.get("/events/review-queue", response_model=PendingEventListResponse, name="list_review_queue", tags=["Event Review Requires (Admin or Manager Roles)"])
+async def list_review_queue(request: Request, limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None,
+                            db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """List events waiting for review, oldest first, with who has claimed each one."""
+    events, next_cursor = await EventService.list_pending(db, limit=limit, after=_parse_event_cursor(cursor))
+    queue_url = URL(str(settings.server_base_url).rstrip("/") + request.app.url_path_for("list_review_queue")).include_query_params(limit=limit)
+    links = [PaginationLink(rel="self", href=str(queue_url.include_query_params(cursor=cursor) if cursor else queue_url))]
+    if next_cursor:
+        links.append(PaginationLink(rel="next", href=str(queue_url.include_query_params(cursor=next_cursor))))
+    return PendingEventListResponse(
+        items=[PendingEventResponse.model_validate(event) for event in events],
+        size=len(events),
+        next_cursor=next_cursor,
+        links=links,
+    )
+
+async def _reviewer_id(db: AsyncSession, current_user: dict) -> Optional[UUID]:
+    reviewer = await UserService.get_by_email(db, current_user["user_id"])
+    return reviewer.id if reviewer else None
+
+@router.post("/events/review-queue/claim", response_model=List[PendingEventResponse], name="claim_review_items", tags=["Event Review Requires (Admin or Manager Roles)"])
+async def claim_review_items(limit: int = Query(1, ge=1, le=20), db: AsyncSession = Depends(get_db),
+                             current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """
+    Claim the oldest unclaimed pending events for review. Other managers skip claimed
+    events until the claim expires; an empty list means the queue has nothing unclaimed.
+    """
+    reviewer_id = await _reviewer_id(db, current_user)
+    if reviewer_id is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Reviewer account not found")
+    events = await EventService.claim_for_review(db, reviewer_id, limit=limit)
+    return [PendingEventResponse.model_validate(event) for event in events]
+
+async def _review_conflict_or_missing(db: AsyncSession, event_id: UUID):
+    if await EventService.get_by_id(db, event_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Event is not pending or is claimed by another reviewer")
+
+@router.post("/events/{event_id}/approve", response_model=EventResponse, name="approve_event", tags=["Event Review Requires (Admin or Manager Roles)"])
+async def approve_event(event_id: UUID, decision: Optional[EventApproval] = None, db: AsyncSession = Depends(get_db),
+                        current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """Approve a pending event, publishing it in the listing."""
+    reviewer_id = await _reviewer_id(db, current_user)
+    event = await EventService.approve(db, event_id, reviewer_id, decision.feedback if decision else None)
+    if not event:
+        await _review_conflict_or_missing(db, event_id)
+    return EventResponse.model_validate(event)
+
+@router.post("/events/{event_id}/reject", response_model=EventResponse, name="reject_event", tags=["Event Review Requires (Admin or Manager Roles)"])
+async def reject_event(event_id: UUID, decision: EventRejection, db: AsyncSession = Depends(get_db),
+                       current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """Reject a pending event with feedback for its creator."""
+    reviewer_id = await _reviewer_id(db, current_user)
+    event = await EventService.reject(db, event_id, reviewer_id, decision.feedback)
+    if not event:
+        await _review_conflict_or_missing(db, event_id)
+    return EventResponse.model_validate(event)
+
+@router.get("/events/{event_id}", response_model=EventResponse, name="get_event", tags=["Events"])
+async def get_event(event_id: UUID, db: AsyncSession = Depends(get_db)):
+    """Fetch the details of an approved event."""
+    event = await EventService.get_by_id(db, event_id)
+    if not event or event.status != EventStatus.APPROVED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    return EventResponse.model_validate(event)
+
+@router.post("/events", response_model=EventResponse, status_code=status.HTTP_201_CREATED, name="create_event", tags=["Events"])
+async def create_event(event: EventCreate, db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """Create an event; it stays pending and hidden from the listing until it is approved."""
+    creator = await UserService.get_by_email(db, current_user["user_id"])
+    created_event = await EventService.create(db, event.model_dump(), created_by=creator.id if creator else None)
+    if not created_event:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid event data")
+    return EventResponse.model_validate(created_event)
+
+async def notify_registrants(event_id: UUID, message: str):
+    """Background task: fan an event update out to its registrants on a session of its own."""
+    async with Database.get_session_factory()() as session:
+        event = await EventService.get_by_id(session, event_id)
+        if event:
+            await NotificationService.fan_out_event_update(session, event, message)
+
+@router.put("/events/{event_id}", response_model=EventResponse, name="update_event", tags=["Events"])
+async def update_event(event_id: UUID, event_update: EventUpdate, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """
+    Update an event. Registrants of an approved event are notified of the change on their
+    dashboard and by email; the fan-out runs after the response is sent.
+    """
+    changes = event_update.model_dump(exclude_unset=True)
+    try:
+        updated_event = await EventService.update(db, event_id, changes)
+    except EventUpdateConflict as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if not updated_event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    if updated_event.status == EventStatus.APPROVED and updated_event.registered_count > 0:
+        changed = ", ".join(field.replace("_", " ") for field in changes)
+        background_tasks.add_task(notify_registrants, updated_event.id, f"The following details changed: {changed}.")
+    return EventResponse.model_validate(updated_event)
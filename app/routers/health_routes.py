@@ -0,0 +1,32 @@
+"""
+Probe endpoints for the orchestrator and load balancers.
+
+``/healthz`` answers as long as the event loop does, without any I/O, so a busy database
+never gets a healthy process restarted. ``/readyz`` says whether this instance should
+receive traffic: the database must answer (checked at most once per
+``readiness_cache_seconds``) and the connection pool must not be exhausted, so a load
+balancer sheds traffic from a saturated instance before its latency collapses. The
+outbox backlog is reported alongside but does not affect readiness, since taking web
+traffic away does not help emails go out faster.
+"""
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from app.services.health_service import readiness
+
+router = APIRouter()
+
+@router.get("/healthz", name="healthz", tags=["Health"])
+async def healthz():
+    """Liveness: the process is up and serving requests."""
+    return {"status": "ok"}
+
+@router.get("/readyz", name="readyz", tags=["Health"],
+            responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"description": "Not ready; the failing check is in the body"}})
+async def readyz():
+    """Readiness: database reachable and connection pool not exhausted."""
+    ready, checks = await readiness.check()
+    return JSONResponse(
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "ready" if ready else "not_ready", "checks": checks},
+    )
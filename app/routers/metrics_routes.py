@@ -0,0 +1,31 @@
+"""
+Prometheus scrape endpoint.
+
+Request timings, status counts and response sizes are recorded by MetricsMiddleware;
+cache, audit buffer, live stream and connection pool figures are read when scraped.
+Each worker process reports only its own values, so scrape every worker and sum.
+"""
+
+from builtins import Exception
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies import get_db
+from app.services.outbox_service import OutboxService, email_outbox_pending
+from app.utils.metrics import metrics
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.get("/metrics", response_class=PlainTextResponse, name="metrics", include_in_schema=False)
+async def prometheus_metrics(db: AsyncSession = Depends(get_db)):
+    if not settings.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    try:
+        email_outbox_pending.set(await OutboxService.pending_count(db))
+    except Exception as e:
+        # The rest of the metrics are still worth serving while the database is down
+        logger.warning("Could not read the outbox backlog for metrics: %s", e)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,133 @@
+"""
+The signed-in user's dashboard notifications (User Story 3.2).
+
+The unread count shown on the dashboard badge is a counter on the user's row that
+NotificationService keeps in step as notifications are created and marked read, so
+neither endpoint runs a ``count(*)`` over the user's notifications.
+
+``/me/notifications/stream`` pushes new notifications as server-sent events. An open
+stream holds no database connection, only a small mailbox in the notification broker,
+so a worker can keep thousands of idle dashboards connected.
+"""
+
+from builtins import dict, len, str
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import URL
+from app.dependencies import get_current_user, get_db
+from app.schemas.notification_schemas import NotificationListResponse, NotificationMarkRead, NotificationResponse, UnreadNotificationCount
+from app.schemas.pagination_schema import PaginationLink
+from app.services.notification_broker import Subscription, notification_broker
+from app.services.notification_service import NotificationService
+from app.services.user_service import UserService
+from app.utils.cursor_pagination import decode_cursor
+from settings.config import settings
+
+router = APIRouter()
+
+def _parse_notification_cursor(cursor: Optional[str]):
+    try:
+        values = decode_cursor(cursor)
+        return (datetime.fromisoformat(values[0]), UUID(values[1])) if values else None
+    except (ValueError, IndexError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+async def _current_user_row(db: AsyncSession, current_user: dict):
+    user = await UserService.get_by_email(db, current_user["user_id"])
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return user
+
+@router.get("/me/notifications", response_model=NotificationListResponse, name="list_notifications", tags=["Notifications"])
+async def list_notifications(
+    request: Request,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    unread_only: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    List the signed-in user's notifications, newest first, with their unread count.
+
+    - **unread_only**: leave out notifications already read.
+    - **cursor**: the `next_cursor` of the previous page.
+    """
+    user = await _current_user_row(db, current_user)
+    notifications, next_cursor = await NotificationService.list_for_user(
+        db, user.id, limit=limit, after=_parse_notification_cursor(cursor), unread_only=unread_only,
+    )
+    params = {"limit": limit, "unread_only": "true"} if unread_only else {"limit": limit}
+    feed_url = URL(str(settings.server_base_url).rstrip("/") + request.app.url_path_for("list_notifications")).include_query_params(**params)
+    links = [PaginationLink(rel="self", href=str(feed_url.include_query_params(cursor=cursor) if cursor else feed_url))]
+    if next_cursor:
+        links.append(PaginationLink(rel="next", href=str(feed_url.include_query_params(cursor=next_cursor))))
+    return NotificationListResponse(
+        items=[NotificationResponse.model_validate(notification) for notification in notifications],
+        size=len(notifications),
+        unread_count=user.unread_notification_count,
+        next_cursor=next_cursor,
+        links=links,
+    )
+
+@router.get("/me/notifications/unread-count", response_model=UnreadNotificationCount, name="unread_notification_count", tags=["Notifications"])
+async def unread_notification_count(db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    """The signed-in user's unread notification count, for polling the dashboard badge."""
+    user = await _current_user_row(db, current_user)
+    return UnreadNotificationCount(unread_count=user.unread_notification_count)
+
+@router.post("/me/notifications/read", response_model=UnreadNotificationCount, name="mark_notifications_read", tags=["Notifications"])
+async def mark_notifications_read(marked: NotificationMarkRead, db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    """
+    Mark up to 500 notifications as read in one call. Ids that are already read or
+    belong to someone else are ignored. Returns the new unread count.
+    """
+    user = await _current_user_row(db, current_user)
+    unread_count = await NotificationService.mark_read(db, user.id, marked.ids)
+    if unread_count is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return UnreadNotificationCount(unread_count=unread_count)
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def _stream_events(subscription: Subscription, unread_count: int, heartbeat: float):
+    # Starlette cancels this generator when the client disconnects, which releases the subscription
+    try:
+        yield _sse("unread", {"unread_count": unread_count})
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            if message is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield _sse(message.get("type", "notification"), message)
+    finally:
+        notification_broker.unsubscribe(subscription)
+
+@router.get("/me/notifications/stream", response_class=StreamingResponse, name="stream_notifications", tags=["Notifications"])
+async def stream_notifications(db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    """
+    Stream the signed-in user's new notifications as server-sent events.
+
+    The stream opens with an `unread` event carrying the current unread count, then sends
+    a `notification` event for each new notification. A `resync` event means messages
+    were dropped (the client fell behind or the server lost its database listener), so
+    the client should refetch `/me/notifications`. Idle streams get a comment line every
+    few seconds to keep proxies from closing them.
+    """
+    if not settings.notification_stream_enabled:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Live notifications are disabled")
+    user = await _current_user_row(db, current_user)
+    # Give the pooled connection back now rather than holding it for the life of the stream
+    await db.close()
+    subscription = notification_broker.subscribe(user.id)
+    return StreamingResponse(
+        _stream_events(subscription, user.unread_notification_count, settings.notification_stream_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
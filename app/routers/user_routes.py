@@ -19,17 +19,21 @@ Key Highlights:
 """
 
 from builtins import dict, int, len, str
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Response, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import URL
 from app.dependencies import get_current_user, get_db, get_email_service, require_role
-from app.schemas.pagination_schema import EnhancedPagination
+from app.schemas.pagination_schema import EnhancedPagination, PaginationLink
 from app.schemas.token_schema import TokenResponse
-from app.schemas.user_schemas import LoginRequest, UserBase, UserCreate, UserListResponse, UserResponse, UserUpdate
+from app.models.user_model import UserRole, notification_preferences_as_dict
+from app.schemas.user_schemas import LoginRequest, NotificationPreferences, NotificationPreferencesUpdate, ProfessionalStatusUpdate, RoleUpdate, TriageUserListResponse, TriageUserResponse, UserBase, UserCreate, UserListResponse, UserResponse, UserUpdate
 from app.services.user_service import UserService
 from app.services.jwt_service import create_access_token
+from app.utils.cursor_pagination import decode_cursor
 from app.utils.link_generation import create_user_links, generate_pagination_links
 from app.dependencies import get_settings
 from app.services.email_service import EmailService
@@ -115,11 +119,35 @@ async def delete_user(user_id: UUID, db: AsyncSession = Depends(get_db), token:
 
     - **user_id**: UUID of the user to delete.
     """
-    success = await UserService.delete(db, user_id)
+    success = await UserService.delete(db, user_id, actor=current_user["user_id"])
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
+@router.put("/users/{user_id}/role", response_model=UserResponse, name="change_user_role", tags=["User Management Requires (Admin or Manager Roles)"])
+async def change_user_role(user_id: UUID, role_update: RoleUpdate, db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN"]))):
+    """
+    Change a user's role. The change is recorded in the audit trail.
+
+    - **user_id**: UUID of the user to update.
+    """
+    user = await UserService.change_role(db, user_id, UserRole[role_update.role.value], actor=current_user["user_id"])
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return UserResponse.model_validate(user)
+
+@router.put("/users/{user_id}/professional-status", response_model=UserResponse, name="set_professional_status", tags=["User Management Requires (Admin or Manager Roles)"])
+async def set_professional_status(user_id: UUID, status_update: ProfessionalStatusUpdate, db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """
+    Upgrade a user to professional status, or revoke it. The change is recorded in the audit trail.
+
+    - **user_id**: UUID of the user to update.
+    """
+    user = await UserService.set_professional_status(db, user_id, status_update.is_professional, actor=current_user["user_id"])
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return UserResponse.model_validate(user)
+
 
 
 @router.post("/users/", response_model=UserResponse, status_code=status.HTTP_201_CREATED, tags=["User Management Requires (Admin or Manager Roles)"], name="create_user")
@@ -163,6 +191,50 @@ async def create_user(user: UserCreate, request: Request, db: AsyncSession = Dep
     )
 
 
+def _parse_user_cursor(cursor: Optional[str]):
+    try:
+        values = decode_cursor(cursor)
+        return (datetime.fromisoformat(values[0]), UUID(values[1])) if values else None
+    except (ValueError, IndexError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def _triage_response(request: Request, route_name: str, users, cursor: Optional[str], next_cursor: Optional[str], **params) -> TriageUserListResponse:
+    list_url = URL(str(settings.server_base_url).rstrip("/") + request.app.url_path_for(route_name)).include_query_params(**params)
+    links = [PaginationLink(rel="self", href=str(list_url.include_query_params(cursor=cursor) if cursor else list_url))]
+    if next_cursor:
+        links.append(PaginationLink(rel="next", href=str(list_url.include_query_params(cursor=next_cursor))))
+    return TriageUserListResponse(
+        items=[TriageUserResponse.model_validate(user) for user in users],
+        size=len(users),
+        next_cursor=next_cursor,
+        links=links,
+    )
+
+@router.get("/admin/users/locked", response_model=TriageUserListResponse, name="list_locked_users", tags=["User Management Requires (Admin or Manager Roles)"])
+async def list_locked_users(request: Request, limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None,
+                            db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """Locked accounts, most recently locked first. Follow `next_cursor` for further pages."""
+    users, next_cursor = await UserService.list_locked(db, limit=limit, after=_parse_user_cursor(cursor))
+    return _triage_response(request, "list_locked_users", users, cursor, next_cursor, limit=limit)
+
+@router.get("/admin/users/unverified", response_model=TriageUserListResponse, name="list_unverified_users", tags=["User Management Requires (Admin or Manager Roles)"])
+async def list_unverified_users(request: Request, older_than_days: int = Query(7, ge=0, le=3650), limit: int = Query(20, ge=1, le=100),
+                                cursor: Optional[str] = None, db: AsyncSession = Depends(get_db),
+                                current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """Accounts that registered more than `older_than_days` days ago and never verified their email, oldest first."""
+    users, next_cursor = await UserService.list_unverified(db, timedelta(days=older_than_days), limit=limit, after=_parse_user_cursor(cursor))
+    return _triage_response(request, "list_unverified_users", users, cursor, next_cursor, older_than_days=older_than_days, limit=limit)
+
+@router.get("/admin/users/pro-candidates", response_model=TriageUserListResponse, name="list_pro_candidates", tags=["User Management Requires (Admin or Manager Roles)"])
+async def list_pro_candidates(request: Request, limit: int = Query(20, ge=1, le=100), cursor: Optional[str] = None,
+                              db: AsyncSession = Depends(get_db), current_user: dict = Depends(require_role(["ADMIN", "MANAGER"]))):
+    """
+    Candidates for a professional upgrade: verified, unlocked, not yet professional and with
+    a LinkedIn or GitHub profile to review. Longest-standing members first.
+    """
+    users, next_cursor = await UserService.list_pro_candidates(db, limit=limit, after=_parse_user_cursor(cursor))
+    return _triage_response(request, "list_pro_candidates", users, cursor, next_cursor, limit=limit)
+
 @router.get("/users/", response_model=UserListResponse, tags=["User Management Requires (Admin or Manager Roles)"])
 async def list_users(
     request: Request,
@@ -242,4 +314,26 @@ async def verify_email(user_id: UUID, token: str, db: AsyncSession = Depends(get
     """
     if await UserService.verify_email_with_token(db, user_id, token):
         return {"message": "Email verified successfully"}
-    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired verification token")
\ No newline at end of file
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid or expired verification token")
+
+@router.get("/me/notification-preferences", response_model=NotificationPreferences, name="get_notification_preferences", tags=["Notification Preferences"])
+async def get_notification_preferences(db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    """Fetch the signed-in user's notification preferences."""
+    user = await UserService.get_by_email(db, current_user["user_id"])
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return NotificationPreferences(**notification_preferences_as_dict(user.notification_preferences))
+
+@router.put("/me/notification-preferences", response_model=NotificationPreferences, name="update_notification_preferences", tags=["Notification Preferences"])
+async def update_notification_preferences(preferences: NotificationPreferencesUpdate, db: AsyncSession = Depends(get_db), current_user: dict = Depends(get_current_user)):
+    """
+    Opt in to or out of kinds of notifications. Preferences left out of the request body
+    keep their current setting.
+    """
+    user = await UserService.get_by_email(db, current_user["user_id"])
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    updated = await UserService.update_notification_preferences(db, user.id, preferences.model_dump(exclude_none=True))
+    if updated is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return NotificationPreferences(**updated)
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from enum import Enum
+import uuid
+from app.schemas.pagination_schema import PaginationLink
+
+class AuditAction(str, Enum):
+    ROLE_CHANGED = "ROLE_CHANGED"
+    ACCOUNT_LOCKED = "ACCOUNT_LOCKED"
+    ACCOUNT_UNLOCKED = "ACCOUNT_UNLOCKED"
+    USER_DELETED = "USER_DELETED"
+    PROFESSIONAL_STATUS_CHANGED = "PROFESSIONAL_STATUS_CHANGED"
+
+class AuditLogEntryResponse(BaseModel):
+    id: uuid.UUID = Field(..., example=uuid.uuid4())
+    created_at: datetime = Field(..., example="2026-10-19T12:30:00Z")
+    action: AuditAction = Field(..., example="ROLE_CHANGED")
+    user_id: uuid.UUID = Field(..., example=uuid.uuid4())
+    actor: Optional[str] = Field(None, example="admin@example.com")
+    details: Dict[str, Any] = Field(default_factory=dict, example={"old_role": "AUTHENTICATED", "new_role": "MANAGER"})
+
+    class Config:
+        from_attributes = True
+
+class AuditLogListResponse(BaseModel):
+    items: List[AuditLogEntryResponse] = Field(...)
+    size: int = Field(..., example=50)
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page.")
+    links: List[PaginationLink] = Field(default_factory=list)
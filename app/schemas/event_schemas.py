@@ -0,0 +1,85 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, List
+from datetime import datetime
+from enum import Enum
+import uuid
+from app.schemas.pagination_schema import PaginationLink
+
+class EventType(str, Enum):
+    COMPANY_TOUR = "COMPANY_TOUR"
+    MOCK_INTERVIEW = "MOCK_INTERVIEW"
+    GUEST_LECTURE = "GUEST_LECTURE"
+    WORKSHOP = "WORKSHOP"
+    NETWORKING = "NETWORKING"
+    OTHER = "OTHER"
+
+class EventStatus(str, Enum):
+    PENDING = "PENDING"
+    APPROVED = "APPROVED"
+    REJECTED = "REJECTED"
+
+class EventBase(BaseModel):
+    title: str = Field(..., min_length=3, max_length=200, example="Company Tour: Example Corp")
+    description: Optional[str] = Field(None, max_length=2000, example="A guided tour of our engineering offices.")
+    event_type: EventType = Field(default=EventType.OTHER, example="COMPANY_TOUR")
+    location: Optional[str] = Field(None, max_length=255, example="Newark, NJ")
+    starts_at: datetime = Field(..., example="2026-11-01T15:00:00Z")
+    ends_at: Optional[datetime] = Field(None, example="2026-11-01T17:00:00Z")
+    capacity: int = Field(..., gt=0, example=50)
+
+    class Config:
+        from_attributes = True
+
+class EventCreate(EventBase):
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.ends_at is not None and self.ends_at <= self.starts_at:
+            raise ValueError("Event must end after it starts.")
+        return self
+
+class EventUpdate(BaseModel):
+    title: Optional[str] = Field(None, min_length=3, max_length=200, example="Company Tour: Example Corp")
+    description: Optional[str] = Field(None, max_length=2000, example="Updated description")
+    event_type: Optional[EventType] = Field(None, example="GUEST_LECTURE")
+    location: Optional[str] = Field(None, max_length=255, example="Online")
+    starts_at: Optional[datetime] = Field(None, example="2026-11-01T15:00:00Z")
+    ends_at: Optional[datetime] = Field(None, example="2026-11-01T17:00:00Z")
+    capacity: Optional[int] = Field(None, gt=0, example=60)
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_at_least_one_value(cls, values):
+        if isinstance(values, dict) and not any(values.values()):
+            raise ValueError("At least one field must be provided for the update.")
+        return values
+
+class EventResponse(EventBase):
+    id: uuid.UUID = Field(..., example=uuid.uuid4())
+    status: EventStatus = Field(default=EventStatus.PENDING, example="APPROVED")
+    registered_count: int = Field(default=0, example=12)
+    created_by: Optional[uuid.UUID] = Field(None, example=uuid.uuid4())
+    review_feedback: Optional[str] = Field(None, example="Please add the room number.")
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+class PendingEventResponse(EventResponse):
+    claimed_by: Optional[uuid.UUID] = Field(None, example=uuid.uuid4())
+    claimed_until: Optional[datetime] = Field(None, example="2026-11-01T15:15:00Z")
+
+class PendingEventListResponse(BaseModel):
+    items: List[PendingEventResponse] = Field(...)
+    size: int = Field(..., example=10)
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page.")
+    links: List[PaginationLink] = Field(default_factory=list)
+
+class EventApproval(BaseModel):
+    feedback: Optional[str] = Field(None, max_length=1000, example="Looks good.")
+
+class EventRejection(BaseModel):
+    feedback: str = Field(..., min_length=1, max_length=1000, example="Please add the room number and resubmit.")
+
+class EventListResponse(BaseModel):
+    items: List[EventResponse] = Field(...)
+    size: int = Field(..., example=10)
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page.")
+    links: List[PaginationLink] = Field(default_factory=list)
@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+import uuid
+from app.schemas.pagination_schema import PaginationLink
+
+class NotificationKind(str, Enum):
+    EVENT_UPDATE = "EVENT_UPDATE"
+    SYSTEM = "SYSTEM"
+
+class NotificationResponse(BaseModel):
+    id: uuid.UUID = Field(..., example=uuid.uuid4())
+    kind: NotificationKind = Field(..., example="EVENT_UPDATE")
+    title: str = Field(..., example="Update: Intro to FastAPI")
+    body: Optional[str] = Field(None, example="The workshop has moved to room 204.")
+    event_id: Optional[uuid.UUID] = Field(None, example=uuid.uuid4())
+    created_at: datetime = Field(..., example="2026-10-19T12:30:00Z")
+    read_at: Optional[datetime] = Field(None, example=None)
+
+    class Config:
+        from_attributes = True
+
+class NotificationListResponse(BaseModel):
+    items: List[NotificationResponse] = Field(...)
+    size: int = Field(..., example=20)
+    unread_count: int = Field(..., example=3)
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page.")
+    links: List[PaginationLink] = Field(default_factory=list)
+
+class NotificationMarkRead(BaseModel):
+    ids: List[uuid.UUID] = Field(..., min_length=1, max_length=500, example=[uuid.uuid4()])
+
+class UnreadNotificationCount(BaseModel):
+    unread_count: int = Field(..., example=0)
@@ -4,6 +4,7 @@ from datetime import datetime
 from enum import Enum
 import uuid
 import re
+from app.schemas.pagination_schema import PaginationLink
 from app.utils.nickname_gen import generate_nickname
 
 class UserRole(str, Enum):
@@ -72,6 +73,37 @@ class UserResponse(UserBase):
     role: UserRole = Field(default=UserRole.AUTHENTICATED, example="AUTHENTICATED")
     is_professional: Optional[bool] = Field(default=False, example=True)
 
+class RoleUpdate(BaseModel):
+    role: UserRole = Field(..., example="MANAGER")
+
+    @validator("role")
+    def validate_role(cls, role):
+        # ANONYMOUS marks an account whose email is not verified yet; only verification moves users out of it
+        if role == UserRole.ANONYMOUS:
+            raise ValueError("Users cannot be assigned the ANONYMOUS role.")
+        return role
+
+class ProfessionalStatusUpdate(BaseModel):
+    is_professional: bool = Field(..., example=True)
+
+class NotificationPreferences(BaseModel):
+    event_updates_email: bool = Field(default=True, example=True)
+    event_updates_dashboard: bool = Field(default=True, example=True)
+    event_approval_email: bool = Field(default=True, example=False)
+    pro_status_email: bool = Field(default=True, example=True)
+
+class NotificationPreferencesUpdate(BaseModel):
+    event_updates_email: Optional[bool] = Field(None, example=False)
+    event_updates_dashboard: Optional[bool] = Field(None, example=True)
+    event_approval_email: Optional[bool] = Field(None, example=False)
+    pro_status_email: Optional[bool] = Field(None, example=True)
+
+    @root_validator(pre=True)
+    def check_at_least_one_value(cls, values):
+        if not any(value is not None for value in values.values()):
+            raise ValueError("At least one preference must be provided for the update.")
+        return values
+
 class LoginRequest(BaseModel):
     email: EmailStr = Field(..., example="john.doe@example.com")
     password: str = Field(..., example="SecurePassword123!")
@@ -96,4 +128,18 @@ class UserListResponse(BaseModel):
     items: List[UserResponse] = Field(...)
     total: int = Field(..., example=100)
     page: int = Field(..., example=1)
-    size: int = Field(..., example=10)
\ No newline at end of file
+    size: int = Field(..., example=10)
+
+class TriageUserResponse(UserResponse):
+    email_verified: bool = Field(..., example=False)
+    is_locked: Optional[bool] = Field(default=False, example=True)
+    failed_login_attempts: Optional[int] = Field(default=0, example=5)
+    last_login_at: Optional[datetime] = Field(None, example="2026-10-12T08:45:00Z")
+    created_at: datetime = Field(..., example="2026-09-30T10:00:00Z")
+    updated_at: datetime = Field(..., example="2026-10-18T16:20:00Z")
+
+class TriageUserListResponse(BaseModel):
+    items: List[TriageUserResponse] = Field(...)
+    size: int = Field(..., example=10)
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page.")
+    links: List[PaginationLink] = Field(default_factory=list)
@@ -0,0 +1,170 @@
+from builtins import Exception, classmethod, len, min, range, reversed, set, str
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import insert, select, text, tuple_
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import Database
+from app.models.audit_log_model import AuditAction, AuditLogEntry
+from app.utils.cursor_pagination import encode_cursor
+from app.utils.metrics import metrics
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+def _next_month(month: datetime) -> datetime:
+    return month.replace(year=month.year + 1, month=1) if month.month == 12 else month.replace(month=month.month + 1)
+
+class AuditLogBuffer:
+    """
+    In-process buffer in front of the ``audit_log`` table.
+
+    ``record`` only appends a dict to a deque, so auditing costs the request path no
+    database round trip. A background task writes the buffer out in multi-row inserts
+    every ``flush_interval`` seconds, or as soon as ``batch_size`` entries are waiting,
+    and creates the monthly partition for an entry the first time its month is seen.
+    Entries are lost if the process dies before they are flushed; ``stop`` flushes
+    whatever is left on shutdown. If the buffer reaches ``max_entries`` (the database is
+    unreachable for a long time) the oldest entries are dropped and counted in ``dropped``.
+    """
+
+    def __init__(self, session_factory=None, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, max_entries: Optional[int] = None):
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.audit_flush_batch_size
+        self.flush_interval = flush_interval if flush_interval is not None else settings.audit_flush_interval_seconds
+        self.max_entries = max_entries or settings.audit_buffer_max_entries
+        self.dropped = 0
+        self._entries: deque = deque()
+        self._partitions = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, action: AuditAction, user_id: UUID, actor: Optional[str] = None, **details: Any) -> None:
+        """Queue an audit entry; ``details`` must be JSON serializable."""
+        if len(self._entries) >= self.max_entries:
+            self._entries.popleft()
+            self.dropped += 1
+            logger.warning("Audit buffer full, dropped the oldest entry (%s dropped so far)", self.dropped)
+        self._entries.append({
+            "id": uuid4(), "created_at": datetime.now(timezone.utc), "action": action,
+            "user_id": user_id, "actor": actor, "details": details,
+        })
+        if len(self._entries) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def clear(self) -> None:
+        """Discard buffered entries and forget which partitions exist."""
+        self._entries.clear()
+        self._partitions.clear()
+
+    async def _ensure_partitions(self, session: AsyncSession, batch: List[Dict[str, Any]]) -> None:
+        # Creating next month's partition as well keeps the DDL off the first writes of a new month
+        for month in {_month_start(entry["created_at"]) for entry in batch} - self._partitions:
+            for start in (month, _next_month(month)):
+                name = f"audit_log_p{start:%Y_%m}"
+                try:
+                    # Attaching a partition locks the parent; give up rather than stall behind a long reader
+                    await session.execute(text("SET LOCAL lock_timeout = '2s'"))
+                    await session.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF audit_log "
+                        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{_next_month(start).isoformat()}')"
+                    ))
+                    await session.commit()
+                except SQLAlchemyError as e:
+                    # Lock timeout, another process won the race, or rows already sit in the default partition
+                    logger.warning("Could not create audit partition %s: %s", name, e)
+                    await session.rollback()
+            # Only stop trying once the partition really exists; until then rows land in audit_log_default
+            exists = await session.execute(text("SELECT to_regclass(:name)::text"), {"name": f"audit_log_p{month:%Y_%m}"})
+            await session.commit()
+            if exists.scalar() is not None:
+                self._partitions.add(month)
+
+    async def flush(self) -> int:
+        """Write out everything buffered so far; returns the number of entries written."""
+        written = 0
+        while self._entries:
+            batch = [self._entries.popleft() for _ in range(min(self.batch_size, len(self._entries)))]
+            try:
+                async with (self.session_factory or Database.get_session_factory())() as session:
+                    await self._ensure_partitions(session, batch)
+                    await session.execute(insert(AuditLogEntry), batch)
+                    await session.commit()
+            except Exception as e:
+                logger.error("Failed to write %s audit entries, will retry: %s", len(batch), e)
+                self._entries.extendleft(reversed(batch))
+                break
+            written += len(batch)
+        return written
+
+    async def run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+            self._wakeup = None
+        await self.flush()
+
+# The process-wide audit buffer UserService records into
+audit_log = AuditLogBuffer()
+metrics.gauge("audit_log_buffered_entries", "Audit entries waiting in memory to be written", callback=lambda: len(audit_log))
+metrics.counter("audit_log_dropped_total", "Audit entries dropped because the buffer was full", callback=lambda: audit_log.dropped)
+
+class AuditLogService:
+    @classmethod
+    async def list_entries(cls, session: AsyncSession, limit: int = 50, after: Optional[Tuple[datetime, UUID]] = None,
+                           user_id: Optional[UUID] = None, action: Optional[AuditAction] = None,
+                           since: Optional[datetime] = None, until: Optional[datetime] = None) -> Tuple[List[AuditLogEntry], Optional[str]]:
+        """
+        Page through audit entries, newest first.
+
+        ``after`` is the ``(created_at, id)`` of the last entry on the previous page. A
+        ``since``/``until`` window lets the planner skip partitions outside it entirely.
+        Returns the entries and the cursor for the next page, or None on the last page.
+        """
+        query = select(AuditLogEntry)
+        if user_id is not None:
+            query = query.where(AuditLogEntry.user_id == user_id)
+        if action is not None:
+            query = query.where(AuditLogEntry.action == action)
+        if since is not None:
+            query = query.where(AuditLogEntry.created_at >= since)
+        if until is not None:
+            query = query.where(AuditLogEntry.created_at < until)
+        if after is not None:
+            query = query.where(tuple_(AuditLogEntry.created_at, AuditLogEntry.id) < tuple_(*after))
+        query = query.order_by(AuditLogEntry.created_at.desc(), AuditLogEntry.id.desc()).limit(limit + 1)
+        result = await session.execute(query)
+        entries = result.scalars().all()
+        if len(entries) > limit:
+            entries = entries[:limit]
+            return entries, encode_cursor(entries[-1].created_at.isoformat(), entries[-1].id)
+        return entries, None
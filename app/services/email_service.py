@@ -1,37 +1,116 @@
 # email_service.py
-from builtins import ValueError, dict, str
+from builtins import Exception, ValueError, dict, hasattr, int, range, str
+import asyncio
+from typing import AsyncIterable, Iterable, List, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from settings.config import settings
+from app.utils.rate_limiter import RateLimiter
 from app.utils.smtp_connection import SMTPClient
 from app.utils.template_manager import TemplateManager
+from app.models.email_outbox_model import EmailOutbox
 from app.models.user_model import User
 
 class EmailService:
+    subject_map = {
+        'email_verification': "Verify Your Account",
+        'password_reset': "Password Reset Instructions",
+        'account_locked': "Account Locked Notification",
+        'event_update': "An Event You Registered For Has Changed"
+    }
+
     def __init__(self, template_manager: TemplateManager):
         self.smtp_client = SMTPClient(
             server=settings.smtp_server,
             port=settings.smtp_port,
             username=settings.smtp_username,
-            password=settings.smtp_password
+            password=settings.smtp_password,
+            use_tls=settings.smtp_use_tls,
+            pool_size=settings.smtp_pool_size,
+            timeout=settings.smtp_timeout,
+            max_messages_per_connection=settings.smtp_max_messages_per_connection,
+            checkout_timeout=settings.smtp_checkout_timeout or None
         )
         self.template_manager = template_manager
+        # Shared by every send so concurrent batches together stay under the provider limit
+        self.rate_limiter = RateLimiter(settings.email_rate_limit_per_second, settings.email_rate_limit_burst)
 
-    async def send_user_email(self, user_data: dict, email_type: str):
-        subject_map = {
-            'email_verification': "Verify Your Account",
-            'password_reset': "Password Reset Instructions",
-            'account_locked': "Account Locked Notification"
-        }
-
-        if email_type not in subject_map:
+    def _subject_for(self, email_type: str) -> str:
+        if email_type not in self.subject_map:
             raise ValueError("Invalid email type")
+        return self.subject_map[email_type]
 
+    async def send_user_email(self, user_data: dict, email_type: str):
+        subject = self._subject_for(email_type)
         html_content = self.template_manager.render_template(email_type, **user_data)
-        self.smtp_client.send_email(subject_map[email_type], html_content, user_data['email'])
+        await self.rate_limiter.acquire()
+        await self.smtp_client.send_email(subject, html_content, user_data['email'])
 
-    async def send_verification_email(self, user: User):
+    async def send_bulk_email(self, email_type: str, recipients: Union[Iterable[dict], AsyncIterable[dict]],
+                              concurrency: Optional[int] = None) -> List[dict]:
+        """
+        Send one template to a stream of recipients.
+
+        ``recipients`` may be a plain or async iterable of template contexts (each with an
+        ``email`` key) and is consumed lazily, so large audiences are never held in memory.
+        At most ``concurrency`` messages are in flight (the SMTP pool size by default) and
+        the shared rate limiter caps messages per second. Returns one
+        ``{"email", "sent", "error"}`` result per recipient; failures do not stop the batch.
+        """
+        subject = self._subject_for(email_type)
+        concurrency = concurrency or self.smtp_client.pool_size
+        pending = asyncio.Queue(maxsize=concurrency * 2)
+        results = []
+
+        async def produce():
+            try:
+                if hasattr(recipients, '__aiter__'):
+                    async for user_data in recipients:
+                        await pending.put(user_data)
+                else:
+                    for user_data in recipients:
+                        await pending.put(user_data)
+            finally:
+                for _ in range(concurrency):
+                    await pending.put(None)
+
+        async def consume():
+            while (user_data := await pending.get()) is not None:
+                try:
+                    html_content = self.template_manager.render_template(email_type, **user_data)
+                    await self.rate_limiter.acquire()
+                    await self.smtp_client.send_email(subject, html_content, user_data['email'])
+                    results.append({"email": user_data['email'], "sent": True, "error": None})
+                except Exception as e:
+                    results.append({"email": user_data.get('email'), "sent": False, "error": str(e)})
+
+        await asyncio.gather(produce(), *(consume() for _ in range(concurrency)))
+        return results
+
+    async def close(self):
+        """Release the pooled SMTP connections."""
+        await self.smtp_client.close()
+
+    def _verification_context(self, user: User) -> dict:
         verification_url = f"{settings.server_base_url}verify-email/{user.id}/{user.verification_token}"
-        await self.send_user_email({
+        return {
             "name": user.first_name,
             "verification_url": verification_url,
             "email": user.email
-        }, 'email_verification')
\ No newline at end of file
+        }
+
+    async def send_verification_email(self, user: User):
+        await self.send_user_email(self._verification_context(user), 'email_verification')
+
+    def enqueue_user_email(self, session: AsyncSession, user_data: dict, email_type: str) -> EmailOutbox:
+        """
+        Queue an email in the outbox as part of the caller's transaction.
+
+        Nothing is flushed or committed here: the outbox worker only sees the row once the
+        caller commits, so the email goes out if and only if the triggering change persists.
+        """
+        entry = EmailOutbox(email_type=email_type, recipient=user_data['email'], context=user_data)
+        session.add(entry)
+        return entry
+
+    def enqueue_verification_email(self, session: AsyncSession, user: User) -> EmailOutbox:
+        return self.enqueue_user_email(session, self._verification_context(user), 'email_verification')
\ No newline at end of file
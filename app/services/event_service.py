@@ -0,0 +1,328 @@
+from builtins import ValueError, bool, classmethod, int, len, max, sorted, str
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional, Dict, List, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy import and_, delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.event_model import Event, EventRegistration, EventStatus, EventType
+from app.schemas.event_schemas import EventCreate, EventUpdate
+from app.utils.cache import TTLCache
+from app.utils.cursor_pagination import encode_cursor
+from app.utils.metrics import metrics
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rendered first pages of the public listing, cleared whenever the set of visible events may change
+upcoming_events_cache = TTLCache(settings.event_listing_cache_ttl_seconds, settings.event_listing_cache_max_entries)
+metrics.counter("event_listing_cache_hits_total", "Event listing pages served from cache", callback=lambda: upcoming_events_cache.hits)
+metrics.counter("event_listing_cache_misses_total", "Event listing pages not found in cache", callback=lambda: upcoming_events_cache.misses)
+metrics.gauge("event_listing_cache_entries", "Event listing pages currently cached", callback=lambda: len(upcoming_events_cache))
+
+class RegistrationOutcome(Enum):
+    """Result of an attempt to take a seat at an event."""
+    REGISTERED = "REGISTERED"
+    ALREADY_REGISTERED = "ALREADY_REGISTERED"
+    EVENT_FULL = "EVENT_FULL"
+    NOT_OPEN = "NOT_OPEN"
+
+class EventUpdateConflict(ValueError):
+    """Raised when an update is valid on its own but conflicts with the event's stored state."""
+
+def _as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    return moment.replace(tzinfo=timezone.utc) if moment is not None and moment.tzinfo is None else moment
+
+class EventService:
+    @classmethod
+    async def _execute_query(cls, session: AsyncSession, query):
+        try:
+            result = await session.execute(query)
+            await session.commit()
+            return result
+        except SQLAlchemyError as e:
+            logger.error("Database error: %s", e)
+            await session.rollback()
+            return None
+
+    @classmethod
+    async def get_by_id(cls, session: AsyncSession, event_id: UUID) -> Optional[Event]:
+        # registered_count is changed by bulk UPDATEs, so refresh any instance already in the session
+        query = select(Event).filter_by(id=event_id).execution_options(populate_existing=True)
+        result = await cls._execute_query(session, query)
+        return result.scalars().first() if result else None
+
+    @classmethod
+    async def create(cls, session: AsyncSession, event_data: Dict[str, str], created_by: Optional[UUID] = None) -> Optional[Event]:
+        try:
+            validated_data = EventCreate(**event_data).model_dump()
+        except ValidationError as e:
+            logger.error("Validation error during event creation: %s", e)
+            return None
+        new_event = Event(**validated_data, created_by=created_by, status=EventStatus.PENDING)
+        session.add(new_event)
+        await session.commit()
+        upcoming_events_cache.clear()
+        return new_event
+
+    @classmethod
+    async def update(cls, session: AsyncSession, event_id: UUID, update_data: Dict[str, str]) -> Optional[Event]:
+        """
+        Apply a partial update; returns None if the event does not exist.
+
+        Raises EventUpdateConflict if the change would leave the event ending before it
+        starts or with fewer seats than are already taken.
+        """
+        try:
+            validated_data = EventUpdate(**update_data).model_dump(exclude_unset=True)
+        except ValidationError as e:
+            logger.error("Validation error during event update: %s", e)
+            return None
+        event = await cls.get_by_id(session, event_id)
+        if not event:
+            return None
+        starts_at = _as_utc(validated_data.get("starts_at", event.starts_at))
+        ends_at = _as_utc(validated_data.get("ends_at", event.ends_at))
+        if ends_at is not None and ends_at <= starts_at:
+            raise EventUpdateConflict("Event must end after it starts.")
+        if validated_data.get("capacity", event.capacity) < event.registered_count:
+            raise EventUpdateConflict(f"Capacity cannot be lower than the {event.registered_count} seats already taken.")
+        query = update(Event).where(Event.id == event_id).values(**validated_data).execution_options(synchronize_session="fetch")
+        try:
+            await session.execute(query)
+            await session.commit()
+        except IntegrityError as e:
+            # A registration landed between the check above and the update
+            logger.info("Event %s update rejected by a constraint: %s", event_id, e)
+            await session.rollback()
+            raise EventUpdateConflict("Capacity cannot be lower than the seats already taken.") from e
+        upcoming_events_cache.clear()
+        return await cls.get_by_id(session, event_id)
+
+    @classmethod
+    async def delete(cls, session: AsyncSession, event_id: UUID) -> bool:
+        event = await cls.get_by_id(session, event_id)
+        if not event:
+            logger.info("Event with ID %s not found.", event_id)
+            return False
+        await session.delete(event)
+        await session.commit()
+        upcoming_events_cache.clear()
+        return True
+
+    @classmethod
+    def _reviewable_by(cls, reviewer_id: Optional[UUID]):
+        """Pending events the reviewer may decide: unclaimed, claimed by them, or with an expired claim."""
+        condition = Event.status == EventStatus.PENDING
+        if reviewer_id is None:
+            return condition
+        return and_(condition, or_(
+            Event.claimed_by.is_(None), Event.claimed_by == reviewer_id, Event.claimed_until < func.now(),
+        ))
+
+    @classmethod
+    async def _decide(cls, session: AsyncSession, event_id: UUID, status: EventStatus,
+                      reviewer_id: Optional[UUID], feedback: Optional[str]) -> Optional[Event]:
+        query = (
+            update(Event)
+            .where(Event.id == event_id, cls._reviewable_by(reviewer_id))
+            .values(status=status, reviewed_by=reviewer_id, reviewed_at=func.now(), review_feedback=feedback,
+                    claimed_by=None, claimed_until=None)
+            .returning(Event)
+            .execution_options(populate_existing=True)
+        )
+        result = await cls._execute_query(session, query)
+        return result.scalars().first() if result else None
+
+    @classmethod
+    async def approve(cls, session: AsyncSession, event_id: UUID, reviewer_id: Optional[UUID] = None,
+                      feedback: Optional[str] = None) -> Optional[Event]:
+        """
+        Publish a pending event in one conditional UPDATE.
+
+        Returns None if the event is not pending, or (when ``reviewer_id`` is given) is
+        claimed by another manager whose claim has not expired.
+        """
+        event = await cls._decide(session, event_id, EventStatus.APPROVED, reviewer_id, feedback)
+        if event:
+            upcoming_events_cache.clear()
+        return event
+
+    @classmethod
+    async def reject(cls, session: AsyncSession, event_id: UUID, reviewer_id: Optional[UUID], feedback: str) -> Optional[Event]:
+        """Reject a pending event with feedback for its creator; same conditions as ``approve``."""
+        return await cls._decide(session, event_id, EventStatus.REJECTED, reviewer_id, feedback)
+
+    @classmethod
+    async def list_pending(cls, session: AsyncSession, limit: int = 20,
+                           after: Optional[Tuple[datetime, UUID]] = None) -> Tuple[List[Event], Optional[str]]:
+        """
+        Page through the review queue, oldest submission first.
+
+        Keyset pagination on ``(created_at, id)`` makes every page a range scan on the
+        partial ``ix_events_pending_created_at`` index. Claimed events are included so
+        managers can see who is reviewing what.
+        """
+        query = select(Event).where(Event.status == EventStatus.PENDING)
+        if after is not None:
+            query = query.where(tuple_(Event.created_at, Event.id) > tuple_(*after))
+        query = query.order_by(Event.created_at, Event.id).limit(limit + 1)
+        result = await session.execute(query)
+        events = result.scalars().all()
+        if len(events) > limit:
+            events = events[:limit]
+            return events, encode_cursor(events[-1].created_at.isoformat(), events[-1].id)
+        return events, None
+
+    @classmethod
+    async def claim_for_review(cls, session: AsyncSession, reviewer_id: UUID, limit: int = 1,
+                               claim_seconds: Optional[float] = None) -> List[Event]:
+        """
+        Claim the oldest unclaimed pending events for a manager, in a single statement.
+
+        The inner ``SELECT ... FOR UPDATE SKIP LOCKED`` passes over events another manager
+        is claiming at the same moment instead of waiting for them, so concurrent
+        reviewers never block each other or receive the same event. A claim lasts
+        ``claim_seconds``; after that the event can be claimed by someone else.
+        """
+        claim_seconds = claim_seconds if claim_seconds is not None else settings.event_review_claim_seconds
+        claimable = (
+            select(Event.id)
+            .where(Event.status == EventStatus.PENDING,
+                   or_(Event.claimed_until.is_(None), Event.claimed_until < func.now()))
+            .order_by(Event.created_at, Event.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(Event)
+            .where(Event.id.in_(claimable.scalar_subquery()))
+            .values(claimed_by=reviewer_id, claimed_until=func.now() + timedelta(seconds=claim_seconds))
+            .returning(Event)
+            .execution_options(populate_existing=True)
+        )
+        result = await cls._execute_query(session, query)
+        events = result.scalars().all() if result else []
+        return sorted(events, key=lambda event: (event.created_at, event.id))
+
+    @classmethod
+    async def list_events(cls, session: AsyncSession, skip: int = 0, limit: int = 10) -> List[Event]:
+        query = select(Event).order_by(Event.starts_at, Event.id).offset(skip).limit(limit)
+        result = await cls._execute_query(session, query)
+        return result.scalars().all() if result else []
+
+    @classmethod
+    async def list_upcoming(cls, session: AsyncSession, limit: int = 10, after: Optional[Tuple[datetime, UUID]] = None,
+                            starts_after: Optional[datetime] = None, starts_before: Optional[datetime] = None,
+                            event_type: Optional[EventType] = None, location: Optional[str] = None) -> Tuple[List[Event], Optional[str]]:
+        """
+        Page through approved events that have not started yet, soonest first.
+
+        Pagination is keyset based: ``after`` is the ``(starts_at, id)`` of the last event on
+        the previous page, so every page is a range scan on one of the partial
+        ``ix_events_approved_*`` indexes no matter how deep the client pages. Returns the
+        events and the cursor for the next page, or None on the last page.
+        """
+        lower_bound = datetime.now(timezone.utc)
+        if starts_after is not None:
+            if starts_after.tzinfo is None:
+                starts_after = starts_after.replace(tzinfo=timezone.utc)
+            lower_bound = max(starts_after, lower_bound)
+        query = select(Event).where(Event.status == EventStatus.APPROVED, Event.starts_at >= lower_bound)
+        if starts_before is not None:
+            query = query.where(Event.starts_at < starts_before)
+        if event_type is not None:
+            query = query.where(Event.event_type == event_type)
+        if location:
+            query = query.where(func.lower(Event.location) == location.lower())
+        if after is not None:
+            query = query.where(tuple_(Event.starts_at, Event.id) > tuple_(*after))
+        query = query.order_by(Event.starts_at, Event.id).limit(limit + 1)
+        result = await session.execute(query)
+        events = result.scalars().all()
+        if len(events) > limit:
+            events = events[:limit]
+            return events, encode_cursor(events[-1].starts_at.isoformat(), events[-1].id)
+        return events, None
+
+    @classmethod
+    async def count(cls, session: AsyncSession) -> int:
+        result = await session.execute(select(func.count()).select_from(Event))
+        return result.scalar()
+
+    @classmethod
+    async def register_user(cls, session: AsyncSession, event_id: UUID, user_id: UUID) -> RegistrationOutcome:
+        """
+        Take a seat at an approved event for a user.
+
+        The registration row is inserted first with ``ON CONFLICT DO NOTHING`` so repeat
+        registrations never touch the counter. The seat is then claimed with a single
+        conditional ``UPDATE ... SET registered_count = registered_count + 1 WHERE
+        registered_count < capacity``, which holds the event's row lock only from that
+        statement to the commit that immediately follows, so other events are unaffected.
+        If no seat is left the registration row is deleted again before committing.
+        """
+        try:
+            inserted = await session.execute(
+                insert(EventRegistration)
+                .values(event_id=event_id, user_id=user_id)
+                .on_conflict_do_nothing(constraint="uq_event_registrations_event_user")
+                .returning(EventRegistration.id)
+            )
+            registration_id = inserted.scalar()
+            if registration_id is None:
+                await session.commit()
+                return RegistrationOutcome.ALREADY_REGISTERED
+            claimed = await session.execute(
+                update(Event)
+                .where(
+                    Event.id == event_id,
+                    Event.status == EventStatus.APPROVED,
+                    Event.registered_count < Event.capacity,
+                )
+                .values(registered_count=Event.registered_count + 1)
+                .returning(Event.status)
+                .execution_options(synchronize_session=False)
+            )
+            if claimed.scalar() is None:
+                await session.execute(delete(EventRegistration).where(EventRegistration.id == registration_id))
+                status = (await session.execute(select(Event.status).where(Event.id == event_id))).scalar()
+                await session.commit()
+                return RegistrationOutcome.EVENT_FULL if status == EventStatus.APPROVED else RegistrationOutcome.NOT_OPEN
+            await session.commit()
+            return RegistrationOutcome.REGISTERED
+        except SQLAlchemyError as e:
+            # Unknown event or user ids surface here as foreign key violations
+            logger.error("Database error during event registration: %s", e)
+            await session.rollback()
+            return RegistrationOutcome.NOT_OPEN
+
+    @classmethod
+    async def cancel_registration(cls, session: AsyncSession, event_id: UUID, user_id: UUID) -> bool:
+        """Release a user's seat; the row delete and counter decrement commit together."""
+        removed = await session.execute(
+            delete(EventRegistration)
+            .where(EventRegistration.event_id == event_id, EventRegistration.user_id == user_id)
+            .returning(EventRegistration.id)
+        )
+        if removed.scalar() is None:
+            await session.commit()
+            return False
+        await session.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(registered_count=Event.registered_count - 1)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        return True
+
+    @classmethod
+    async def is_registered(cls, session: AsyncSession, event_id: UUID, user_id: UUID) -> bool:
+        query = select(EventRegistration.id).where(EventRegistration.event_id == event_id, EventRegistration.user_id == user_id)
+        result = await session.execute(query)
+        return result.scalar() is not None
@@ -0,0 +1,88 @@
+from builtins import Exception, round, str, type
+import asyncio
+import time
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import text
+from app.database import Database
+from app.services.outbox_service import OutboxService
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+def pool_check() -> Dict[str, Any]:
+    """
+    How full the connection pool is, from counters only (no I/O).
+
+    Saturation is connections in use over the most the pool will hand out (size plus
+    overflow); at ``settings.readiness_pool_saturation`` or above the pool counts as
+    exhausted, since new requests would queue for a connection.
+    """
+    status = Database.pool_status()
+    if status is None:
+        return {"ok": False, "error": "database not initialized"}
+    capacity = status["size"] + status["max_overflow"] if status["max_overflow"] >= 0 else None
+    saturation = status["checked_out"] / capacity if capacity else 0.0
+    return {
+        "ok": saturation < settings.readiness_pool_saturation,
+        "in_use": status["checked_out"],
+        "capacity": capacity,
+        "saturation": round(saturation, 3),
+    }
+
+class ReadinessCheck:
+    """
+    The database half of ``/readyz``: a ``SELECT 1`` and the outbox backlog, cached.
+
+    However many probes arrive, the database sees at most one check per
+    ``readiness_cache_seconds``: results, failures included, are reused until they
+    expire, and probes arriving while a check is running wait for that check rather than
+    starting their own. Each check gives up after ``readiness_db_timeout_seconds``.
+    """
+
+    def __init__(self):
+        self._cached: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._running: Optional[asyncio.Future] = None
+
+    def clear(self) -> None:
+        self._cached = None
+        self._running = None
+
+    async def _query(self) -> int:
+        async with Database.get_session_factory()() as session:
+            await session.execute(text("SELECT 1"))
+            return await OutboxService.pending_count(session)
+
+    async def _refresh(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            pending = await asyncio.wait_for(self._query(), settings.readiness_db_timeout_seconds)
+            result = {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 1), "outbox_pending": pending}
+        except Exception as e:
+            logger.warning("Readiness check could not reach the database: %s", e)
+            result = {"ok": False, "error": str(e) or type(e).__name__}
+        self._cached = (time.monotonic() + settings.readiness_cache_seconds, result)
+        return result
+
+    async def database(self) -> Dict[str, Any]:
+        if self._cached is not None and self._cached[0] > time.monotonic():
+            return self._cached[1]
+        if self._running is None or self._running.done():
+            self._running = asyncio.ensure_future(self._refresh())
+        # Shielded so one probe timing out on its side does not cancel the check the others wait for
+        return await asyncio.shield(self._running)
+
+    async def check(self) -> Tuple[bool, Dict[str, Any]]:
+        """Returns ``(ready, checks)``; the database is not queried while the pool is exhausted."""
+        pool = pool_check()
+        if not pool["ok"]:
+            return False, {"pool": pool, "database": {"ok": None, "skipped": "pool exhausted"}}
+        database = await self.database()
+        checks = {"pool": pool, "database": {key: value for key, value in database.items() if key != "outbox_pending"}}
+        if "outbox_pending" in database:
+            pending = database["outbox_pending"]
+            checks["outbox"] = {"pending": pending, "backlogged": pending >= settings.readiness_outbox_backlog_warning}
+        return database["ok"], checks
+
+# The process-wide readiness check
+readiness = ReadinessCheck()
@@ -0,0 +1,189 @@
+from builtins import Exception, dict, len, max, range, set, str, sum
+import asyncio
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.utils.metrics import metrics
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads must stay under 8000 bytes; leave room for the message fields around the ids
+MAX_NOTIFY_PAYLOAD = 7000
+
+RESYNC = {"type": "resync"}
+
+class Subscription:
+    """One open stream's mailbox. Kept small, since a worker may hold thousands of idle ones."""
+    __slots__ = ("user_id", "queue")
+
+    def __init__(self, user_id: UUID, max_pending: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def offer(self, message: Dict[str, Any]) -> bool:
+        """
+        Queue ``message`` without waiting. A consumer too slow to keep up loses its backlog
+        and is sent a single resync message instead, telling it to refetch its feed, so a
+        stalled client costs at most ``max_pending`` messages of memory and never slows the
+        publisher. Returns False when the backlog was dropped.
+        """
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+            return False
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next message; returns None if ``timeout`` passes first."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+class NotificationBroker:
+    """
+    In-process pub/sub for dashboard notifications, bridged across workers by PostgreSQL.
+
+    Publishers call ``publish`` inside the transaction that stores the notifications; it
+    issues ``pg_notify`` so the message goes out only if that transaction commits. Every
+    worker (including the publishing one) LISTENs on ``channel`` over one dedicated
+    connection and hands each message to its local subscribers, so no external broker
+    is needed. If the listening connection drops, messages sent meanwhile are lost, so
+    every subscriber is told to resync once it is back.
+    """
+
+    def __init__(self, channel: Optional[str] = None, max_pending: Optional[int] = None,
+                 reconnect_delay: Optional[float] = None):
+        self.channel = channel or settings.notification_stream_channel
+        self.max_pending = max_pending or settings.notification_stream_max_pending
+        self.reconnect_delay = reconnect_delay if reconnect_delay is not None else settings.notification_stream_reconnect_seconds
+        self.dropped = 0
+        self._subscribers: Dict[UUID, Set[Subscription]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._listening: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    def subscribe(self, user_id: UUID) -> Subscription:
+        subscription = Subscription(user_id, self.max_pending)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscribers.get(subscription.user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscribers[subscription.user_id]
+
+    def clear(self) -> None:
+        """Forget every local subscriber."""
+        self._subscribers.clear()
+
+    def deliver(self, user_ids: Iterable[UUID], message: Dict[str, Any]) -> int:
+        """Hand ``message`` to this worker's subscribers among ``user_ids``; returns how many got it."""
+        delivered = 0
+        for user_id in user_ids:
+            for subscription in self._subscribers.get(user_id, ()):
+                if subscription.offer(message):
+                    delivered += 1
+                else:
+                    self.dropped += 1
+        return delivered
+
+    def _resync_all(self) -> None:
+        for subscriptions in self._subscribers.values():
+            for subscription in subscriptions:
+                subscription.offer(RESYNC)
+
+    @classmethod
+    def _payloads(cls, user_ids: List[UUID], message: Dict[str, Any]) -> List[str]:
+        # Split the recipients so every payload fits in one NOTIFY
+        base = len(json.dumps({**message, "user_ids": []}, default=str))
+        per_payload = max(1, (MAX_NOTIFY_PAYLOAD - base) // 39)
+        return [
+            json.dumps({**message, "user_ids": [str(user_id) for user_id in user_ids[start:start + per_payload]]}, default=str)
+            for start in range(0, len(user_ids), per_payload)
+        ]
+
+    async def publish(self, session: AsyncSession, user_ids: List[UUID], message: Dict[str, Any]) -> None:
+        """Queue ``message`` for ``user_ids`` on every worker once ``session``'s transaction commits."""
+        for payload in self._payloads(user_ids, message):
+            await session.execute(select(func.pg_notify(self.channel, payload)))
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            user_ids = [UUID(user_id) for user_id in message.pop("user_ids")]
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring malformed notification payload: %s", e)
+            return
+        self.deliver(user_ids, message)
+
+    async def run(self, dsn: str):
+        first = True
+        while not self._stopping.is_set():
+            lost = asyncio.Event()
+            connection = None
+            try:
+                connection = await asyncpg.connect(dsn)
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(self.channel, self._on_notify)
+                if not first:
+                    self._resync_all()
+                first = False
+                self._listening.set()
+                stopping = asyncio.ensure_future(self._stopping.wait())
+                dropped = asyncio.ensure_future(lost.wait())
+                await asyncio.wait({stopping, dropped}, return_when=asyncio.FIRST_COMPLETED)
+                stopping.cancel()
+                dropped.cancel()
+            except Exception as e:
+                logger.error("Notification listener connection failed: %s", e)
+                first = False
+            finally:
+                self._listening.clear()
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            if not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.reconnect_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self, database_url: str):
+        if self._task is None:
+            dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+            self._stopping = asyncio.Event()
+            self._listening = asyncio.Event()
+            self._task = asyncio.create_task(self.run(dsn))
+
+    async def wait_listening(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the LISTEN connection is up; returns False if ``timeout`` passes first."""
+        try:
+            await asyncio.wait_for(self._listening.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def stop(self):
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
+
+# The process-wide broker the notification stream subscribes to
+notification_broker = NotificationBroker()
+metrics.gauge("notification_stream_subscribers", "Open live notification streams", callback=lambda: len(notification_broker))
+metrics.counter("notification_stream_dropped_total", "Live notifications dropped for clients that fell behind", callback=lambda: notification_broker.dropped)
@@ -0,0 +1,161 @@
+from builtins import classmethod, int, len, str
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import and_, func, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.email_outbox_model import EmailOutbox
+from app.models.event_model import Event, EventRegistration
+from app.models.notification_model import Notification, NotificationKind
+from app.models.user_model import NotificationPreference, User
+from app.services.notification_broker import notification_broker
+from app.utils.cursor_pagination import encode_cursor
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+class NotificationService:
+    @classmethod
+    def _wants_email(cls):
+        """SQL predicate for registrants who should get the update by email."""
+        return and_(
+            User.opted_in(NotificationPreference.EVENT_UPDATES_EMAIL),
+            User.email_verified.is_(True),
+            User.is_locked.is_(False),
+        )
+
+    @classmethod
+    async def _registrant_chunk(cls, session: AsyncSession, event_id: UUID, after_user_id: Optional[UUID], limit: int):
+        # Registrants who opted out of both channels are dropped by one bitwise test on the users row
+        query = (
+            select(
+                User.id, User.email, User.first_name,
+                User.opted_in(NotificationPreference.EVENT_UPDATES_DASHBOARD).label("wants_dashboard"),
+                cls._wants_email().label("wants_email"),
+            )
+            .join(EventRegistration, EventRegistration.user_id == User.id)
+            .where(
+                EventRegistration.event_id == event_id,
+                User.opted_in(NotificationPreference.EVENT_UPDATES_EMAIL | NotificationPreference.EVENT_UPDATES_DASHBOARD),
+            )
+            .order_by(EventRegistration.user_id)
+            .limit(limit)
+        )
+        if after_user_id is not None:
+            query = query.where(EventRegistration.user_id > after_user_id)
+        result = await session.execute(query)
+        return result.all()
+
+    @classmethod
+    async def fan_out_event_update(cls, session: AsyncSession, event: Event, message: str,
+                                   chunk_size: Optional[int] = None,
+                                   progress: Optional[Callable[[int, int, UUID], None]] = None,
+                                   resume_after: Optional[UUID] = None) -> int:
+        """
+        Notify the registrants of ``event`` on their dashboard and by email, as each has opted in.
+
+        Registrants are read in keyset chunks of ``chunk_size`` ordered by user id (a range
+        scan on the registrations unique index), so memory stays flat however large the
+        event is. Each chunk is written with one multi-row insert into ``notifications``
+        (plus one UPDATE bumping the recipients' unread counters and a NOTIFY for their
+        live streams) and one into ``email_outbox`` and committed on its own;
+        ``progress(done, total, last_user_id)`` is called after every chunk's commit. If a run is interrupted, pass
+        the last ``last_user_id`` it reported as ``resume_after`` to continue without
+        notifying anyone twice.
+        Returns the number of registrants notified; ``total`` is the event's registration
+        count, so it over-counts by however many registrants opted out of event updates.
+        """
+        chunk_size = chunk_size or settings.notification_fanout_chunk_size
+        total = event.registered_count
+        title = f"Update: {event.title}"[:200]
+        event_url = f"{settings.server_base_url}events/{event.id}"
+        processed, after_user_id = 0, resume_after
+        while True:
+            rows = await cls._registrant_chunk(session, event.id, after_user_id, chunk_size)
+            if not rows:
+                break
+            notifications = [
+                {"user_id": row.id, "kind": NotificationKind.EVENT_UPDATE, "title": title, "body": message, "event_id": event.id}
+                for row in rows if row.wants_dashboard
+            ]
+            if notifications:
+                await session.execute(insert(Notification), notifications)
+                # Rows come in user id order, so concurrent fan-outs lock users in the same order
+                await session.execute(
+                    update(User)
+                    .where(User.id.in_([notification["user_id"] for notification in notifications]))
+                    .values(unread_notification_count=User.unread_notification_count + 1)
+                )
+                await notification_broker.publish(session, [notification["user_id"] for notification in notifications], {
+                    "type": "notification", "kind": NotificationKind.EVENT_UPDATE.value, "title": title, "event_id": str(event.id),
+                })
+            emails = [
+                {"email_type": "event_update", "recipient": row.email, "context": {
+                    "email": row.email, "name": row.first_name or "there", "event_title": event.title,
+                    "message": message, "event_url": event_url,
+                }}
+                for row in rows if row.wants_email
+            ]
+            if emails:
+                await session.execute(insert(EmailOutbox), emails)
+            await session.commit()
+            processed += len(rows)
+            after_user_id = rows[-1].id
+            logger.info("Event %s update fan-out: %s/%s registrants notified (last user %s)",
+                        event.id, processed, total, after_user_id)
+            if progress is not None:
+                progress(processed, total, after_user_id)
+            if len(rows) < chunk_size:
+                break
+        return processed
+
+    @classmethod
+    async def list_for_user(cls, session: AsyncSession, user_id: UUID, limit: int = 20,
+                            after: Optional[Tuple[datetime, UUID]] = None,
+                            unread_only: bool = False) -> Tuple[List[Notification], Optional[str]]:
+        """
+        Page through a user's dashboard notifications, newest first.
+
+        ``after`` is the ``(created_at, id)`` of the last notification on the previous page.
+        Returns the notifications and the cursor for the next page, or None on the last page.
+        """
+        query = select(Notification).where(Notification.user_id == user_id)
+        if unread_only:
+            query = query.where(Notification.read_at.is_(None))
+        if after is not None:
+            query = query.where(tuple_(Notification.created_at, Notification.id) < tuple_(*after))
+        query = query.order_by(Notification.created_at.desc(), Notification.id.desc()).limit(limit + 1)
+        result = await session.execute(query)
+        notifications = result.scalars().all()
+        if len(notifications) > limit:
+            notifications = notifications[:limit]
+            return notifications, encode_cursor(notifications[-1].created_at.isoformat(), notifications[-1].id)
+        return notifications, None
+
+    @classmethod
+    async def mark_read(cls, session: AsyncSession, user_id: UUID, notification_ids: List[UUID]) -> Optional[int]:
+        """
+        Mark the user's notifications in ``notification_ids`` as read, in one statement.
+
+        Only rows that belong to the user and are still unread are touched, and the unread
+        counter drops by exactly that many, so repeated or overlapping calls keep it right.
+        Returns the user's new unread count, or None if the user does not exist.
+        """
+        marked = (
+            update(Notification)
+            .where(Notification.user_id == user_id, Notification.id.in_(notification_ids), Notification.read_at.is_(None))
+            .values(read_at=func.now())
+            .returning(Notification.id)
+            .cte("marked")
+        )
+        query = (
+            update(User)
+            .where(User.id == user_id)
+            .values(unread_notification_count=User.unread_notification_count
+                    - select(func.count()).select_from(marked).scalar_subquery())
+            .returning(User.unread_notification_count)
+        )
+        result = await session.execute(query)
+        await session.commit()
+        return result.scalar()
@@ -0,0 +1,160 @@
+from builtins import Exception, classmethod, float, int, len, min, str, zip
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.email_outbox_model import EmailOutbox, OutboxStatus
+from app.services.email_service import EmailService
+from app.utils.metrics import metrics
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+email_outbox_sent = metrics.counter("email_outbox_sent_total", "Outbox emails delivered by this worker")
+email_outbox_failed = metrics.counter("email_outbox_failed_total", "Outbox delivery attempts that failed")
+email_outbox_pending = metrics.gauge("email_outbox_pending", "Outbox emails waiting to be delivered, as of the last scrape")
+
+class OutboxService:
+    @classmethod
+    async def claim_batch(cls, session: AsyncSession, batch_size: int, lease_seconds: float) -> List[EmailOutbox]:
+        """
+        Claim up to ``batch_size`` due emails for this worker.
+
+        ``FOR UPDATE SKIP LOCKED`` lets several workers claim concurrently without waiting
+        on each other. Claimed rows stay PENDING but their ``available_at`` is pushed out by
+        the lease, so rows held by a worker that dies are picked up again once it expires.
+        """
+        now = datetime.now(timezone.utc)
+        query = (
+            select(EmailOutbox)
+            .where(EmailOutbox.status == OutboxStatus.PENDING, EmailOutbox.available_at <= now)
+            .order_by(EmailOutbox.available_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await session.execute(query)
+        entries = result.scalars().all()
+        lease_until = now + timedelta(seconds=lease_seconds)
+        for entry in entries:
+            entry.attempts += 1
+            entry.available_at = lease_until
+        await session.commit()
+        return entries
+
+    @classmethod
+    def retry_delay(cls, attempts: int) -> float:
+        """Exponential backoff in seconds before the next delivery attempt."""
+        return min(settings.outbox_retry_base_seconds * 2 ** (attempts - 1), settings.outbox_retry_max_seconds)
+
+    @classmethod
+    async def mark_sent(cls, session: AsyncSession, entry_ids: List[UUID]):
+        if not entry_ids:
+            return
+        query = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(entry_ids))
+            .values(status=OutboxStatus.SENT, sent_at=func.now(), last_error=None)
+        )
+        await session.execute(query)
+        await session.commit()
+
+    @classmethod
+    async def mark_failed(cls, session: AsyncSession, entry: EmailOutbox, error: str, max_attempts: int):
+        """Schedule a retry with backoff, or give up once ``max_attempts`` is reached."""
+        values = {"last_error": error[:500]}
+        if entry.attempts >= max_attempts:
+            values["status"] = OutboxStatus.FAILED
+        else:
+            values["available_at"] = datetime.now(timezone.utc) + timedelta(seconds=cls.retry_delay(entry.attempts))
+        query = update(EmailOutbox).where(EmailOutbox.id == entry.id).values(**values)
+        await session.execute(query)
+        await session.commit()
+
+    @classmethod
+    async def pending_count(cls, session: AsyncSession) -> int:
+        """Number of emails still waiting to be delivered."""
+        query = select(func.count()).select_from(EmailOutbox).where(EmailOutbox.status == OutboxStatus.PENDING)
+        result = await session.execute(query)
+        return result.scalar()
+
+
+class OutboxWorker:
+    """
+    Background task that drains the email outbox.
+
+    Each pass claims a batch, sends the emails through the shared EmailService and
+    records the outcome. At most ``concurrency`` emails (the SMTP pool size by default)
+    are in flight at once, so the rest of the batch waits here rather than queueing on
+    the pool, where a checkout timeout would count as a failed delivery attempt.
+    """
+
+    def __init__(self, session_factory, email_service: EmailService,
+                 batch_size: Optional[int] = None, poll_interval: Optional[float] = None,
+                 max_attempts: Optional[int] = None, lease_seconds: Optional[float] = None,
+                 concurrency: Optional[int] = None):
+        self.session_factory = session_factory
+        self.email_service = email_service
+        self.batch_size = batch_size or settings.outbox_batch_size
+        self.poll_interval = poll_interval if poll_interval is not None else settings.outbox_poll_interval_seconds
+        self.max_attempts = max_attempts or settings.outbox_max_attempts
+        self.lease_seconds = lease_seconds or settings.outbox_lease_seconds
+        self.concurrency = concurrency or settings.smtp_pool_size
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+    async def _send(self, entry: EmailOutbox) -> Optional[str]:
+        try:
+            await self.email_service.send_user_email(entry.context, entry.email_type)
+            return None
+        except Exception as e:
+            return str(e) or e.__class__.__name__
+
+    async def run_once(self) -> int:
+        """Claim and deliver one batch; returns the number of emails processed."""
+        async with self.session_factory() as session:
+            entries = await OutboxService.claim_batch(session, self.batch_size, self.lease_seconds)
+            if not entries:
+                return 0
+            slots = asyncio.Semaphore(self.concurrency)
+
+            async def send(entry: EmailOutbox) -> Optional[str]:
+                async with slots:
+                    return await self._send(entry)
+
+            errors = await asyncio.gather(*(send(entry) for entry in entries))
+            sent = [entry.id for entry, error in zip(entries, errors) if error is None]
+            await OutboxService.mark_sent(session, sent)
+            email_outbox_sent.inc(amount=len(sent))
+            for entry, error in zip(entries, errors):
+                if error is not None:
+                    logger.warning("Outbox delivery of %s to %s failed (attempt %s): %s",
+                                   entry.email_type, entry.recipient, entry.attempts, error)
+                    await OutboxService.mark_failed(session, entry, error, self.max_attempts)
+                    email_outbox_failed.inc()
+            return len(entries)
+
+    async def run(self):
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error("Outbox worker pass failed: %s", e)
+                processed = 0
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._stopping.set()
+            await self._task
+            self._task = None
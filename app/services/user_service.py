@@ -1,17 +1,21 @@
-from builtins import Exception, bool, classmethod, int, str
-from datetime import datetime, timezone
+from builtins import Exception, bool, classmethod, dict, int, str
+from datetime import datetime, timedelta, timezone
 import secrets
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from pydantic import ValidationError
-from sqlalchemy import func, null, update, select
+from sqlalchemy import and_, func, null, update, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies import get_email_service, get_settings
-from app.models.user_model import User
+from app.models.audit_log_model import AuditAction
+from app.models.user_model import NotificationPreference, User, normalize_email, notification_preferences_as_dict
 from app.schemas.user_schemas import UserCreate, UserUpdate
+from app.utils.cursor_pagination import encode_cursor
 from app.utils.nickname_gen import generate_nickname
 from app.utils.security import generate_verification_token, hash_password, verify_password
+from app.utils.tracing import trace_classmethods
 from uuid import UUID
+from app.services.audit_service import audit_log
 from app.services.email_service import EmailService
 from app.models.user_model import UserRole
 import logging
@@ -19,6 +23,7 @@ import logging
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+@trace_classmethods
 class UserService:
     @classmethod
     async def _execute_query(cls, session: AsyncSession, query):
@@ -27,7 +32,7 @@ class UserService:
             await session.commit()
             return result
         except SQLAlchemyError as e:
-            logger.error(f"Database error: {e}")
+            logger.error("Database error: %s", e)
             await session.rollback()
             return None
 
@@ -47,7 +52,9 @@ class UserService:
 
     @classmethod
     async def get_by_email(cls, session: AsyncSession, email: str) -> Optional[User]:
-        return await cls._fetch_user(session, email=email)
+        query = select(User).where(User.email_matches(email))
+        result = await cls._execute_query(session, query)
+        return result.scalars().first() if result else None
 
     @classmethod
     async def create(cls, session: AsyncSession, user_data: Dict[str, str], email_service: EmailService) -> Optional[User]:
@@ -65,12 +72,13 @@ class UserService:
                 new_nickname = generate_nickname()
             new_user.nickname = new_nickname
             session.add(new_user)
+            await session.flush()  # Assigns the id used in the verification link
+            email_service.enqueue_verification_email(session, new_user)
             await session.commit()
-            await email_service.send_verification_email(new_user)
-            
+
             return new_user
         except ValidationError as e:
-            logger.error(f"Validation error during user creation: {e}")
+            logger.error("Validation error during user creation: %s", e)
             return None
 
     @classmethod
@@ -81,36 +89,108 @@ class UserService:
 
             if 'password' in validated_data:
                 validated_data['hashed_password'] = hash_password(validated_data.pop('password'))
+            if validated_data.get('email'):
+                # Core updates bypass the model's normalizing validator
+                validated_data['email'] = normalize_email(validated_data['email'])
             query = update(User).where(User.id == user_id).values(**validated_data).execution_options(synchronize_session="fetch")
             await cls._execute_query(session, query)
             updated_user = await cls.get_by_id(session, user_id)
             if updated_user:
                 session.refresh(updated_user)  # Explicitly refresh the updated user object
-                logger.info(f"User {user_id} updated successfully.")
+                logger.info("User %s updated successfully.", user_id)
                 return updated_user
             else:
-                logger.error(f"User {user_id} not found after update attempt.")
+                logger.error("User %s not found after update attempt.", user_id)
             return None
         except Exception as e:  # Broad exception handling for debugging
-            logger.error(f"Error during user update: {e}")
+            logger.error("Error during user update: %s", e)
             return None
 
     @classmethod
-    async def delete(cls, session: AsyncSession, user_id: UUID) -> bool:
+    async def delete(cls, session: AsyncSession, user_id: UUID, actor: Optional[str] = None) -> bool:
         user = await cls.get_by_id(session, user_id)
         if not user:
-            logger.info(f"User with ID {user_id} not found.")
+            logger.info("User with ID %s not found.", user_id)
             return False
+        details = {"email": user.email, "role": user.role.name}
         await session.delete(user)
         await session.commit()
+        audit_log.record(AuditAction.USER_DELETED, user_id, actor, **details)
         return True
 
+    @classmethod
+    async def change_role(cls, session: AsyncSession, user_id: UUID, new_role: UserRole, actor: Optional[str] = None) -> Optional[User]:
+        """
+        Give a user a different role and record the change in the audit trail.
+
+        :param actor: Who made the change, as identified by their access token.
+        :return: The updated user, or None if the user does not exist.
+        """
+        user = await cls.get_by_id(session, user_id)
+        if not user:
+            return None
+        old_role = user.role
+        if old_role != new_role:
+            user.role = new_role
+            await session.commit()
+            audit_log.record(AuditAction.ROLE_CHANGED, user.id, actor, old_role=old_role.name, new_role=new_role.name)
+        return user
+
+    @classmethod
+    async def set_professional_status(cls, session: AsyncSession, user_id: UUID, is_professional: bool, actor: Optional[str] = None) -> Optional[User]:
+        """Upgrade a user to professional status (or revoke it) and record the change in the audit trail."""
+        user = await cls.get_by_id(session, user_id)
+        if not user:
+            return None
+        if user.is_professional != is_professional:
+            user.update_professional_status(is_professional)
+            await session.commit()
+            await session.refresh(user)
+            audit_log.record(AuditAction.PROFESSIONAL_STATUS_CHANGED, user.id, actor, is_professional=is_professional)
+        return user
+
     @classmethod
     async def list_users(cls, session: AsyncSession, skip: int = 0, limit: int = 10) -> List[User]:
         query = select(User).offset(skip).limit(limit)
         result = await cls._execute_query(session, query)
         return result.scalars().all() if result else []
 
+    @classmethod
+    async def _triage_page(cls, session: AsyncSession, condition, sort_column, limit: int,
+                           after: Optional[Tuple[datetime, UUID]], descending: bool = False) -> Tuple[List[User], Optional[str]]:
+        # Keyset on (sort_column, id), the key of the matching partial index, in either direction
+        query = select(User).where(condition)
+        if after is not None:
+            key = tuple_(sort_column, User.id)
+            query = query.where(key < tuple_(*after) if descending else key > tuple_(*after))
+        order = (sort_column.desc(), User.id.desc()) if descending else (sort_column, User.id)
+        result = await session.execute(query.order_by(*order).limit(limit + 1))
+        users = result.scalars().all()
+        if len(users) > limit:
+            users = users[:limit]
+            return users, encode_cursor(getattr(users[-1], sort_column.key).isoformat(), users[-1].id)
+        return users, None
+
+    @classmethod
+    async def list_locked(cls, session: AsyncSession, limit: int = 20,
+                          after: Optional[Tuple[datetime, UUID]] = None) -> Tuple[List[User], Optional[str]]:
+        """Page through locked accounts, most recently changed (usually: locked) first."""
+        return await cls._triage_page(session, User.locked(), User.updated_at, limit, after, descending=True)
+
+    @classmethod
+    async def list_unverified(cls, session: AsyncSession, older_than: timedelta, limit: int = 20,
+                              after: Optional[Tuple[datetime, UUID]] = None) -> Tuple[List[User], Optional[str]]:
+        """Page through accounts still unverified ``older_than`` after registering, oldest first."""
+        cutoff = datetime.now(timezone.utc) - older_than
+        condition = and_(User.unverified(), User.created_at < cutoff)
+        return await cls._triage_page(session, condition, User.created_at, limit, after)
+
+    @classmethod
+    async def list_pro_candidates(cls, session: AsyncSession, limit: int = 20,
+                                  after: Optional[Tuple[datetime, UUID]] = None) -> Tuple[List[User], Optional[str]]:
+        """Page through users who could be upgraded to professional (see ``User.pro_candidate``), longest-standing first."""
+        return await cls._triage_page(session, User.pro_candidate(), User.created_at, limit, after)
+
     @classmethod
     async def register_user(cls, session: AsyncSession, user_data: Dict[str, str], get_email_service) -> Optional[User]:
         return await cls.create(session, user_data, get_email_service)
@@ -132,10 +212,13 @@ class UserService:
                 return user
             else:
                 user.failed_login_attempts += 1
-                if user.failed_login_attempts >= settings.max_login_attempts:
+                locked = user.failed_login_attempts >= settings.max_login_attempts
+                if locked:
                     user.is_locked = True
                 session.add(user)
                 await session.commit()
+                if locked:
+                    audit_log.record(AuditAction.ACCOUNT_LOCKED, user.id, reason="too many failed login attempts")
         return None
 
     @classmethod
@@ -149,11 +232,14 @@ class UserService:
         hashed_password = hash_password(new_password)
         user = await cls.get_by_id(session, user_id)
         if user:
+            was_locked = user.is_locked
             user.hashed_password = hashed_password
             user.failed_login_attempts = 0  # Resetting failed login attempts
             user.is_locked = False  # Unlocking the user account, if locked
             session.add(user)
             await session.commit()
+            if was_locked:
+                audit_log.record(AuditAction.ACCOUNT_UNLOCKED, user.id, reason="password reset")
             return True
         return False
 
@@ -161,11 +247,15 @@ class UserService:
     async def verify_email_with_token(cls, session: AsyncSession, user_id: UUID, token: str) -> bool:
         user = await cls.get_by_id(session, user_id)
         if user and user.verification_token == token:
+            old_role = user.role
             user.email_verified = True
             user.verification_token = None  # Clear the token once used
             user.role = UserRole.AUTHENTICATED
             session.add(user)
             await session.commit()
+            if old_role != UserRole.AUTHENTICATED:
+                audit_log.record(AuditAction.ROLE_CHANGED, user.id, old_role=old_role.name,
+                                 new_role=UserRole.AUTHENTICATED.name, reason="email verified")
             return True
         return False
 
@@ -183,12 +273,40 @@ class UserService:
         return count
     
     @classmethod
-    async def unlock_user_account(cls, session: AsyncSession, user_id: UUID) -> bool:
+    async def unlock_user_account(cls, session: AsyncSession, user_id: UUID, actor: Optional[str] = None) -> bool:
         user = await cls.get_by_id(session, user_id)
         if user and user.is_locked:
             user.is_locked = False
             user.failed_login_attempts = 0  # Optionally reset failed login attempts
             session.add(user)
             await session.commit()
+            audit_log.record(AuditAction.ACCOUNT_UNLOCKED, user.id, actor)
             return True
-        return False
\ No newline at end of file
+        return False
+
+    @classmethod
+    async def update_notification_preferences(cls, session: AsyncSession, user_id: UUID, changes: Dict[str, bool]) -> Optional[Dict[str, bool]]:
+        """
+        Switch notification preferences on or off, leaving the ones not in ``changes`` alone.
+
+        :param changes: Preference names (e.g. ``"event_updates_email"``) mapped to the new setting.
+        :return: All of the user's preferences after the update, or None if the user does not exist.
+        """
+        enable = disable = 0
+        for name, enabled in changes.items():
+            if enabled is None:
+                continue
+            if enabled:
+                enable |= NotificationPreference[name.upper()]
+            else:
+                disable |= NotificationPreference[name.upper()]
+        # Set and clear the bits in one statement so concurrent updates to other preferences are not lost
+        query = (
+            update(User)
+            .where(User.id == user_id)
+            .values(notification_preferences=User.notification_preferences.op("|")(enable).op("&")(~disable))
+            .returning(User.notification_preferences)
+        )
+        result = await cls._execute_query(session, query)
+        mask = result.scalar() if result else None
+        return notification_preferences_as_dict(mask) if mask is not None else None
@@ -1,16 +1,132 @@
+from builtins import dict, getattr, len, list, set, str
+from contextvars import ContextVar
+import copy
+from datetime import datetime, timezone
+import json
+import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import re
+import sys
+from typing import Optional
+from uuid import uuid4
 from app.dependencies import get_settings
 
 settings = get_settings()
+
+# Id of the request being handled in the current task, attached to every log record
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes every LogRecord has; anything else on a record came from ``extra=``
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "request_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+class RequestIdFilter(logging.Filter):
+    """Stamps records with the current request id; runs on the emitting task, where the id is known."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with any ``extra=`` fields passed to the log call."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge the arguments into the message here, but leave layout to the listener's formatter;
+        # tracebacks are rendered now because exc_info cannot cross to the listener thread safely
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
 def setup_logging():
     """
-    Sets up logging for the application using a configuration file.
-    This ensures standardized logging across the entire application.
+    Sets up logging for the application.
+
+    Handlers come from ``logging.conf``, or a single JSON-lines stdout handler when
+    ``settings.log_json`` is on. Either way they are moved behind a ``QueueHandler``:
+    a log call on the event loop only enqueues the record, and a ``QueueListener``
+    thread does the formatting and the blocking writes.
+    """
+    global _listener
+    stop_logging()
+    root = logging.getLogger()
+    if settings.log_json:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(JsonFormatter())
+        root.handlers = [handler]
+        root.setLevel(settings.log_level.upper())
+    else:
+        # Construct the path to 'logging.conf', assuming it's in the project's root.
+        logging_config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'logging.conf')
+        # Normalize the path to handle any '..' correctly.
+        normalized_path = os.path.normpath(logging_config_path)
+        # Apply the logging configuration.
+        logging.config.fileConfig(normalized_path, disable_existing_loggers=False)
+    handlers = list(root.handlers)
+    queue_handler = _LogQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(RequestIdFilter())
+    root.handlers = [queue_handler]
+    _listener = logging.handlers.QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+def stop_logging():
+    """Writes out queued records and stops the listener thread started by ``setup_logging``."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+class RequestIdMiddleware:
+    """
+    Gives every HTTP request an id for its log records and echoes it in ``X-Request-ID``.
+
+    A well-formed ``X-Request-ID`` sent by the client or a proxy is kept, so one id can be
+    followed across services; anything else is replaced with a fresh one.
     """
-    # Construct the path to 'logging.conf', assuming it's in the project's root.
-    logging_config_path = os.path.join(os.path.dirname(__file__), '..', '..', 'logging.conf')
-    # Normalize the path to handle any '..' correctly.
-    normalized_path = os.path.normpath(logging_config_path)
-    # Apply the logging configuration.
-    logging.config.fileConfig(normalized_path, disable_existing_loggers=False)
\ No newline at end of file
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        incoming = dict(scope.get("headers", [])).get(b"x-request-id", b"").decode("latin-1")
+        request_id = incoming if _REQUEST_ID_PATTERN.match(incoming) else uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,24 @@
+from builtins import ValueError, str
+import base64
+import json
+from typing import List, Optional
+
+
+def encode_cursor(*values) -> str:
+    """Encode the sort key of the last row on a page as an opaque, URL-safe cursor."""
+    raw = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[List[str]]:
+    """Decode a cursor produced by ``encode_cursor``; raises ValueError if it is malformed."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
@@ -0,0 +1,137 @@
+from builtins import bool, dict, list, open, str
+import io
+import os
+import time
+from typing import Optional
+from uuid import uuid4
+from app.services.jwt_service import decode_token
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+REPORT_HEADER = b"x-profile-report"
+PROFILE_MODES = ("cprofile", "tracemalloc")
+
+def _requested_mode(scope) -> Optional[str]:
+    headers = dict(scope.get("headers", []))
+    mode = headers.get(PROFILE_HEADER, b"").decode("latin-1").strip().lower()
+    return mode if mode in PROFILE_MODES else None
+
+def _is_allowed(scope) -> bool:
+    if settings.debug:
+        return True
+    authorization = dict(scope.get("headers", [])).get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    payload = decode_token(token)
+    return payload is not None and payload.get("role") == "ADMIN"
+
+def _write_report(mode: str, scope, text: str) -> str:
+    os.makedirs(settings.profile_output_dir, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{mode}-{uuid4().hex[:8]}.txt"
+    path = os.path.join(settings.profile_output_dir, name)
+    with open(path, "w") as report:
+        report.write(f"{scope['method']} {scope['path']}\n\n{text}")
+    return name
+
+class ProfilingMiddleware:
+    """
+    Profiles a single request on demand.
+
+    A request carrying ``X-Profile: cprofile`` or ``X-Profile: tracemalloc`` from an admin
+    token (or any request in debug mode) is run under cProfile, or between two
+    tracemalloc snapshots, and the report is written to ``settings.profile_output_dir``;
+    its file name comes back in ``X-Profile-Report``. Everything else passes straight
+    through at the cost of one header lookup.
+
+    Both profilers see the whole process, not just this request: other requests running
+    concurrently on the event loop show up in the report too, so profile on a quiet
+    instance. Only one profile runs at a time; a second request asking for one while
+    another is running is served unprofiled with ``X-Profile-Report: busy``. The response
+    is held back until the report is written, so streaming endpoints cannot be profiled.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._busy = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode = _requested_mode(scope)
+        if mode is None or not _is_allowed(scope):
+            await self.app(scope, receive, send)
+            return
+        if self._busy:
+            await self.app(scope, receive, self._with_report_header(send, "busy"))
+            return
+        self._busy = True
+        try:
+            if mode == "cprofile":
+                await self._cprofile(scope, receive, send)
+            else:
+                await self._tracemalloc(scope, receive, send)
+        finally:
+            self._busy = False
+
+    def _with_report_header(self, send, value: str):
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [(REPORT_HEADER, value.encode("latin-1"))]
+            await send(message)
+        return send_wrapper
+
+    async def _run_buffered(self, scope, receive, send):
+        # Hold the response until the profile is written so its name can go in a header
+        messages = []
+
+        async def collect(message):
+            messages.append(message)
+
+        await self.app(scope, receive, collect)
+        return messages
+
+    async def _replay(self, messages, send, report: str):
+        send_with_header = self._with_report_header(send, report)
+        for message in messages:
+            await send_with_header(message)
+
+    async def _cprofile(self, scope, receive, send):
+        # The profilers are imported on first use; almost no process ever needs them
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            messages = await self._run_buffered(scope, receive, send)
+        finally:
+            profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(settings.profile_report_lines)
+        report = _write_report("cprofile", scope, output.getvalue())
+        logger.info("Profiled %s %s into %s", scope["method"], scope["path"], report)
+        await self._replay(messages, send, report)
+
+    async def _tracemalloc(self, scope, receive, send):
+        import tracemalloc
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start(settings.profile_tracemalloc_frames)
+        try:
+            before = tracemalloc.take_snapshot()
+            messages = await self._run_buffered(scope, receive, send)
+            after = tracemalloc.take_snapshot()
+        finally:
+            if started_here:
+                tracemalloc.stop()
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>")]
+        differences = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        lines = [str(difference) for difference in differences[:settings.profile_report_lines]]
+        report = _write_report("tracemalloc", scope, "Allocation growth during the request, largest first:\n" + "\n".join(lines) + "\n")
+        logger.info("Traced allocations of %s %s into %s", scope["method"], scope["path"], report)
+        await self._replay(messages, send, report)
@@ -0,0 +1,123 @@
+from builtins import dict, getattr, isinstance, list, str, tuple, type
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+from typing import Any, List, Optional
+from sqlalchemy import event
+from app.utils.metrics import metrics
+from app.utils.tracing import tracer
+from settings.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+db_queries_per_request = metrics.histogram(
+    "db_queries_per_request", "SQL statements executed while handling one request", ("route",),
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100),
+)
+db_time_per_request_seconds = metrics.histogram("db_time_per_request_seconds", "Time spent in SQL statements per request", ("route",))
+db_slow_queries_total = metrics.counter("db_slow_queries_total", "SQL statements slower than slow_query_threshold_ms")
+
+class QueryStats:
+    """Statements executed in one request (or one ``count_queries`` block) and the time they took."""
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self, record_statements: bool = False):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Optional[List[str]] = [] if record_statements else None
+
+# The stats of the request or block running in the current task, if any
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace every bound value with its type name, so slow-query logs never carry user data."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) if isinstance(value, (dict, list, tuple)) else type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+    context._query_span = tracer.start_span("db.query", statement=statement[:500], executemany=executemany)
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    tracer.end_span(context._query_span)
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+        if stats.statements is not None:
+            stats.statements.append(statement)
+    threshold = settings.slow_query_threshold_ms
+    if threshold > 0 and elapsed * 1000 >= threshold:
+        db_slow_queries_total.inc()
+        logger.warning("Slow query (%.1f ms): %s; parameters: %s", elapsed * 1000, statement,
+                       "<executemany>" if executemany else redact_parameters(parameters))
+
+def instrument_engine(engine) -> None:
+    """Count and time every statement ``engine`` (sync or async) executes."""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+@contextmanager
+def count_queries():
+    """
+    Collect the statements executed inside the block, in this task and tasks it starts.
+
+        with count_queries() as stats:
+            await UserService.create(session, data, email_service)
+        assert stats.count <= 5
+    """
+    stats = QueryStats(record_statements=True)
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+class QueryStatsMiddleware:
+    """
+    Pure ASGI middleware that counts the SQL statements each request executes.
+
+    The totals go into the ``db_queries_per_request`` and ``db_time_per_request_seconds``
+    histograms, labelled by route template. With ``expose_headers`` (by default, when
+    ``settings.debug`` is on) the response also carries ``X-DB-Query-Count`` and ``X-DB-Time-Ms``; statements run
+    after the response headers were sent (e.g. while streaming) are not in those headers.
+    """
+
+    def __init__(self, app, expose_headers: Optional[bool] = None):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+        expose_headers = settings.debug if self.expose_headers is None else self.expose_headers
+
+        async def send_wrapper(message):
+            if expose_headers and message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-db-query-count", str(stats.count).encode("latin-1")),
+                    (b"x-db-time-ms", f"{stats.duration * 1000:.1f}".encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            path = getattr(scope.get("route"), "path", None) or "unmatched"
+            db_queries_per_request.observe(stats.count, path)
+            db_time_per_request_seconds.observe(stats.duration, path)
@@ -0,0 +1,29 @@
+from builtins import float, int, max
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Async rate limiter that spaces calls ``1 / rate`` seconds apart, allowing short bursts.
+
+    Each ``acquire`` reserves the next free slot before awaiting, so no lock is needed and
+    one instance can be shared by every coroutine (and event loop) in the process.
+    A ``rate`` of zero or less disables limiting.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._next_slot = 0.0
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        interval = 1.0 / self.rate
+        now = time.monotonic()
+        # Unused capacity accumulates only up to `burst` calls.
+        slot = max(self._next_slot, now - (self.burst - 1) * interval)
+        self._next_slot = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -3,6 +3,7 @@ from builtins import Exception, ValueError, bool, int, str
 import secrets
 import bcrypt
 from logging import getLogger
+from app.utils.tracing import tracer
 
 # Set up logging
 logger = getLogger(__name__)
@@ -23,7 +24,8 @@ def hash_password(password: str, rounds: int = 12) -> str:
     """
     try:
         salt = bcrypt.gensalt(rounds=rounds)
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
+        with tracer.span("bcrypt.hashpw", rounds=rounds):
+            hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed_password.decode('utf-8')
     except Exception as e:
         logger.error("Failed to hash password: %s", e)
@@ -44,7 +46,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         ValueError: If the hashed password format is incorrect or the function fails to verify.
     """
     try:
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+        with tracer.span("bcrypt.checkpw"):
+            return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
     except Exception as e:
         logger.error("Error verifying password: %s", e)
         raise ValueError("Authentication process encountered an unexpected error") from e
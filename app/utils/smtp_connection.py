@@ -1,31 +1,147 @@
 # smtp_client.py
-from builtins import Exception, int, str
+from builtins import Exception, bool, float, int, str
+import asyncio
+import queue
 import smtplib
+import threading
+from typing import Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from app.utils.tracing import tracer
 from settings.config import settings
 import logging
 
+logger = logging.getLogger(__name__)
+
 class SMTPClient:
-    def __init__(self, server: str, port: int, username: str, password: str):
+    """
+    Long-lived SMTP client that keeps a small pool of authenticated connections.
+
+    The blocking ``smtplib`` calls run in worker threads so the event loop is never
+    blocked, and each pooled connection is reused for many messages so STARTTLS and
+    login are paid once per connection instead of once per email. A connection that
+    drops is replaced transparently and the message is retried once on the new one.
+
+    Senders queue for a connection on an ``asyncio.Semaphore`` before a thread is
+    involved, so at most ``pool_size`` executor threads are ever busy with SMTP however
+    many sends are waiting. ``checkout_timeout`` bounds that wait (None waits as long as
+    it takes) and is independent of the socket ``timeout``.
+    """
+
+    def __init__(self, server: str, port: int, username: str, password: str,
+                 use_tls: bool = True, pool_size: int = 2, timeout: float = 10.0,
+                 max_messages_per_connection: int = 100, checkout_timeout: Optional[float] = None):
         self.server = server
         self.port = port
         self.username = username
         self.password = password
+        self.use_tls = use_tls
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.LifoQueue()
+        self._slots = asyncio.Semaphore(pool_size)
+        self._sent_on = {}
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP connection."""
+        connection = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                connection.starttls()  # Use TLS
+            if self.username:
+                connection.login(self.username, self.password)
+        except Exception:
+            self._close_quietly(connection)
+            raise
+        with self._lock:
+            self.connections_opened += 1
+            self._sent_on[id(connection)] = 0
+        logger.debug("Opened SMTP connection to %s:%s", self.server, self.port)
+        return connection
 
-    def send_email(self, subject: str, html_content: str, recipient: str):
+    def _close_quietly(self, connection: smtplib.SMTP):
+        with self._lock:
+            self._sent_on.pop(id(connection), None)
         try:
-            message = MIMEMultipart('alternative')
-            message['Subject'] = subject
-            message['From'] = self.username
-            message['To'] = recipient
-            message.attach(MIMEText(html_content, 'html'))
-
-            with smtplib.SMTP(self.server, self.port) as server:
-                server.starttls()  # Use TLS
-                server.login(self.username, self.password)
-                server.sendmail(self.username, recipient, message.as_string())
-            logging.info(f"Email sent to {recipient}")
+            connection.quit()
+        except Exception:
+            connection.close()
+
+    def _checkout(self) -> smtplib.SMTP:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _release(self, connection: smtplib.SMTP):
+        with self._lock:
+            self._sent_on[id(connection)] = self._sent_on.get(id(connection), 0) + 1
+            worn_out = self._sent_on[id(connection)] >= self.max_messages_per_connection
+        if worn_out:
+            self._close_quietly(connection)
+        else:
+            self._idle.put(connection)
+
+    def _build_message(self, subject: str, html_content: str, recipient: str) -> str:
+        message = MIMEMultipart('alternative')
+        message['Subject'] = subject
+        message['From'] = self.username
+        message['To'] = recipient
+        message.attach(MIMEText(html_content, 'html'))
+        return message.as_string()
+
+    def _deliver(self, subject: str, html_content: str, recipient: str):
+        """Send one message over a pooled connection; runs in a worker thread holding a pool slot."""
+        payload = self._build_message(subject, html_content, recipient)
+        connection = self._checkout()
+        try:
+            connection.sendmail(self.username, recipient, payload)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            # The pooled connection went stale; reconnect and retry once.
+            self._close_quietly(connection)
+            connection = self._connect()
+            try:
+                connection.sendmail(self.username, recipient, payload)
+            except Exception:
+                self._close_quietly(connection)
+                raise
+        except Exception:
+            self._close_quietly(connection)
+            raise
+        self._release(connection)
+
+    async def send_email(self, subject: str, html_content: str, recipient: str):
+        try:
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout=self.checkout_timeout)
+            except asyncio.TimeoutError:
+                raise smtplib.SMTPException("Timed out waiting for a free SMTP connection")
+            try:
+                with tracer.span("smtp.send", recipient_domain=recipient.rpartition("@")[2]):
+                    await asyncio.to_thread(self._deliver, subject, html_content, recipient)
+            finally:
+                self._slots.release()
+            logger.info("Email sent to %s", recipient)
         except Exception as e:
-            logging.error(f"Failed to send email: {str(e)}")
+            logger.error("Failed to send email: %s", e)
             raise
+
+    def _drain(self):
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close_quietly(connection)
+
+    async def close(self):
+        """Close every idle pooled connection."""
+        await asyncio.to_thread(self._drain)
+
+    @property
+    def idle_connections(self) -> int:
+        return self._idle.qsize()
@@ -1,11 +1,16 @@
-import markdown2
+import html
+import os
 from pathlib import Path
+from string import Formatter
 
 class TemplateManager:
-    def __init__(self):
+    _FIELD_MARKER = 'TMPLFIELD{}END'
+
+    def __init__(self, templates_dir: Path = None):
         # Dynamically determine the root path of the project
         self.root_dir = Path(__file__).resolve().parent.parent.parent  # Adjust this depending on the structure
-        self.templates_dir = self.root_dir / 'email_templates'
+        self.templates_dir = Path(templates_dir) if templates_dir else self.root_dir / 'email_templates'
+        self._compiled = {}
 
     def _read_template(self, filename: str) -> str:
         """Private method to read template content."""
@@ -32,15 +37,58 @@ class TemplateManager:
                 styled_html = styled_html.replace(f'<{tag}>', f'<{tag} style="{style}">')
         return styled_html
 
-    def render_template(self, template_name: str, **context) -> str:
-        """Render a markdown template with given context, applying advanced email styles."""
-        header = self._read_template('header.md')
-        footer = self._read_template('footer.md')
+    def _source_mtimes(self, template_name: str) -> tuple:
+        return tuple(
+            os.stat(self.templates_dir / filename).st_mtime_ns
+            for filename in ('header.md', 'footer.md', f'{template_name}.md')
+        )
 
-        # Read main template and format it with provided context
-        main_template = self._read_template(f'{template_name}.md')
-        main_content = main_template.format(**context)
+    def _compile(self, template_name: str) -> str:
+        """
+        Turn header, body and footer into one styled HTML format string.
+
+        Each ``{placeholder}`` in the body is swapped for a plain-text marker that markdown
+        leaves untouched, the document is converted and styled once, and the markers are
+        then turned back into format fields so only substitution is left at send time.
+        """
+        fields = []
+        marked_parts = []
+        for literal, field_name, spec, conversion in Formatter().parse(self._read_template(f'{template_name}.md')):
+            marked_parts.append(literal.replace('{', '{{').replace('}', '}}'))
+            if field_name is not None:
+                field = field_name + (f'!{conversion}' if conversion else '') + (f':{spec}' if spec else '')
+                marked_parts.append(self._FIELD_MARKER.format(len(fields)))
+                fields.append(field)
+        # Literal braces are escaped above so they survive the final str.format unchanged
+        main_content = ''.join(marked_parts)
+        header = self._read_template('header.md').replace('{', '{{').replace('}', '}}')
+        footer = self._read_template('footer.md').replace('{', '{{').replace('}', '}}')
 
         full_markdown = f"{header}\n{main_content}\n{footer}"
-        html_content = markdown2.markdown(full_markdown)
-        return self._apply_email_styles(html_content)
+        # Imported on first compile: markdown2 is a sizeable import that only email sending needs
+        import markdown2
+        compiled = self._apply_email_styles(markdown2.markdown(full_markdown))
+        for index, field in enumerate(fields):
+            compiled = compiled.replace(self._FIELD_MARKER.format(index), '{' + field + '}')
+        return compiled
+
+    def get_compiled_template(self, template_name: str) -> str:
+        """Return the compiled template, recompiling if any source file changed on disk."""
+        mtimes = self._source_mtimes(template_name)
+        cached = self._compiled.get(template_name)
+        if cached is None or cached[0] != mtimes:
+            cached = (mtimes, self._compile(template_name))
+            self._compiled[template_name] = cached
+        return cached[1]
+
+    def precompile(self) -> list:
+        """Compile every template in the templates directory ahead of first use; returns their names."""
+        names = sorted(path.stem for path in self.templates_dir.glob('*.md') if path.stem not in ('header', 'footer'))
+        for name in names:
+            self.get_compiled_template(name)
+        return names
+
+    def render_template(self, template_name: str, **context) -> str:
+        """Render a markdown template with given context, applying advanced email styles."""
+        escaped = {key: html.escape(value) if isinstance(value, str) else value for key, value in context.items()}
+        return self.get_compiled_template(template_name).format(**escaped)
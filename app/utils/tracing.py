@@ -0,0 +1,198 @@
+from builtins import BaseException, classmethod, getattr, isinstance, list, open, round, setattr, str, type, vars
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import functools
+import inspect
+import json
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional
+from settings.config import settings
+
+class Span:
+    """One timed operation; spans of a request share a ``trace_id`` and point at their parent."""
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start", "duration", "attributes", "_started")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start = time.time()
+        self.duration: Optional[float] = None
+        self.attributes = attributes
+        self._started = time.perf_counter()
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name, "trace_id": self.trace_id, "span_id": self.span_id, "parent_id": self.parent_id,
+            "start": self.start, "duration_ms": round(self.duration * 1000, 3), "attributes": self.attributes,
+        }
+
+class InMemoryExporter:
+    """Keeps the most recent finished spans, for tests and for inspecting a running process."""
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def trace(self, trace_id: str) -> List[Span]:
+        return [span for span in self.spans if span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+    def close(self) -> None:
+        pass
+
+class FileExporter:
+    """Appends finished spans to ``path`` as JSON lines from a background thread, so exporting never blocks the event loop."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        self._queue.put(span.to_dict())
+
+    def _write(self):
+        with open(self.path, "a") as output:
+            while True:
+                entry = self._queue.get()
+                if entry is None:
+                    return
+                output.write(json.dumps(entry, default=str) + "\n")
+                if self._queue.empty():
+                    output.flush()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+# Sentinel for "inside a request that was not sampled": children are skipped without a coin toss
+_UNSAMPLED = object()
+_current_span: ContextVar[Any] = ContextVar("current_span", default=None)
+
+class Tracer:
+    """
+    Records parent/child spans for sampled requests.
+
+    The sampling decision is taken once, when a root span starts: a trace is recorded
+    whole or not at all, and spans inside an unsampled trace cost one ContextVar lookup.
+    With ``sample_rate`` 0 (the default) tracing is off.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, exporter=None):
+        self.sample_rate = sample_rate
+        self.exporter = exporter or InMemoryExporter()
+
+    def start_span(self, name: str, **attributes: Any) -> Optional[Span]:
+        """Start a span under the current one without making it current; finish it with ``end_span``."""
+        parent = _current_span.get()
+        if parent is None or parent is _UNSAMPLED:
+            return None
+        return Span(name, parent.trace_id, parent.span_id, attributes)
+
+    def end_span(self, span: Optional[Span]) -> None:
+        if span is not None:
+            span.duration = time.perf_counter() - span._started
+            self.exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, root: bool = False, **attributes: Any):
+        """
+        Time the block as a child of the current span. With ``root`` a new trace starts
+        here (subject to sampling) when no span is active; otherwise nothing is recorded
+        outside a trace. Yields the span, or None when it is not being recorded.
+        """
+        parent = _current_span.get()
+        if parent is _UNSAMPLED or (parent is None and not root):
+            yield None
+            return
+        if parent is None and (self.sample_rate <= 0 or random.random() >= self.sample_rate):
+            token = _current_span.set(_UNSAMPLED)
+            try:
+                yield None
+            finally:
+                _current_span.reset(token)
+            return
+        span = Span(name, parent.trace_id if parent else os.urandom(16).hex(), parent.span_id if parent else None, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+def configure_tracer() -> Tracer:
+    """Point ``tracer`` at the exporter and sample rate from settings."""
+    tracer.exporter.close()
+    tracer.sample_rate = settings.trace_sample_rate
+    tracer.exporter = FileExporter(settings.trace_file) if settings.trace_exporter == "file" else InMemoryExporter()
+    return tracer
+
+# The process-wide tracer
+tracer = Tracer()
+
+def traced(name: str):
+    """Decorate a coroutine function so each call is a span named ``name``."""
+    def decorator(function):
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            with tracer.span(name):
+                return await function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def trace_classmethods(cls):
+    """Class decorator: every async classmethod of ``cls`` becomes a span named ``Class.method``."""
+    for attribute, value in list(vars(cls).items()):
+        if isinstance(value, classmethod) and inspect.iscoroutinefunction(value.__func__):
+            setattr(cls, attribute, classmethod(traced(f"{cls.__name__}.{attribute}")(value.__func__)))
+    return cls
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware that opens the root span of every sampled HTTP request.
+
+    The span is named after the matched route template once routing is done, and carries
+    the method and response status.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with tracer.span(f"HTTP {scope['method']}", root=True, method=scope["method"]) as span:
+            if span is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    span.set(status=message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None) or "unmatched"
+                span.name = f"HTTP {scope['method']} {route}"
+                span.set(route=route)
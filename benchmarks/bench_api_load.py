@@ -0,0 +1,202 @@
+"""
+Benchmark: end-to-end load test of the user API.
+
+Drives a weighted mix of ``POST /register/``, ``POST /login/``, ``GET /users/`` and
+``GET /users/{id}`` against a running server from ``--concurrency`` async clients, and
+reports throughput and p50/p95/p99 latency per endpoint.
+
+Before the run it seeds ``--users`` verified accounts and one admin straight into the
+database the server uses (DATABASE_URL), and logs the admin in for the authenticated
+endpoints; everything it creates, including accounts registered during the run, is
+deleted afterwards. The sequence of requests is drawn up front from ``--seed``, so two
+runs with the same arguments send the same mix in the same order; compare releases on
+the same machine, database size and server settings (workers, pool size, bcrypt rounds).
+
+Usage:
+    uvicorn app.main:app --port 8000 &
+    python -m benchmarks.bench_api_load [--base-url http://localhost:8000] [--requests 2000]
+        [--concurrency 20] [--mix register=1,login=2,list_users=4,get_user=8] [--output load.json]
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from typing import Dict, List
+import httpx
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.email_outbox_model import EmailOutbox
+from app.models.user_model import User, UserRole
+from app.utils.security import hash_password
+from settings.config import settings
+
+ENDPOINTS = ("register", "login", "list_users", "get_user")
+DEFAULT_MIX = "register=1,login=2,list_users=4,get_user=8"
+PASSWORD = "LoadTest123!"
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """``"register=1,login=2"`` -> ``{"register": 1.0, "login": 2.0}``; unknown endpoints are an error."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {name!r}; expected one of {', '.join(ENDPOINTS)}")
+        weights[name] = float(weight or 1)
+    if not any(weights.values()):
+        raise ValueError("The mix needs at least one endpoint with a positive weight")
+    return weights
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize(samples: Dict[str, List[float]], errors: Dict[str, int], elapsed: float) -> dict:
+    endpoints = {}
+    for name, latencies in samples.items():
+        ordered = sorted(latencies)
+        endpoints[name] = {
+            "requests": len(ordered),
+            "errors": errors.get(name, 0),
+            "per_second": len(ordered) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "p95_ms": percentile(ordered, 95) * 1000,
+            "p99_ms": percentile(ordered, 99) * 1000,
+            "max_ms": ordered[-1] * 1000 if ordered else 0.0,
+        }
+    total = sum(len(latencies) for latencies in samples.values())
+    return {"seconds": elapsed, "requests": total, "per_second": total / elapsed if elapsed else 0.0, "endpoints": endpoints}
+
+
+async def _seed(session: AsyncSession, run_id: str, users: int) -> List[uuid.UUID]:
+    hashed = hash_password(PASSWORD)
+    rows = [
+        {"nickname": f"load_{run_id}_{key}", "email": f"load_{run_id}_{key}@example.com", "first_name": "Load", "last_name": "Test",
+         "hashed_password": hashed, "role": UserRole.ADMIN if key == "admin" else UserRole.AUTHENTICATED,
+         "email_verified": True, "is_locked": False}
+        for key in [*range(users), "admin"]
+    ]
+    user_ids = (await session.execute(insert(User).returning(User.id), rows)).scalars().all()
+    await session.commit()
+    return list(user_ids[:-1])
+
+
+async def _cleanup(session: AsyncSession, run_id: str):
+    await session.execute(delete(EmailOutbox).where(EmailOutbox.recipient.like(f"load_{run_id}_%")))
+    await session.execute(delete(User).where(User.email.like(f"load_{run_id}_%")))
+    await session.commit()
+
+
+class LoadTest:
+    """One run: the planned request sequence, the shared client and the collected latencies."""
+
+    def __init__(self, client: httpx.AsyncClient, run_id: str, user_ids: List[uuid.UUID], admin_token: str, seed: int):
+        self.client = client
+        self.run_id = run_id
+        self.user_ids = user_ids
+        self.admin_headers = {"Authorization": f"Bearer {admin_token}"}
+        self.random = random.Random(seed)
+        self.registered = 0
+        self.samples: Dict[str, List[float]] = {name: [] for name in ENDPOINTS}
+        self.errors: Dict[str, int] = {}
+
+    def _request(self, name: str):
+        # Arguments are drawn here, in plan order, so they do not depend on task scheduling
+        if name == "register":
+            self.registered += 1
+            key = f"load_{self.run_id}_r{self.registered}"
+            return "POST", "/register/", {"json": {"email": f"{key}@example.com", "nickname": key, "password": PASSWORD}}
+        if name == "login":
+            index = self.random.randrange(len(self.user_ids))
+            return "POST", "/login/", {"data": {"username": f"load_{self.run_id}_{index}@example.com", "password": PASSWORD}}
+        if name == "list_users":
+            skip = self.random.randrange(0, max(1, len(self.user_ids) - 10))
+            return "GET", "/users/", {"params": {"skip": skip, "limit": 10}, "headers": self.admin_headers}
+        return "GET", f"/users/{self.random.choice(self.user_ids)}", {"headers": self.admin_headers}
+
+    def plan(self, mix: Dict[str, float], requests: int) -> list:
+        names = [name for name in mix if mix[name] > 0]
+        return [(name, *self._request(name)) for name in self.random.choices(names, [mix[name] for name in names], k=requests)]
+
+    async def _worker(self, queue: asyncio.Queue, record: bool):
+        while not queue.empty():
+            name, method, url, options = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, **options)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            if record:
+                self.samples[name].append(time.perf_counter() - started)
+                if failed:
+                    self.errors[name] = self.errors.get(name, 0) + 1
+
+    async def execute(self, planned: list, concurrency: int, record: bool = True) -> float:
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in planned:
+            queue.put_nowait(item)
+        started = time.perf_counter()
+        await asyncio.gather(*(self._worker(queue, record) for _ in range(concurrency)))
+        return time.perf_counter() - started
+
+
+async def run(base_url: str = "http://localhost:8000", requests: int = 2000, concurrency: int = 20,
+              mix: str = DEFAULT_MIX, users: int = 200, warmup: int = 100, seed: int = 1) -> dict:
+    weights = parse_mix(mix)
+    engine = create_async_engine(settings.database_url)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    run_id = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with session_factory() as session:
+        user_ids = await _seed(session, run_id, users)
+        try:
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+                login = await client.post("/login/", data={"username": f"load_{run_id}_admin@example.com", "password": PASSWORD})
+                login.raise_for_status()
+                load_test = LoadTest(client, run_id, user_ids, login.json()["access_token"], seed)
+                # Warm connections, caches and the server's pool before anything is measured
+                await load_test.execute(load_test.plan(weights, warmup), concurrency, record=False)
+                elapsed = await load_test.execute(load_test.plan(weights, requests), concurrency)
+        finally:
+            await _cleanup(session, run_id)
+    await engine.dispose()
+    result = summarize({name: load_test.samples[name] for name in weights}, load_test.errors, elapsed)
+    result["config"] = {"base_url": base_url, "requests": requests, "concurrency": concurrency, "mix": weights,
+                        "users": users, "warmup": warmup, "seed": seed}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Relative weights per endpoint")
+    parser.add_argument("--users", type=int, default=200, help="Verified accounts to seed for login and lookups")
+    parser.add_argument("--warmup", type=int, default=100, help="Unmeasured requests sent first")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+    result = asyncio.run(run(args.base_url, args.requests, args.concurrency, args.mix, args.users, args.warmup, args.seed))
+    print(f"{'endpoint':<12} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, stats in result["endpoints"].items():
+        print(f"{name:<12} {stats['requests']:>9} {stats['errors']:>7} {stats['per_second']:>9.1f} {stats['p50_ms']:>9.1f} "
+              f"{stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+    print(f"total: {result['requests']} requests in {result['seconds']:.2f} s ({result['per_second']:.1f} req/s)")
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(result, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: email delivery throughput against a local in-process SMTP sink.
+
+For each concurrency level, sends a batch of messages either straight through
+``SMTPClient.send_email`` ("smtp" mode) or through ``EmailService.send_user_email``
+including template rendering and rate limiting ("service" mode), and reports messages
+per second, SMTP connections opened and per-message latency percentiles.
+Runs fully offline.
+
+Usage:
+    python -m benchmarks.bench_email_throughput [--messages 500] [--levels 1,2,4,8,16]
+        [--mode service] [--pool-size N] [--sink-delay-ms 0]
+"""
+import argparse
+import asyncio
+import time
+from app.services.email_service import EmailService
+from app.utils.rate_limiter import RateLimiter
+from app.utils.smtp_connection import SMTPClient
+from app.utils.template_manager import TemplateManager
+from benchmarks.smtp_sink import SMTPSink
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _make_service(sink: SMTPSink, pool_size: int) -> EmailService:
+    service = EmailService(template_manager=TemplateManager())
+    service.smtp_client = SMTPClient(sink.host, sink.port, "bench@example.com", "secret", use_tls=False, pool_size=pool_size)
+    service.rate_limiter = RateLimiter(0)
+    return service
+
+
+async def run_level(sink: SMTPSink, mode: str, concurrency: int, messages: int, pool_size: int = None) -> dict:
+    """Send ``messages`` emails with ``concurrency`` concurrent senders and measure the run."""
+    service = _make_service(sink, pool_size or concurrency)
+    smtp_client = service.smtp_client
+    delivered_before = len(sink.messages)
+    connections_before = sink.connections
+    latencies = []
+    counter = iter(range(messages))
+
+    async def sender():
+        for i in counter:
+            context = {"email": f"user{i}@example.com", "name": f"User {i}", "verification_url": f"http://localhost/verify/{i}"}
+            started = time.perf_counter()
+            if mode == "smtp":
+                await smtp_client.send_email("Benchmark", "<p>benchmark</p>", context["email"])
+            else:
+                await service.send_user_email(context, "email_verification")
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(sender() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await service.close()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "messages": messages,
+        "delivered": len(sink.messages) - delivered_before,
+        "connections": sink.connections - connections_before,
+        "messages_per_second": messages / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def run(levels=(1, 2, 4, 8, 16), messages: int = 500, mode: str = "service",
+              pool_size: int = None, sink_delay: float = 0.0) -> list:
+    with SMTPSink(delay=sink_delay) as sink:
+        return [await run_level(sink, mode, level, messages, pool_size) for level in levels]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--levels", default="1,2,4,8,16", help="comma separated concurrency levels")
+    parser.add_argument("--mode", choices=("smtp", "service"), default="service")
+    parser.add_argument("--pool-size", type=int, default=None, help="SMTP pool size (defaults to the concurrency level)")
+    parser.add_argument("--sink-delay-ms", type=float, default=0.0, help="simulated provider latency per message")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.levels.split(",")]
+    results = asyncio.run(run(levels, args.messages, args.mode, args.pool_size, args.sink_delay_ms / 1000))
+    print(f"{'conc':>5} {'msg/s':>10} {'conns':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for result in results:
+        print(f"{result['concurrency']:>5} {result['messages_per_second']:>10,.0f} {result['connections']:>6} "
+              f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Micro-benchmarks for the helpers on the request hot path.
+
+Each case is timed with ``timeit``: the loop count is chosen so one repetition takes at
+least ``--min-time`` seconds, the repetition is run ``--repeat`` times, and the fastest
+repetition is kept as the per-call time (the least disturbed by the rest of the machine).
+
+``run`` prints the timings and, with ``--output``, writes them as JSON. ``compare`` runs
+the suite again (or loads ``--current``) and checks it against a baseline file, exiting
+with status 1 when any case got slower by more than ``--threshold``. Timings only compare
+meaningfully on the machine that produced the baseline: refresh ``benchmarks/baseline.json``
+with ``run --output`` after changing hardware or Python version. Sub-microsecond to
+microsecond cases can move by 20% or more between runs on a busy machine, so rerun a
+flagged case (``compare --only <name> --repeat 15``) before trusting the flag.
+
+Usage:
+    python -m benchmarks.bench_micro run [--output benchmarks/baseline.json] [--only token nickname]
+    python -m benchmarks.bench_micro compare [--baseline benchmarks/baseline.json] [--threshold 0.25]
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from starlette.requests import Request
+from app.main import app
+from app.models.user_model import User, UserRole
+from app.schemas.user_schemas import UserResponse
+from app.services.jwt_service import create_access_token, decode_token
+from app.utils.link_generation import create_user_links, generate_pagination_links
+from app.utils.nickname_gen import generate_nickname
+from app.utils.security import hash_password, verify_password
+from app.utils.template_manager import TemplateManager
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+BCRYPT_ROUNDS = (4, 8, 12)
+
+
+def _request(path: str = "/users/", query_string: bytes = b"skip=20&limit=10") -> Request:
+    return Request({
+        "type": "http", "app": app, "router": app.router, "method": "GET", "scheme": "http",
+        "server": ("localhost", 8000), "root_path": "", "path": path, "query_string": query_string,
+        "headers": [(b"host", b"localhost:8000")],
+    })
+
+
+def _user() -> User:
+    return User(
+        id=uuid.uuid4(), email="john.doe@example.com", nickname="john_doe", first_name="John", last_name="Doe",
+        bio="Experienced software developer.", profile_picture_url="https://example.com/profile.jpg",
+        linkedin_profile_url="https://linkedin.com/in/johndoe", github_profile_url="https://github.com/johndoe",
+        role=UserRole.AUTHENTICATED, is_professional=False,
+    )
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """The benchmarked calls by name; setup (hashes, tokens, compiled templates) happens here, untimed."""
+    suite: Dict[str, Callable[[], object]] = {}
+    for rounds in BCRYPT_ROUNDS:
+        hashed = hash_password("SecurePassword123!", rounds=rounds)
+        suite[f"hash_password[rounds={rounds}]"] = lambda rounds=rounds: hash_password("SecurePassword123!", rounds=rounds)
+        suite[f"verify_password[rounds={rounds}]"] = lambda hashed=hashed: verify_password("SecurePassword123!", hashed)
+
+    claims = {"sub": "john.doe@example.com", "role": "AUTHENTICATED"}
+    token = create_access_token(data=claims)
+    suite["create_access_token"] = lambda: create_access_token(data=claims)
+    suite["decode_token"] = lambda: decode_token(token)
+
+    template_manager = TemplateManager()
+    context = {"name": "John", "email": "john.doe@example.com", "verification_url": "http://localhost/verify-email/1/token"}
+    template_manager.render_template("email_verification", **context)
+    suite["render_template[email_verification]"] = lambda: template_manager.render_template("email_verification", **context)
+
+    suite["generate_nickname"] = generate_nickname
+
+    request, user_id = _request(), uuid.uuid4()
+    suite["create_user_links"] = lambda: create_user_links(user_id, request)
+    suite["generate_pagination_links"] = lambda: generate_pagination_links(request, 20, 10, 1000)
+
+    user = _user()
+    response = UserResponse.model_validate(user)
+    suite["UserResponse.model_validate"] = lambda: UserResponse.model_validate(user)
+    suite["UserResponse.model_dump_json"] = response.model_dump_json
+    return suite
+
+
+def measure(function: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    timer = timeit.Timer(function)
+    number = 1
+    # Same growth as Timer.autorange, but up to min_time rather than a fixed 0.2 s
+    while timer.timeit(number) < min_time:
+        number *= 10 if number < 1000 else 2
+    per_call = sorted(total / number for total in timer.repeat(repeat=repeat, number=number))
+    return {"best_us": per_call[0] * 1e6, "median_us": per_call[len(per_call) // 2] * 1e6, "loops": number}
+
+
+def run(only: Optional[List[str]] = None, repeat: int = 5, min_time: float = 0.2, echo: bool = False) -> dict:
+    results = {}
+    for name, function in cases().items():
+        if only and not any(part in name for part in only):
+            continue
+        results[name] = measure(function, repeat, min_time)
+        if echo:
+            print(f"{name:<40} {results[name]['best_us']:>14,.2f} us  (median {results[name]['median_us']:,.2f}, {results[name]['loops']} loops)")
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25) -> Tuple[List[str], List[str]]:
+    """
+    Compare best per-call times case by case.
+
+    Returns ``(report_lines, regressions)``; a case regresses when it is more than
+    ``threshold`` (0.25 = 25%) slower than in the baseline. Cases present in only one of
+    the two runs are reported but never count as regressions.
+    """
+    lines, regressions = [], []
+    for name in sorted(set(baseline["results"]) | set(current["results"])):
+        before, after = baseline["results"].get(name), current["results"].get(name)
+        if before is None or after is None:
+            lines.append(f"{name:<40} {'new case' if before is None else 'missing from current run'}")
+            continue
+        change = after["best_us"] / before["best_us"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        lines.append(f"{name:<40} {before['best_us']:>12,.2f} -> {after['best_us']:>12,.2f} us  {change:+7.1%}{flag}")
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name in ("run", "compare"):
+        command = commands.add_parser(name)
+        command.add_argument("--only", nargs="*", help="Only cases whose name contains one of these strings")
+        command.add_argument("--repeat", type=int, default=5)
+        command.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repetition")
+    commands.choices["run"].add_argument("--output", type=Path, help="Write the results to this JSON file")
+    commands.choices["compare"].add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    commands.choices["compare"].add_argument("--current", type=Path, help="Compare this results file instead of running the suite")
+    commands.choices["compare"].add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.command == "run":
+        result = run(args.only, args.repeat, args.min_time, echo=True)
+        if args.output:
+            args.output.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n")
+            print(f"wrote {args.output}")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text()) if args.current else run(args.only, args.repeat, args.min_time)
+    if args.only and args.current is None:
+        baseline = {**baseline, "results": {k: v for k, v in baseline["results"].items() if k in current["results"]}}
+    print(f"baseline: {baseline['created_at']} (Python {baseline['python']}, {baseline['machine']})")
+    lines, regressions = compare(baseline, current, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: event update fan-out to a large audience.
+
+Seeds one approved event with N registrants in the configured database, runs
+``NotificationService.fan_out_event_update`` and reports wall time, registrants per second
+and peak Python memory (tracemalloc). Everything it creates is deleted afterwards.
+Needs a migrated PostgreSQL database (DATABASE_URL).
+
+Usage:
+    python -m benchmarks.bench_notification_fanout [--registrants 50000] [--chunk-size 1000]
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.email_outbox_model import EmailOutbox
+from app.models.event_model import Event, EventRegistration, EventStatus
+from app.models.user_model import User, UserRole
+from app.services.notification_service import NotificationService
+from settings.config import settings
+
+
+async def _seed(session: AsyncSession, run_id: str, registrants: int, batch: int = 5000) -> Event:
+    event = Event(title=f"Fan-out benchmark {run_id}", starts_at=datetime.now(timezone.utc) + timedelta(days=30),
+                  capacity=registrants, registered_count=registrants, status=EventStatus.APPROVED)
+    session.add(event)
+    await session.flush()
+    for start in range(0, registrants, batch):
+        users = [
+            {"nickname": f"bench_{run_id}_{i}", "email": f"bench_{run_id}_{i}@example.com", "first_name": "Bench",
+             "hashed_password": "x", "role": UserRole.AUTHENTICATED, "email_verified": True, "is_locked": False}
+            for i in range(start, min(start + batch, registrants))
+        ]
+        user_ids = (await session.execute(insert(User).returning(User.id), users)).scalars().all()
+        await session.execute(insert(EventRegistration), [{"event_id": event.id, "user_id": user_id} for user_id in user_ids])
+    await session.commit()
+    return event
+
+
+async def _cleanup(session: AsyncSession, run_id: str, event: Event):
+    await session.execute(delete(EmailOutbox).where(EmailOutbox.recipient.like(f"bench_{run_id}_%")))
+    await session.execute(delete(User).where(User.nickname.like(f"bench_{run_id}_%")))
+    await session.execute(delete(Event).where(Event.id == event.id))
+    await session.commit()
+
+
+async def run(registrants: int = 50_000, chunk_size: int = 1000) -> dict:
+    engine = create_async_engine(settings.database_url)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    run_id = uuid.uuid4().hex[:8]
+    async with session_factory() as session:
+        event = await _seed(session, run_id, registrants)
+        try:
+            tracemalloc.start()
+            started = time.perf_counter()
+            notified = await NotificationService.fan_out_event_update(
+                session, event, "Benchmark update.", chunk_size=chunk_size,
+                progress=lambda done, total, last_user_id: print(f"  {done}/{total}", end="\r"),
+            )
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        finally:
+            await _cleanup(session, run_id, event)
+    await engine.dispose()
+    return {
+        "registrants": notified,
+        "chunk_size": chunk_size,
+        "seconds": elapsed,
+        "per_second": notified / elapsed if elapsed else 0.0,
+        "peak_mib": peak / (1024 * 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--registrants", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+    result = asyncio.run(run(args.registrants, args.chunk_size))
+    print()
+    print(f"registrants notified: {result['registrants']}")
+    print(f"chunk size:           {result['chunk_size']}")
+    print(f"wall time:            {result['seconds']:.2f} s ({result['per_second']:,.0f}/s)")
+    print(f"peak Python memory:   {result['peak_mib']:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
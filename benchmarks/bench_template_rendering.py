@@ -0,0 +1,62 @@
+"""
+Benchmark: email template rendering throughput.
+
+Renders the verification email for a batch of distinct recipients and reports renders
+per second, along with the one-off cost of compiling the template.
+
+Usage:
+    python -m benchmarks.bench_template_rendering [--recipients 10000] [--template email_verification]
+"""
+import argparse
+import time
+from app.utils.template_manager import TemplateManager
+
+
+def make_recipients(count: int):
+    return [
+        {
+            "name": f"User {i}",
+            "email": f"user{i}@example.com",
+            "verification_url": f"http://localhost/verify-email/{i:08d}/token{i}",
+        }
+        for i in range(count)
+    ]
+
+
+def run(recipients: int = 10_000, template: str = "email_verification") -> dict:
+    template_manager = TemplateManager()
+    batch = make_recipients(recipients)
+
+    started = time.perf_counter()
+    template_manager.get_compiled_template(template)
+    compile_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for context in batch:
+        template_manager.render_template(template, **context)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "template": template,
+        "recipients": recipients,
+        "compile_ms": compile_seconds * 1000,
+        "total_seconds": elapsed,
+        "renders_per_second": recipients / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recipients", type=int, default=10_000)
+    parser.add_argument("--template", default="email_verification")
+    args = parser.parse_args()
+    result = run(args.recipients, args.template)
+    print(f"template:          {result['template']}")
+    print(f"compile (cold):    {result['compile_ms']:.2f} ms")
+    print(f"recipients:        {result['recipients']}")
+    print(f"total:             {result['total_seconds']:.3f} s")
+    print(f"renders/second:    {result['renders_per_second']:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
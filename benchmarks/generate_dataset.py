@@ -0,0 +1,275 @@
+"""
+Synthetic dataset generator for scale testing.
+
+Fills ``users``, ``events`` and ``event_registrations`` with realistic rows, generated in
+streamed batches and loaded with COPY, so millions of rows take minutes rather than the
+hours the ORM would need. Nothing is held in memory beyond one batch: user ids are derived
+from ``(seed, row number)``, so registrations can point at users without remembering them.
+
+Output is deterministic: the same ``--seed``, counts, distributions and ``--now`` produce
+the same rows. Generated accounts use the ``--prefix`` in their email and nickname
+(``gen123@example.com``); ``--clean`` deletes an earlier dataset with that prefix first.
+
+Passwords are hashed once, up front: the account with row number ``i`` has the password
+``password_for(i)``, one of ``--password-pool`` distinct passwords, so load tests can log
+in as any generated user without millions of bcrypt calls here.
+
+Roles and states follow the application's rules: unverified accounts are ANONYMOUS (the
+role verification moves users out of), and the verified ones are spread over the
+``--roles`` weights. Locked accounts have used up their login attempts.
+
+Usage:
+    python -m benchmarks.generate_dataset [--users 1000000] [--events 20000] [--registrations-per-event 40]
+        [--roles AUTHENTICATED=0.9,MANAGER=0.08,ADMIN=0.02] [--unverified 0.05] [--locked 0.01]
+        [--professional 0.1] [--seed 42] [--batch-size 50000] [--clean]
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+import asyncpg
+from faker import Faker
+from sqlalchemy.engine import make_url
+from app.models.event_model import EventStatus, EventType
+from app.models.user_model import UserRole
+from app.utils.security import hash_password
+from settings.config import settings
+
+USER_COLUMNS = (
+    "id", "nickname", "email", "first_name", "last_name", "bio", "profile_picture_url", "linkedin_profile_url",
+    "github_profile_url", "role", "is_professional", "professional_status_updated_at", "last_login_at",
+    "failed_login_attempts", "is_locked", "created_at", "updated_at", "verification_token", "email_verified",
+    "hashed_password",
+)
+EVENT_COLUMNS = (
+    "id", "title", "description", "event_type", "location", "starts_at", "ends_at", "capacity", "registered_count",
+    "status", "created_by", "reviewed_by", "reviewed_at", "created_at", "updated_at",
+)
+REGISTRATION_COLUMNS = ("id", "event_id", "user_id", "created_at")
+
+DEFAULT_ROLES = "AUTHENTICATED=0.9,MANAGER=0.08,ADMIN=0.02"
+DEFAULT_EVENT_STATUSES = "APPROVED=0.8,PENDING=0.15,REJECTED=0.05"
+CITIES = ("Newark", "Jersey City", "Hoboken", "New York", "Princeton", "Philadelphia", "Remote")
+
+
+def parse_weights(text: str, choices) -> Dict[str, float]:
+    """``"ADMIN=0.02,MANAGER=0.08"`` -> ``{"ADMIN": 0.02, "MANAGER": 0.08}``, checked against ``choices``."""
+    weights = {}
+    for part in text.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in choices:
+            raise ValueError(f"Unknown value {name!r}; expected one of {', '.join(choices)}")
+        weights[name] = float(weight)
+    if not any(weights.values()):
+        raise ValueError("At least one weight must be positive")
+    return weights
+
+
+def row_id(seed: int, kind: str, number: int) -> uuid.UUID:
+    """A stable id for row ``number`` of ``kind``, so rows can reference each other by number alone."""
+    return uuid.UUID(bytes=hashlib.blake2b(f"{seed}:{kind}:{number}".encode(), digest_size=16).digest(), version=4)
+
+
+def password_for(number: int, pool: int = 16) -> str:
+    return f"Dataset{number % pool}!Pass"
+
+
+class DatasetGenerator:
+    """Streams the rows of one dataset; every ``*_batches`` method yields lists of COPY-ready tuples."""
+
+    def __init__(self, users: int, events: int = 0, registrations_per_event: int = 40, roles: str = DEFAULT_ROLES,
+                 event_statuses: str = DEFAULT_EVENT_STATUSES, unverified: float = 0.05, locked: float = 0.01,
+                 professional: float = 0.1, seed: int = 42, prefix: str = "gen", password_pool: int = 16,
+                 now: Optional[datetime] = None, batch_size: int = 50_000):
+        if not prefix.isalnum():
+            raise ValueError("The prefix must be letters and digits only")
+        self.users = users
+        self.events = events
+        self.registrations_per_event = registrations_per_event
+        self.roles = parse_weights(roles, [role.value for role in UserRole if role != UserRole.ANONYMOUS])
+        self.event_statuses = parse_weights(event_statuses, [status.value for status in EventStatus])
+        self.unverified = unverified
+        self.locked = locked
+        self.professional = professional
+        self.seed = seed
+        self.prefix = prefix
+        self.password_pool = password_pool
+        self.now = now or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.batch_size = batch_size
+        # Small pools drawn once from a seeded Faker; picking from them is far cheaper than Faker per row
+        fake = Faker()
+        fake.seed_instance(seed)
+        self.first_names = [fake.first_name() for _ in range(500)]
+        self.last_names = [fake.last_name() for _ in range(1000)]
+        self.bios = [fake.sentence(nb_words=12) for _ in range(200)]
+        self.titles = [fake.catch_phrase() for _ in range(500)]
+        self.descriptions = [fake.paragraph(nb_sentences=4) for _ in range(200)]
+        self._hashes: Optional[List[str]] = None
+        self._organizers: Optional[List[int]] = None
+
+    def hashes(self) -> List[str]:
+        if self._hashes is None:
+            self._hashes = [hash_password(password_for(number, self.password_pool)) for number in range(self.password_pool)]
+        return self._hashes
+
+    def _batches(self, rows: Iterator[tuple]) -> Iterator[List[tuple]]:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _user(self, rng: random.Random, number: int) -> Tuple[tuple, bool]:
+        verified = rng.random() >= self.unverified
+        role = rng.choices(list(self.roles), list(self.roles.values()))[0] if verified else UserRole.ANONYMOUS.value
+        locked = rng.random() < self.locked
+        professional = verified and rng.random() < self.professional
+        created_at = self.now - timedelta(seconds=rng.randrange(3 * 365 * 86400))
+        first_name, last_name = rng.choice(self.first_names), rng.choice(self.last_names)
+        handle = "".join(character for character in first_name + last_name if character.isalnum()).lower()
+        has_profile = rng.random() < 0.4
+        last_login_at = created_at + (self.now - created_at) * rng.random() if verified and rng.random() < 0.8 else None
+        row = (
+            row_id(self.seed, "user", number), f"{self.prefix}_{number}", f"{self.prefix}{number}@example.com",
+            first_name, last_name,
+            rng.choice(self.bios) if has_profile else None,
+            f"https://example.com/avatars/{number}.jpg" if has_profile else None,
+            f"https://linkedin.com/in/{handle}{number}" if has_profile else None,
+            f"https://github.com/{handle}{number}" if has_profile and rng.random() < 0.5 else None,
+            role, professional, created_at + timedelta(days=rng.randrange(1, 60)) if professional else None,
+            last_login_at, settings.max_login_attempts if locked else 0, locked, created_at, created_at,
+            None if verified else f"{rng.getrandbits(128):032x}", verified,
+            self.hashes()[number % self.password_pool],
+        )
+        return row, verified and role in ("MANAGER", "ADMIN")
+
+    def user_batches(self) -> Iterator[List[tuple]]:
+        rng = random.Random(f"{self.seed}:users")
+        self._organizers = []
+
+        def rows():
+            for number in range(self.users):
+                row, organizer = self._user(rng, number)
+                if organizer and len(self._organizers) < 10_000:
+                    self._organizers.append(number)
+                yield row
+
+        return self._batches(rows())
+
+    def _event(self, rng: random.Random, number: int) -> Tuple[tuple, int]:
+        status = rng.choices(list(self.event_statuses), list(self.event_statuses.values()))[0]
+        created_at = self.now - timedelta(seconds=rng.randrange(365 * 86400))
+        starts_at = self.now + timedelta(minutes=15 * rng.randrange(-90 * 96, 180 * 96))
+        capacity = rng.choice((10, 20, 25, 30, 50, 75, 100, 150, 200, 500))
+        registered = min(capacity, int(rng.expovariate(1 / self.registrations_per_event)), self.users) if status == "APPROVED" else 0
+        creator = row_id(self.seed, "user", rng.choice(self._organizers)) if self._organizers else None
+        reviewer = row_id(self.seed, "user", rng.choice(self._organizers)) if self._organizers and status != "PENDING" else None
+        row = (
+            row_id(self.seed, "event", number), rng.choice(self.titles), rng.choice(self.descriptions),
+            rng.choice([event_type.value for event_type in EventType]), rng.choice(CITIES),
+            starts_at, starts_at + timedelta(hours=rng.choice((1, 2, 3, 8))), capacity, registered, status,
+            creator, reviewer, created_at + timedelta(days=1) if reviewer else None, created_at, created_at,
+        )
+        return row, registered
+
+    def event_batches(self) -> Iterator[Tuple[List[tuple], List[tuple]]]:
+        """Yields ``(events, registrations)`` batch pairs; each event's registrations travel with it."""
+        if self._organizers is None:
+            raise RuntimeError("Generate the users before the events")
+        rng = random.Random(f"{self.seed}:events")
+        events, registrations = [], []
+        for number in range(self.events):
+            row, registered = self._event(rng, number)
+            events.append(row)
+            for user_number in rng.sample(range(self.users), registered):
+                registrations.append((
+                    uuid.UUID(int=rng.getrandbits(128), version=4), row[0], row_id(self.seed, "user", user_number),
+                    row[-1] + timedelta(seconds=rng.randrange(86400 * 30)),
+                ))
+            if len(events) >= self.batch_size or len(registrations) >= self.batch_size:
+                yield events, registrations
+                events, registrations = [], []
+        if events:
+            yield events, registrations
+
+
+async def load(connection: asyncpg.Connection, generator: DatasetGenerator, clean: bool = False, echo: bool = False) -> dict:
+    """Load the generated dataset in one transaction, then ANALYZE so the planner sees the new statistics."""
+    counts = {"users": 0, "events": 0, "event_registrations": 0}
+    started = time.perf_counter()
+
+    def progress(table: str):
+        if echo:
+            print(f"  {table}: {counts[table]:,} rows ({time.perf_counter() - started:.1f} s)", end="\r")
+
+    async with connection.transaction():
+        if clean:
+            # Registrations cascade with users, but events only lose their creator, so remove those first
+            pattern = f"^{generator.prefix}[0-9]+@example\\.com$"
+            await connection.execute("DELETE FROM events WHERE created_by IN (SELECT id FROM users WHERE email ~ $1)", pattern)
+            await connection.execute("DELETE FROM users WHERE email ~ $1", pattern)
+        for batch in generator.user_batches():
+            await connection.copy_records_to_table("users", records=batch, columns=USER_COLUMNS)
+            counts["users"] += len(batch)
+            progress("users")
+        for events, registrations in generator.event_batches():
+            await connection.copy_records_to_table("events", records=events, columns=EVENT_COLUMNS)
+            if registrations:
+                await connection.copy_records_to_table("event_registrations", records=registrations, columns=REGISTRATION_COLUMNS)
+            counts["events"] += len(events)
+            counts["event_registrations"] += len(registrations)
+            progress("events")
+    await connection.execute("ANALYZE users, events, event_registrations")
+    counts["seconds"] = time.perf_counter() - started
+    return counts
+
+
+async def run(database_url: str, generator: DatasetGenerator, clean: bool = False, echo: bool = False) -> dict:
+    dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+    connection = await asyncpg.connect(dsn)
+    try:
+        return await load(connection, generator, clean, echo)
+    finally:
+        await connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--registrations-per-event", type=int, default=40, help="Mean registrations of an approved event")
+    parser.add_argument("--roles", default=DEFAULT_ROLES, help="Weights of the roles of verified accounts")
+    parser.add_argument("--event-statuses", default=DEFAULT_EVENT_STATUSES)
+    parser.add_argument("--unverified", type=float, default=0.05, help="Share of accounts with unverified email")
+    parser.add_argument("--locked", type=float, default=0.01, help="Share of locked accounts")
+    parser.add_argument("--professional", type=float, default=0.1, help="Share of verified accounts with professional status")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="gen", help="Prefix of generated emails and nicknames")
+    parser.add_argument("--password-pool", type=int, default=16, help="Distinct passwords (and bcrypt hashes) to cycle through")
+    parser.add_argument("--now", type=datetime.fromisoformat, help="Reference time for generated timestamps (default: today, UTC)")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--clean", action="store_true", help="Delete an earlier dataset with the same prefix first")
+    args = parser.parse_args()
+    generator = DatasetGenerator(
+        args.users, args.events, args.registrations_per_event, args.roles, args.event_statuses, args.unverified,
+        args.locked, args.professional, args.seed, args.prefix, args.password_pool,
+        args.now.replace(tzinfo=args.now.tzinfo or timezone.utc) if args.now else None, args.batch_size,
+    )
+    counts = asyncio.run(run(settings.database_url, generator, args.clean, echo=True))
+    print()
+    print(f"users:               {counts['users']:,}")
+    print(f"events:              {counts['events']:,}")
+    print(f"event registrations: {counts['event_registrations']:,}")
+    print(f"loaded in:           {counts['seconds']:.1f} s")
+    print(f"passwords:           password_for(row number) -> e.g. {args.prefix}0@example.com / {password_for(0, args.password_pool)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,8 @@ Fixtures:
 
 # Standard library imports
 from builtins import range
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 from uuid import uuid4
 
@@ -31,17 +32,25 @@ from faker import Faker
 from app.main import app
 from app.database import Base, Database
 from app.models.user_model import User, UserRole
+from app.models.event_model import Event, EventStatus, EventType
 from app.dependencies import get_db, get_settings
 from app.utils.security import hash_password
 from app.utils.template_manager import TemplateManager
 from app.services.email_service import EmailService
 from app.services.jwt_service import create_access_token
+from app.services.audit_service import audit_log
+from app.services.event_service import upcoming_events_cache
+from app.services.health_service import readiness
+from app.services.notification_broker import notification_broker
+from app.utils.metrics import metrics
+from app.utils.query_stats import count_queries, instrument_engine
 
 fake = Faker()
 
 settings = get_settings()
 TEST_DATABASE_URL = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
 engine = create_async_engine(TEST_DATABASE_URL, echo=settings.debug)
+instrument_engine(engine)
 AsyncTestingSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 AsyncSessionScoped = scoped_session(AsyncTestingSessionLocal)
 
@@ -54,6 +63,17 @@ def email_service():
     return email_service
 
 
+# Usage: `with assert_max_queries(3): await ...` fails the test if the block runs more SQL statements
+@pytest.fixture
+def assert_max_queries():
+    @contextmanager
+    def check(limit):
+        with count_queries() as stats:
+            yield stats
+        assert stats.count <= limit, f"{stats.count} queries executed, expected at most {limit}:\n" + "\n".join(stats.statements)
+    return check
+
+
 # this is what creates the http client for your api tests
 @pytest.fixture(scope="function")
 async def async_client(db_session):
@@ -74,6 +94,12 @@ def initialize_database():
 # this function setup and tears down (drops tales) for each test function, so you have a clean database for each test.
 @pytest.fixture(scope="function", autouse=True)
 async def setup_database():
+    upcoming_events_cache.clear()
+    audit_log.clear()
+    notification_broker.clear()
+    readiness.clear()
+    metrics.clear()
+    audit_log.session_factory = AsyncTestingSessionLocal  # the test engine is disposed after each test's event loop
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -211,6 +237,29 @@ async def manager_user(db_session: AsyncSession):
     return user
 
 
+@pytest.fixture
+async def event(db_session, manager_user):
+    event = Event(
+        title="Company Tour: Example Corp",
+        description="A guided tour of the engineering offices.",
+        event_type=EventType.COMPANY_TOUR,
+        location="Newark, NJ",
+        starts_at=datetime.now(timezone.utc) + timedelta(days=7),
+        capacity=10,
+        status=EventStatus.PENDING,
+        created_by=manager_user.id,
+    )
+    db_session.add(event)
+    await db_session.commit()
+    return event
+
+@pytest.fixture
+async def approved_event(db_session, event):
+    event.status = EventStatus.APPROVED
+    await db_session.commit()
+    return event
+
+
 # Fixtures for common test data
 @pytest.fixture
 def user_base_data():
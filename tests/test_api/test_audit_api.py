@@ -0,0 +1,47 @@
+from builtins import len
+import pytest
+from app.models.audit_log_model import AuditAction
+from app.services.audit_service import audit_log
+
+pytestmark = pytest.mark.asyncio
+
+async def test_audit_log_requires_admin(async_client, manager_token):
+    response = await async_client.get("/admin/audit-log", headers={"Authorization": f"Bearer {manager_token}"})
+    assert response.status_code == 403
+
+async def test_role_change_shows_in_audit_log(async_client, admin_token, verified_user):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    response = await async_client.put(f"/users/{verified_user.id}/role", json={"role": "MANAGER"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["role"] == "MANAGER"
+    response = await async_client.get("/admin/audit-log", params={"user_id": str(verified_user.id)}, headers=headers)
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 1
+    assert items[0]["action"] == "ROLE_CHANGED"
+    assert items[0]["actor"] == "admin_user"
+    assert items[0]["details"] == {"old_role": "AUTHENTICATED", "new_role": "MANAGER"}
+
+async def test_role_change_rejects_anonymous(async_client, admin_token, verified_user):
+    response = await async_client.put(f"/users/{verified_user.id}/role", json={"role": "ANONYMOUS"},
+                                      headers={"Authorization": f"Bearer {admin_token}"})
+    assert response.status_code == 422
+    assert len(audit_log) == 0
+
+async def test_audit_log_pagination(async_client, admin_token, user):
+    for _ in range(3):
+        audit_log.record(AuditAction.ACCOUNT_LOCKED, user.id)
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    body = (await async_client.get("/admin/audit-log", params={"limit": 2}, headers=headers)).json()
+    assert body["size"] == 2 and body["next_cursor"]
+    body = (await async_client.get("/admin/audit-log", params={"limit": 2, "cursor": body["next_cursor"]}, headers=headers)).json()
+    assert body["size"] == 1 and body["next_cursor"] is None
+    response = await async_client.get("/admin/audit-log", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert response.status_code == 400
+
+async def test_professional_status_upgrade(async_client, manager_token, verified_user):
+    response = await async_client.put(f"/users/{verified_user.id}/professional-status", json={"is_professional": True},
+                                      headers={"Authorization": f"Bearer {manager_token}"})
+    assert response.status_code == 200
+    assert response.json()["is_professional"] is True
+    assert len(audit_log) == 1
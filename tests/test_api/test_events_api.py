@@ -0,0 +1,153 @@
+from builtins import len, range
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import uuid
+import pytest
+from sqlalchemy import select
+from app.models.event_model import Event, EventStatus, EventType
+from app.models.notification_model import Notification
+from app.services.event_service import EventService, RegistrationOutcome, upcoming_events_cache
+from app.services.jwt_service import create_access_token
+
+pytestmark = pytest.mark.asyncio
+
+async def _add_events(db_session, count, **overrides):
+    now = datetime.now(timezone.utc)
+    events = []
+    for i in range(count):
+        data = {
+            "title": f"Event {i}",
+            "event_type": EventType.WORKSHOP,
+            "location": "Newark, NJ",
+            "starts_at": now + timedelta(days=i + 1),
+            "capacity": 20,
+            "status": EventStatus.APPROVED,
+        }
+        data.update(overrides)
+        events.append(Event(**data))
+    db_session.add_all(events)
+    await db_session.commit()
+    return events
+
+async def test_list_events_only_shows_upcoming_approved(async_client, db_session, event):
+    approved = await _add_events(db_session, 2)
+    await _add_events(db_session, 1, starts_at=datetime.now(timezone.utc) - timedelta(days=1))
+    response = await async_client.get("/events")
+    assert response.status_code == 200
+    ids = [item["id"] for item in response.json()["items"]]
+    assert ids == [str(e.id) for e in approved]
+    assert str(event.id) not in ids
+
+async def test_list_events_keyset_pagination(async_client, db_session):
+    events = await _add_events(db_session, 5)
+    seen, cursor = [], None
+    for _ in range(3):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        body = (await async_client.get("/events", params=params)).json()
+        seen.extend(item["id"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if cursor:
+            assert any(link["rel"] == "next" for link in body["links"])
+    assert seen == [str(e.id) for e in events]
+    assert cursor is None
+
+async def test_list_events_filters(async_client, db_session):
+    await _add_events(db_session, 2)
+    lectures = await _add_events(db_session, 1, event_type=EventType.GUEST_LECTURE, location="Online")
+    body = (await async_client.get("/events", params={"event_type": "GUEST_LECTURE"})).json()
+    assert [item["id"] for item in body["items"]] == [str(lectures[0].id)]
+    body = (await async_client.get("/events", params={"location": "newark, nj"})).json()
+    assert len(body["items"]) == 2
+    window_end = (datetime.now(timezone.utc) + timedelta(days=1, hours=12)).isoformat()
+    body = (await async_client.get("/events", params={"starts_before": window_end})).json()
+    assert len(body["items"]) == 2
+
+async def test_list_events_invalid_cursor(async_client):
+    response = await async_client.get("/events", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+async def test_default_listing_served_from_cache(async_client, db_session):
+    await _add_events(db_session, 2)
+    first = await async_client.get("/events")
+    with patch.object(EventService, "list_upcoming", side_effect=AssertionError("database queried")):
+        second = await async_client.get("/events")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+async def test_listing_cache_invalidated_on_approve(async_client, db_session, event):
+    assert (await async_client.get("/events")).json()["items"] == []
+    await EventService.approve(db_session, event.id)
+    items = (await async_client.get("/events")).json()["items"]
+    assert [item["id"] for item in items] == [str(event.id)]
+
+async def test_create_event_requires_manager(async_client, user_token, manager_token, manager_user):
+    payload = {
+        "title": "Mock Interviews",
+        "event_type": "MOCK_INTERVIEW",
+        "starts_at": (datetime.now(timezone.utc) + timedelta(days=2)).isoformat(),
+        "capacity": 15,
+    }
+    response = await async_client.post("/events", json=payload, headers={"Authorization": f"Bearer {user_token}"})
+    assert response.status_code == 403
+    response = await async_client.post("/events", json=payload, headers={"Authorization": f"Bearer {manager_token}"})
+    assert response.status_code == 201
+    assert response.json()["status"] == "PENDING"
+
+async def test_get_event_hides_pending(async_client, event):
+    response = await async_client.get(f"/events/{event.id}")
+    assert response.status_code == 404
+
+async def test_update_event_notifies_registrants(async_client, db_session, approved_event, verified_user, manager_token):
+    assert await EventService.register_user(db_session, approved_event.id, verified_user.id) == RegistrationOutcome.REGISTERED
+    response = await async_client.put(
+        f"/events/{approved_event.id}", json={"location": "Online"}, headers={"Authorization": f"Bearer {manager_token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["location"] == "Online"
+    notifications = (await db_session.execute(select(Notification))).scalars().all()
+    assert [n.user_id for n in notifications] == [verified_user.id]
+    assert "location" in notifications[0].body
+
+async def test_update_event_conflicts(async_client, db_session, approved_event, verified_user, user, manager_token):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    await EventService.register_user(db_session, approved_event.id, verified_user.id)
+    await EventService.register_user(db_session, approved_event.id, user.id)
+    response = await async_client.put(f"/events/{approved_event.id}", json={"capacity": 1}, headers=headers)
+    assert response.status_code == 409
+    response = await async_client.put(f"/events/{approved_event.id}", json={"ends_at": approved_event.starts_at.isoformat()}, headers=headers)
+    assert response.status_code == 409
+    response = await async_client.put(f"/events/{uuid.uuid4()}", json={"location": "Online"}, headers=headers)
+    assert response.status_code == 404
+
+async def test_listing_cache_only_holds_first_pages(async_client, db_session):
+    await _add_events(db_session, 3)
+    first = (await async_client.get("/events", params={"limit": 2, "utm_source": "newsletter"})).json()
+    assert all("utm_source" not in link["href"] and "testserver" not in link["href"] for link in first["links"])
+    await async_client.get("/events", params={"limit": 2, "cursor": first["next_cursor"]})
+    assert len(upcoming_events_cache) == 1
+    second = await async_client.get("/events", params={"limit": 2}, headers={"Host": "other.example.com"})
+    assert second.json() == first
+
+async def test_review_queue_flow(async_client, event, manager_user, user_token):
+    token = create_access_token(data={"sub": manager_user.email, "role": "MANAGER"})
+    headers = {"Authorization": f"Bearer {token}"}
+    assert (await async_client.get("/events/review-queue", headers={"Authorization": f"Bearer {user_token}"})).status_code == 403
+    queue = (await async_client.get("/events/review-queue", headers=headers)).json()
+    assert [item["id"] for item in queue["items"]] == [str(event.id)]
+    claimed = (await async_client.post("/events/review-queue/claim", headers=headers)).json()
+    assert [item["id"] for item in claimed] == [str(event.id)]
+    assert claimed[0]["claimed_by"] == str(manager_user.id)
+    response = await async_client.post(f"/events/{event.id}/reject", json={"feedback": "Add a room number."}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "REJECTED"
+    assert response.json()["review_feedback"] == "Add a room number."
+    response = await async_client.post(f"/events/{event.id}/approve", headers=headers)
+    assert response.status_code == 409
+    response = await async_client.post(f"/events/{uuid.uuid4()}/approve", headers=headers)
+    assert response.status_code == 404
+
+async def test_reject_requires_feedback(async_client, event, manager_token):
+    response = await async_client.post(f"/events/{event.id}/reject", json={}, headers={"Authorization": f"Bearer {manager_token}"})
+    assert response.status_code == 422
@@ -0,0 +1,89 @@
+import asyncio
+from unittest.mock import patch
+import pytest
+from app.database import Database
+from app.services.health_service import readiness
+from tests.conftest import AsyncTestingSessionLocal, engine
+
+
+@pytest.fixture
+def test_database():
+    # Point the readiness check at the test engine, which belongs to this test's event loop
+    with patch.object(Database, "_engine", engine), patch.object(Database, "_session_factory", AsyncTestingSessionLocal):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_healthz_does_no_io(async_client):
+    with patch.object(Database, "get_session_factory", side_effect=AssertionError("no I/O expected")):
+        response = await async_client.get("/healthz")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_readyz_reports_database_pool_and_outbox(async_client, test_database):
+    response = await async_client.get("/readyz")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["checks"]["database"]["ok"] is True
+    assert body["checks"]["pool"]["ok"] is True and body["checks"]["pool"]["capacity"] == 15
+    assert body["checks"]["outbox"] == {"pending": 0, "backlogged": False}
+
+
+@pytest.mark.asyncio
+async def test_database_is_queried_once_per_cache_interval(test_database):
+    calls = []
+    original = readiness._query
+
+    async def counting_query():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return await original()
+
+    with patch.object(readiness, "_query", counting_query):
+        results = await asyncio.gather(*(readiness.check() for _ in range(20)))
+        await readiness.check()
+    assert len(calls) == 1
+    assert all(ready for ready, _ in results)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_database_is_not_ready_and_cached(async_client, test_database):
+    calls = []
+
+    async def failing_query():
+        calls.append(1)
+        raise ConnectionRefusedError("connection refused")
+
+    with patch.object(readiness, "_query", failing_query):
+        first = await async_client.get("/readyz")
+        second = await async_client.get("/readyz")
+    assert first.status_code == second.status_code == 503
+    assert first.json()["checks"]["database"] == {"ok": False, "error": "connection refused"}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_is_not_ready_without_touching_database(async_client, test_database):
+    status = {"size": 5, "checked_out": 15, "overflow": 10, "max_overflow": 10}
+    with patch.object(Database, "pool_status", return_value=status), \
+            patch.object(readiness, "_query", side_effect=AssertionError("database must not be queried")):
+        response = await async_client.get("/readyz")
+    assert response.status_code == 503
+    body = response.json()
+    assert body["status"] == "not_ready"
+    assert body["checks"]["pool"] == {"ok": False, "in_use": 15, "capacity": 15, "saturation": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_outbox_backlog_is_flagged_but_still_ready(async_client, test_database):
+    async def backlogged_query():
+        return 50
+
+    with patch.object(readiness, "_query", backlogged_query), \
+            patch("app.services.health_service.settings.readiness_outbox_backlog_warning", 10):
+        response = await async_client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["checks"]["outbox"] == {"pending": 50, "backlogged": True}
@@ -0,0 +1,46 @@
+from builtins import range
+import pytest
+from sqlalchemy import insert, update
+from app.models.event_model import Event, EventRegistration
+from app.services.jwt_service import create_access_token
+from app.services.notification_service import NotificationService
+
+pytestmark = pytest.mark.asyncio
+
+async def _notify(db_session, event, user, count):
+    await db_session.execute(insert(EventRegistration).values(event_id=event.id, user_id=user.id))
+    await db_session.execute(update(Event).where(Event.id == event.id).values(registered_count=1))
+    await db_session.commit()
+    await db_session.refresh(event)
+    for i in range(count):
+        await NotificationService.fan_out_event_update(db_session, event, f"Update {i}.")
+
+def _headers(user):
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': user.email, 'role': 'AUTHENTICATED'})}"}
+
+async def test_notification_feed_and_mark_read(async_client, db_session, approved_event, verified_user):
+    await _notify(db_session, approved_event, verified_user, 3)
+    headers = _headers(verified_user)
+    response = await async_client.get("/me/notifications?limit=2", headers=headers)
+    assert response.status_code == 200
+    page = response.json()
+    assert [item["body"] for item in page["items"]] == ["Update 2.", "Update 1."]
+    assert page["unread_count"] == 3
+    assert page["links"][-1]["rel"] == "next"
+    rest = (await async_client.get("/me/notifications", params={"limit": 2, "cursor": page["next_cursor"]}, headers=headers)).json()
+    assert [item["body"] for item in rest["items"]] == ["Update 0."] and rest["next_cursor"] is None
+
+    ids = [item["id"] for item in page["items"]]
+    response = await async_client.post("/me/notifications/read", json={"ids": ids}, headers=headers)
+    assert response.json() == {"unread_count": 1}
+    assert (await async_client.get("/me/notifications/unread-count", headers=headers)).json() == {"unread_count": 1}
+    unread = (await async_client.get("/me/notifications?unread_only=true", headers=headers)).json()
+    assert [item["body"] for item in unread["items"]] == ["Update 0."]
+
+async def test_notifications_require_login(async_client):
+    assert (await async_client.get("/me/notifications")).status_code == 401
+
+async def test_mark_read_rejects_empty_and_bad_cursor(async_client, verified_user):
+    headers = _headers(verified_user)
+    assert (await async_client.post("/me/notifications/read", json={"ids": []}, headers=headers)).status_code == 422
+    assert (await async_client.get("/me/notifications?cursor=nope", headers=headers)).status_code == 400
@@ -1,11 +1,11 @@
-from builtins import str
+from builtins import range, str
 import pytest
 from httpx import AsyncClient
 from app.main import app
-from app.models.user_model import User
+from app.models.user_model import User, UserRole
 from app.utils.nickname_gen import generate_nickname
 from app.utils.security import hash_password
-from app.services.jwt_service import decode_token  # Import your FastAPI app
+from app.services.jwt_service import create_access_token, decode_token  # Import your FastAPI app
 
 # Example of a test function using the async_client fixture
 @pytest.mark.asyncio
@@ -198,4 +198,71 @@ async def test_list_users_unauthorized(async_client, user_token):
         "/users/",
         headers={"Authorization": f"Bearer {user_token}"}
     )
-    assert response.status_code == 403  # Forbidden, as expected for regular user
\ No newline at end of file
+    assert response.status_code == 403  # Forbidden, as expected for regular user
+
+@pytest.mark.asyncio
+async def test_notification_preferences_roundtrip(async_client, verified_user):
+    token = create_access_token(data={"sub": verified_user.email, "role": "AUTHENTICATED"})
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await async_client.get("/me/notification-preferences", headers=headers)
+    assert response.status_code == 200
+    assert all(response.json().values())
+    response = await async_client.put("/me/notification-preferences", json={"event_updates_email": False}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["event_updates_email"] is False
+    assert response.json()["event_updates_dashboard"] is True
+    response = await async_client.get("/me/notification-preferences", headers=headers)
+    assert response.json()["event_updates_email"] is False
+
+@pytest.mark.asyncio
+async def test_notification_preferences_update_requires_a_value(async_client, verified_user):
+    token = create_access_token(data={"sub": verified_user.email, "role": "AUTHENTICATED"})
+    response = await async_client.put("/me/notification-preferences", json={}, headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_locked_users(async_client, admin_token, locked_user, verified_user):
+    response = await async_client.get("/admin/users/locked", headers={"Authorization": f"Bearer {admin_token}"})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["id"] for item in body["items"]] == [str(locked_user.id)]
+    assert body["items"][0]["is_locked"] is True
+    assert body["next_cursor"] is None
+    assert [link["rel"] for link in body["links"]] == ["self"]
+
+@pytest.mark.asyncio
+async def test_list_unverified_users(async_client, manager_token, unverified_user):
+    headers = {"Authorization": f"Bearer {manager_token}"}
+    response = await async_client.get("/admin/users/unverified", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    response = await async_client.get("/admin/users/unverified", params={"older_than_days": 0}, headers=headers)
+    assert [item["id"] for item in response.json()["items"]] == [str(unverified_user.id)]
+    assert "older_than_days=0" in response.json()["links"][0]["href"]
+
+@pytest.mark.asyncio
+async def test_list_pro_candidates_pages(async_client, db_session, admin_token):
+    candidates = [
+        User(nickname=f"candidate_{n}", email=f"candidate_{n}@example.com", first_name="Can", last_name="Didate",
+             hashed_password="x", role=UserRole.AUTHENTICATED,
+             email_verified=True, github_profile_url=f"https://github.com/candidate{n}")
+        for n in range(3)
+    ]
+    db_session.add_all(candidates)
+    await db_session.commit()
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    first = (await async_client.get("/admin/users/pro-candidates", params={"limit": 2}, headers=headers)).json()
+    assert first["size"] == 2 and first["next_cursor"]
+    assert first["links"][-1]["rel"] == "next"
+    second = (await async_client.get("/admin/users/pro-candidates", params={"limit": 2, "cursor": first["next_cursor"]}, headers=headers)).json()
+    assert second["size"] == 1 and second["next_cursor"] is None
+    ids = {item["id"] for item in first["items"] + second["items"]}
+    assert ids == {str(user.id) for user in candidates}
+
+@pytest.mark.asyncio
+async def test_triage_lists_access_and_cursor(async_client, user_token, admin_token):
+    response = await async_client.get("/admin/users/locked", headers={"Authorization": f"Bearer {user_token}"})
+    assert response.status_code == 403
+    response = await async_client.get("/admin/users/locked", params={"cursor": "not-a-cursor"}, headers={"Authorization": f"Bearer {admin_token}"})
+    assert response.status_code == 400
@@ -0,0 +1,27 @@
+import pytest
+from benchmarks.bench_api_load import parse_mix, percentile, summarize
+
+
+def test_parse_mix():
+    assert parse_mix("register=1, login=2,get_user") == {"register": 1.0, "login": 2.0, "get_user": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("delete_user=1")
+    with pytest.raises(ValueError):
+        parse_mix("login=0")
+
+
+def test_percentiles_use_nearest_rank():
+    ordered = [i / 1000 for i in range(1, 101)]
+    assert percentile(ordered, 50) == 0.05
+    assert percentile(ordered, 99) == 0.099
+    assert percentile([0.2], 95) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_reports_throughput_and_errors_per_endpoint():
+    summary = summarize({"login": [0.1, 0.2, 0.3, 0.4], "get_user": [0.01]}, {"login": 1}, elapsed=2.0)
+    assert summary["requests"] == 5 and summary["per_second"] == 2.5
+    assert summary["endpoints"]["login"]["errors"] == 1
+    assert summary["endpoints"]["login"]["per_second"] == 2.0
+    assert summary["endpoints"]["login"]["p50_ms"] == pytest.approx(200.0)
+    assert summary["endpoints"]["get_user"]["max_ms"] == pytest.approx(10.0)
@@ -0,0 +1,23 @@
+from benchmarks.bench_micro import cases, compare, measure
+
+
+def _results(**best):
+    return {"created_at": "", "python": "", "machine": "", "results": {name: {"best_us": us} for name, us in best.items()}}
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    baseline = _results(decode_token=10.0, generate_nickname=2.0, create_user_links=50.0, old_case=1.0)
+    current = _results(decode_token=12.5, generate_nickname=2.1, create_user_links=30.0, new_case=1.0)
+    lines, regressions = compare(baseline, current, threshold=0.2)
+    assert regressions == ["decode_token"]
+    assert any("faster" in line and line.startswith("create_user_links") for line in lines)
+    assert any(line.startswith("new_case") and "new case" in line for line in lines)
+    assert any(line.startswith("old_case") and "missing" in line for line in lines)
+
+
+def test_every_case_runs():
+    for name, function in cases().items():
+        if "rounds=12" not in name:
+            function()
+    timing = measure(cases()["generate_nickname"], repeat=2, min_time=0.01)
+    assert 0 < timing["best_us"] <= timing["median_us"]
@@ -1,6 +1,10 @@
+import time
 import pytest
 from app.services.email_service import EmailService
+from app.utils.rate_limiter import RateLimiter
+from app.utils.smtp_connection import SMTPClient
 from app.utils.template_manager import TemplateManager
+from benchmarks.smtp_sink import SMTPSink
 
     
 @pytest.mark.asyncio
@@ -12,3 +16,59 @@ async def test_send_markdown_email(email_service):
     }
     await email_service.send_user_email(user_data, 'email_verification')
     # Manual verification in Mailtrap
+
+
+@pytest.fixture
+def sink_email_service():
+    with SMTPSink() as sink:
+        service = EmailService(template_manager=TemplateManager())
+        service.smtp_client = SMTPClient(sink.host, sink.port, "sender@example.com", "secret", use_tls=False, pool_size=3)
+        service.rate_limiter = RateLimiter(0)
+        service.sink = sink
+        yield service
+
+
+def _recipients(count):
+    for i in range(count):
+        yield {"email": f"user{i}@example.com", "name": f"User {i}", "verification_url": f"http://example.com/verify/{i}"}
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_email_delivers_to_every_recipient(sink_email_service):
+    results = await sink_email_service.send_bulk_email('email_verification', _recipients(25))
+    await sink_email_service.close()
+    assert len(results) == 25
+    assert all(result["sent"] for result in results)
+    assert len(sink_email_service.sink.messages) == 25
+    assert sink_email_service.smtp_client.connections_opened <= 3
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_email_accepts_async_stream_and_reports_failures(sink_email_service):
+    async def stream():
+        for recipient in _recipients(3):
+            yield recipient
+        yield {"email": "broken@example.com"}  # missing template fields
+
+    results = await sink_email_service.send_bulk_email('email_verification', stream(), concurrency=2)
+    await sink_email_service.close()
+    failed = [result for result in results if not result["sent"]]
+    assert len(results) == 4
+    assert [result["email"] for result in failed] == ["broken@example.com"]
+    assert failed[0]["error"]
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_email_respects_rate_limit(sink_email_service):
+    sink_email_service.rate_limiter = RateLimiter(rate=50, burst=1)
+    started = time.monotonic()
+    await sink_email_service.send_bulk_email('email_verification', _recipients(11))
+    await sink_email_service.close()
+    # 11 messages at 50/s need at least 10 intervals of 20ms
+    assert time.monotonic() - started >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_email_rejects_unknown_type(sink_email_service):
+    with pytest.raises(ValueError):
+        await sink_email_service.send_bulk_email('no_such_type', _recipients(1))
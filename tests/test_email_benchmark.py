@@ -0,0 +1,27 @@
+import pytest
+from benchmarks.bench_email_throughput import percentile, run
+
+pytestmark = pytest.mark.asyncio
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) == 0.0
+
+
+# Every message is delivered and connections are reused rather than opened per message
+@pytest.mark.parametrize("mode", ["smtp", "service"])
+async def test_email_throughput_delivers_over_pooled_connections(mode):
+    results = await run(levels=(1, 4), messages=40, mode=mode)
+    for result in results:
+        assert result["delivered"] == result["messages"]
+        assert result["connections"] <= result["concurrency"]
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+
+
+# With provider latency, more concurrency must translate into more throughput
+async def test_email_throughput_scales_with_concurrency():
+    single, pooled = await run(levels=(1, 4), messages=40, mode="smtp", sink_delay=0.01)
+    assert pooled["messages_per_second"] > 2 * single["messages_per_second"]
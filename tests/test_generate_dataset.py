@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+import pytest
+from sqlalchemy import func, select
+from app.models.event_model import Event, EventRegistration
+from app.models.user_model import User, UserRole
+from app.services.user_service import UserService
+from benchmarks.generate_dataset import DatasetGenerator, password_for, row_id, run
+from settings.config import settings
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def make_generator(**options):
+    return DatasetGenerator(**{"users": 300, "events": 20, "registrations_per_event": 10, "password_pool": 2,
+                               "now": NOW, "batch_size": 64, **options})
+
+
+def test_rows_are_deterministic_for_a_seed():
+    first, second = make_generator(), make_generator()
+    first._hashes = second._hashes = ["hash0", "hash1"]
+    assert list(first.user_batches()) == list(second.user_batches())
+    assert list(first.event_batches()) == list(second.event_batches())
+    other = make_generator(seed=7)
+    other._hashes = ["hash0", "hash1"]
+    assert next(other.user_batches())[0][0] != next(first.user_batches())[0][0]
+
+
+def test_rejects_unknown_roles_and_prefixes():
+    with pytest.raises(ValueError):
+        make_generator(roles="ANONYMOUS=1")
+    with pytest.raises(ValueError):
+        make_generator(prefix="gen%")
+
+
+@pytest.mark.asyncio
+async def test_loads_consistent_dataset(db_session):
+    counts = await run(settings.database_url, make_generator(unverified=0.2, locked=0.1))
+    assert counts["users"] == 300 and counts["events"] == 20
+
+    users = (await db_session.execute(select(User))).scalars().all()
+    assert len(users) == 300
+    assert all((user.role == UserRole.ANONYMOUS) == (not user.email_verified) for user in users)
+    assert any(user.is_locked for user in users) and any(not user.email_verified for user in users)
+
+    registrations = dict((await db_session.execute(
+        select(EventRegistration.event_id, func.count()).group_by(EventRegistration.event_id))).all())
+    for event in (await db_session.execute(select(Event))).scalars():
+        assert event.registered_count == registrations.get(event.id, 0) <= event.capacity
+
+    user = next(user for user in users if user.email_verified and not user.is_locked)
+    number = int(user.nickname.rsplit("_", 1)[1])
+    assert user.id == row_id(42, "user", number)
+    assert await UserService.login_user(db_session, user.email, password_for(number, 2)) is not None
@@ -0,0 +1,55 @@
+import json
+import logging
+from unittest.mock import patch
+import pytest
+from app.utils import common
+from app.utils.common import JsonFormatter, RequestIdFilter, request_id_var, setup_logging, stop_logging
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    stop_logging()
+    root.handlers, root.level = handlers, level
+
+def test_json_formatter_includes_request_id_and_extras():
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "User %s updated", ("abc",), None)
+    token = request_id_var.set("req-1")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    record.user_count = 3
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "User abc updated"
+    assert entry["request_id"] == "req-1"
+    assert entry["level"] == "INFO" and entry["logger"] == "app.test"
+    assert entry["user_count"] == 3
+
+def test_setup_logging_writes_through_a_queue(restore_root_logger, capsys):
+    with patch.object(common.settings, "log_json", True):
+        setup_logging()
+    root = restore_root_logger
+    assert [type(handler).__name__ for handler in root.handlers] == ["_LogQueueHandler"]
+    token = request_id_var.set("req-2")
+    try:
+        logging.getLogger("app.test").warning("Lazy %s", "message")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("app.test").exception("Failed")
+    finally:
+        request_id_var.reset(token)
+    stop_logging()
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["message"] for line in lines] == ["Lazy message", "Failed"]
+    assert all(line["request_id"] == "req-2" for line in lines)
+    assert "ValueError: boom" in lines[1]["exception"]
+
+@pytest.mark.asyncio
+async def test_request_id_header(async_client):
+    response = await async_client.get("/events", headers={"X-Request-ID": "trace-123"})
+    assert response.headers["x-request-id"] == "trace-123"
+    generated = (await async_client.get("/events", headers={"X-Request-ID": "bad id\n"})).headers["x-request-id"]
+    assert len(generated) == 32
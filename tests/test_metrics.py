@@ -0,0 +1,55 @@
+import pytest
+from app.utils.metrics import Gauge, Histogram, MetricsRegistry, http_request_duration_seconds, http_responses_total
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, "/users")
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/users",le="0.1"} 2',
+        'latency_seconds_bucket{route="/users",le="1"} 3',
+        'latency_seconds_bucket{route="/users",le="+Inf"} 4',
+        'latency_seconds_sum{route="/users"} 3.65',
+        'latency_seconds_count{route="/users"} 4',
+    ]
+
+def test_counters_and_callback_gauges():
+    registry = MetricsRegistry()
+    responses = registry.counter("responses_total", "Responses", ("status",))
+    responses.inc("200")
+    responses.inc("200")
+    responses.inc("404")
+    registry.gauge("pool_size", "Pool size", callback=lambda: 5)
+    registry.gauge("not_ready", "Unavailable", callback=lambda: None)
+    assert registry.counter("responses_total", "Responses", ("status",)) is responses
+    assert registry.render().splitlines() == [
+        "# HELP responses_total Responses",
+        "# TYPE responses_total counter",
+        'responses_total{status="200"} 2',
+        'responses_total{status="404"} 1',
+        "# HELP pool_size Pool size",
+        "# TYPE pool_size gauge",
+        "pool_size 5",
+    ]
+
+def test_label_values_are_escaped():
+    gauge = Gauge("g", "Escaping", ("path",))
+    gauge.set(1, 'a"b\\c')
+    assert gauge.render()[-1] == 'g{path="a\\"b\\\\c"} 1'
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded_by_route_template(async_client, verified_user, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    await async_client.get(f"/users/{verified_user.id}", headers=headers)
+    await async_client.get("/no-such-page")
+    assert http_responses_total.value("GET", "/users/{user_id}", "200") == 1
+    assert http_responses_total.value("GET", "unmatched", "404") == 1
+    assert http_request_duration_seconds.count("GET", "/users/{user_id}") == 1
+    response = await async_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_responses_total{method="GET",route="/users/{user_id}",status="200"} 1' in response.text
+    assert "# TYPE event_listing_cache_hits_total counter" in response.text
+    assert "email_outbox_pending 0" in response.text
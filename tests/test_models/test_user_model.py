@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.user_model import User, UserRole
+from sqlalchemy import select
+from app.models.user_model import NotificationPreference, User, UserRole
 
 @pytest.mark.asyncio
 async def test_user_role(db_session: AsyncSession, user: User, admin_user: User, manager_user: User):
@@ -165,3 +166,20 @@ async def test_email_verification_token_update(db_session: AsyncSession, user: U
     await db_session.commit()
     await db_session.refresh(user)
     assert user.verification_token is None, "Verification token should be cleared"
+
+@pytest.mark.asyncio
+async def test_notification_preferences_default_to_all(db_session: AsyncSession, user: User):
+    """
+    Tests that new users are opted in to every notification and can be found with opted_in.
+    """
+    assert all(user.wants_notification(preference) for preference in NotificationPreference)
+    user.notification_preferences &= ~NotificationPreference.EVENT_APPROVAL_EMAIL
+    await db_session.commit()
+    assert not user.wants_notification(NotificationPreference.EVENT_APPROVAL_EMAIL)
+    opted_in = await db_session.execute(select(User.id).where(User.opted_in(NotificationPreference.EVENT_APPROVAL_EMAIL)))
+    assert user.id not in opted_in.scalars().all()
+    opted_in = await db_session.execute(select(User.id).where(User.opted_in(NotificationPreference.PRO_STATUS_EMAIL)))
+    assert user.id in opted_in.scalars().all()
+    opted_out = await db_session.execute(select(User.id).where(User.opted_out(NotificationPreference.EVENT_APPROVAL_EMAIL)))
+    assert opted_out.scalars().all() == [user.id]
+
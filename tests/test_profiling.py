@@ -0,0 +1,28 @@
+import os
+from unittest.mock import patch
+import pytest
+
+pytestmark = pytest.mark.asyncio
+
+async def test_profile_header_ignored_for_non_admins(async_client, user_token, tmp_path):
+    with patch("app.utils.profiling.settings.profile_output_dir", str(tmp_path)):
+        response = await async_client.get("/events", headers={"Authorization": f"Bearer {user_token}", "X-Profile": "cprofile"})
+    assert response.status_code == 200
+    assert "x-profile-report" not in response.headers
+    assert os.listdir(tmp_path) == []
+
+async def test_cprofile_report_for_admin(async_client, admin_token, tmp_path):
+    with patch("app.utils.profiling.settings.profile_output_dir", str(tmp_path)):
+        response = await async_client.get("/events", headers={"Authorization": f"Bearer {admin_token}", "X-Profile": "cprofile"})
+    assert response.status_code == 200
+    assert "items" in response.json()
+    report = (tmp_path / response.headers["x-profile-report"]).read_text()
+    assert report.startswith("GET /events")
+    assert "cumulative" in report and "list_events" in report
+
+async def test_tracemalloc_report_in_debug_mode(async_client, tmp_path):
+    with patch("app.utils.profiling.settings.profile_output_dir", str(tmp_path)), patch("app.utils.profiling.settings.debug", True):
+        response = await async_client.get("/events", headers={"X-Profile": "tracemalloc"})
+    assert response.status_code == 200
+    report = (tmp_path / response.headers["x-profile-report"]).read_text()
+    assert "Allocation growth during the request" in report
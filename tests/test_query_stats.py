@@ -0,0 +1,47 @@
+import logging
+from unittest.mock import patch
+import pytest
+from app.services.event_service import EventService
+from app.services.user_service import UserService
+from app.utils.query_stats import count_queries, db_queries_per_request, redact_parameters
+
+pytestmark = pytest.mark.asyncio
+
+async def test_redact_parameters():
+    assert redact_parameters({"email_1": "someone@example.com", "limit_1": 10}) == {"email_1": "str", "limit_1": "int"}
+    assert redact_parameters(("secret", None)) == ["str", "NoneType"]
+
+async def test_count_queries(db_session, approved_event):
+    with count_queries() as stats:
+        await EventService.list_upcoming(db_session, limit=5)
+    assert stats.count == 1
+    assert stats.statements[0].startswith("SELECT")
+    assert stats.duration > 0
+
+async def test_assert_max_queries_fails_when_exceeded(db_session, assert_max_queries):
+    with pytest.raises(AssertionError, match="2 queries executed, expected at most 1"):
+        with assert_max_queries(1):
+            await UserService.get_by_email(db_session, "nobody@example.com")
+            await UserService.get_by_nickname(db_session, "nobody")
+
+async def test_create_user_query_budget(db_session, email_service, assert_max_queries):
+    user_data = {"email": "budget@example.com", "password": "ValidPassword123!", "nickname": "budget_nick"}
+    with assert_max_queries(4):
+        assert await UserService.create(db_session, user_data, email_service) is not None
+
+async def test_slow_queries_are_logged_redacted(db_session, caplog):
+    with patch("app.utils.query_stats.settings.slow_query_threshold_ms", 0.000001), caplog.at_level(logging.WARNING, "app.utils.query_stats"):
+        await UserService.get_by_email(db_session, "private@example.com")
+    assert "Slow query" in caplog.text
+    assert "parameters: ['str']" in caplog.text
+    assert "private@example.com" not in caplog.text
+
+async def test_debug_headers_and_per_route_histogram(async_client, verified_user, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    assert "x-db-query-count" not in (await async_client.get(f"/users/{verified_user.id}", headers=headers)).headers
+    with patch("app.utils.query_stats.settings.debug", True):
+        response = await async_client.get(f"/users/{verified_user.id}", headers=headers)
+    assert response.status_code == 200
+    assert int(response.headers["x-db-query-count"]) >= 1
+    assert float(response.headers["x-db-time-ms"]) > 0
+    assert db_queries_per_request.count("/users/{user_id}") == 2
@@ -0,0 +1,118 @@
+from builtins import len, range
+import asyncio
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.exc import DBAPIError
+from app.models.audit_log_model import AuditAction, AuditLogEntry
+from app.models.user_model import UserRole
+from app.services.audit_service import AuditLogBuffer, AuditLogService, audit_log
+from app.services.user_service import UserService
+from tests.conftest import AsyncTestingSessionLocal
+
+pytestmark = pytest.mark.asyncio
+
+async def _entries(db_session):
+    result = await db_session.execute(select(AuditLogEntry).order_by(AuditLogEntry.created_at))
+    return result.scalars().all()
+
+# Recording only buffers; a flush writes the batch into a monthly partition
+async def test_record_is_buffered_until_flush(db_session, user):
+    buffer = AuditLogBuffer(session_factory=AsyncTestingSessionLocal)
+    buffer.record(AuditAction.ACCOUNT_LOCKED, user.id, reason="test")
+    buffer.record(AuditAction.ACCOUNT_UNLOCKED, user.id, "admin@example.com")
+    assert len(buffer) == 2
+    assert await _entries(db_session) == []
+    await db_session.commit()
+    assert await buffer.flush() == 2
+    assert len(buffer) == 0
+    entries = await _entries(db_session)
+    assert [entry.action for entry in entries] == [AuditAction.ACCOUNT_LOCKED, AuditAction.ACCOUNT_UNLOCKED]
+    assert entries[0].details == {"reason": "test"}
+    assert entries[1].actor == "admin@example.com"
+    partition = await db_session.execute(text("SELECT DISTINCT tableoid::regclass::text FROM audit_log"))
+    assert partition.scalar() == f"audit_log_p{entries[0].created_at:%Y_%m}"
+
+# Entries that could not be written stay buffered for the next flush
+async def test_flush_failure_keeps_entries(user):
+    def broken_factory():
+        raise RuntimeError("database unavailable")
+    buffer = AuditLogBuffer(session_factory=broken_factory)
+    buffer.record(AuditAction.USER_DELETED, user.id)
+    assert await buffer.flush() == 0
+    assert len(buffer) == 1
+
+# A full buffer drops its oldest entries rather than growing without bound
+async def test_buffer_drops_oldest_when_full(user):
+    buffer = AuditLogBuffer(session_factory=AsyncTestingSessionLocal, max_entries=3)
+    for _ in range(5):
+        buffer.record(AuditAction.ACCOUNT_LOCKED, user.id)
+    assert len(buffer) == 3
+    assert buffer.dropped == 2
+
+# The background task flushes a full batch straight away and the rest on stop
+async def test_background_flush(db_session, user):
+    buffer = AuditLogBuffer(session_factory=AsyncTestingSessionLocal, batch_size=5, flush_interval=60)
+    buffer.start()
+    for _ in range(5):
+        buffer.record(AuditAction.ACCOUNT_LOCKED, user.id)
+    for _ in range(50):
+        if len(buffer) == 0:
+            break
+        await asyncio.sleep(0.05)
+    assert len(buffer) == 0
+    buffer.record(AuditAction.ACCOUNT_UNLOCKED, user.id)
+    await buffer.stop()
+    assert len(await _entries(db_session)) == 6
+
+# Audit entries cannot be changed once written
+async def test_audit_log_is_append_only(db_session, user):
+    audit_log.record(AuditAction.ACCOUNT_LOCKED, user.id)
+    await audit_log.flush()
+    with pytest.raises(DBAPIError, match="append-only"):
+        await db_session.execute(update(AuditLogEntry).values(actor="someone else"))
+    await db_session.rollback()
+
+# Account changes made through UserService are audited
+async def test_user_service_changes_are_audited(db_session, verified_user, locked_user):
+    await UserService.change_role(db_session, verified_user.id, UserRole.MANAGER, actor="admin@example.com")
+    await UserService.set_professional_status(db_session, verified_user.id, True, actor="admin@example.com")
+    await UserService.unlock_user_account(db_session, locked_user.id, actor="admin@example.com")
+    await UserService.delete(db_session, verified_user.id, actor="admin@example.com")
+    await audit_log.flush()
+    entries = await _entries(db_session)
+    assert [entry.action for entry in entries] == [
+        AuditAction.ROLE_CHANGED, AuditAction.PROFESSIONAL_STATUS_CHANGED,
+        AuditAction.ACCOUNT_UNLOCKED, AuditAction.USER_DELETED,
+    ]
+    assert entries[0].details == {"old_role": "AUTHENTICATED", "new_role": "MANAGER"}
+    assert entries[3].user_id == verified_user.id
+    assert all(entry.actor == "admin@example.com" for entry in entries)
+
+# Locking an account after repeated failed logins is audited
+async def test_account_lock_is_audited(db_session, verified_user):
+    for _ in range(5):
+        await UserService.login_user(db_session, verified_user.email, "wrongpassword")
+    await audit_log.flush()
+    entries = await _entries(db_session)
+    assert [entry.action for entry in entries] == [AuditAction.ACCOUNT_LOCKED]
+
+# A role change to the current role records nothing
+async def test_unchanged_role_is_not_audited(db_session, verified_user):
+    await UserService.change_role(db_session, verified_user.id, UserRole.AUTHENTICATED)
+    assert len(audit_log) == 0
+
+# Entries page newest first and can be filtered by user and action
+async def test_list_entries(db_session, user, verified_user):
+    for _ in range(3):
+        audit_log.record(AuditAction.ACCOUNT_LOCKED, user.id)
+    audit_log.record(AuditAction.ROLE_CHANGED, verified_user.id)
+    await audit_log.flush()
+    first, cursor = await AuditLogService.list_entries(db_session, limit=2)
+    assert first[0].action == AuditAction.ROLE_CHANGED
+    assert cursor is not None
+    rest, cursor = await AuditLogService.list_entries(db_session, limit=2, after=(first[-1].created_at, first[-1].id))
+    assert len(rest) == 2 and cursor is None
+    locked, _ = await AuditLogService.list_entries(db_session, user_id=user.id, action=AuditAction.ACCOUNT_LOCKED)
+    assert len(locked) == 3
+    count = await db_session.execute(select(func.count()).select_from(AuditLogEntry))
+    assert count.scalar() == 4
@@ -0,0 +1,197 @@
+from builtins import len, range
+import asyncio
+import time
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import func, insert, select
+from app.models.event_model import Event, EventRegistration, EventStatus
+from app.models.user_model import User, UserRole
+from app.services.event_service import EventService, EventUpdateConflict, RegistrationOutcome
+from tests.conftest import AsyncTestingSessionLocal
+
+pytestmark = pytest.mark.asyncio
+
+def _event_data(**overrides):
+    data = {
+        "title": "Guest Lecture: Databases",
+        "event_type": "GUEST_LECTURE",
+        "location": "Online",
+        "starts_at": datetime.now(timezone.utc) + timedelta(days=3),
+        "capacity": 25,
+    }
+    data.update(overrides)
+    return data
+
+async def _create_users(db_session, count):
+    rows = [
+        {"nickname": f"load_user_{i}", "email": f"load_user_{i}@example.com", "hashed_password": "x",
+         "role": UserRole.AUTHENTICATED, "email_verified": True, "is_locked": False}
+        for i in range(count)
+    ]
+    result = await db_session.execute(insert(User).returning(User.id), rows)
+    await db_session.commit()
+    return result.scalars().all()
+
+# Test creating an event with valid data starts it as pending
+async def test_create_event_with_valid_data(db_session, manager_user):
+    event = await EventService.create(db_session, _event_data(), created_by=manager_user.id)
+    assert event is not None
+    assert event.status == EventStatus.PENDING
+    assert event.registered_count == 0
+
+# Test creating an event with invalid data
+async def test_create_event_with_invalid_data(db_session):
+    starts_at = datetime.now(timezone.utc)
+    event = await EventService.create(db_session, _event_data(capacity=0, ends_at=starts_at - timedelta(hours=1), starts_at=starts_at))
+    assert event is None
+
+# Test updating an event
+async def test_update_event(db_session, event):
+    updated = await EventService.update(db_session, event.id, {"location": "Jersey City, NJ"})
+    assert updated.location == "Jersey City, NJ"
+
+# Test an update cannot move the start past the stored end
+async def test_update_event_rejects_end_before_start(db_session, event):
+    await EventService.update(db_session, event.id, {"ends_at": event.starts_at + timedelta(hours=2)})
+    with pytest.raises(EventUpdateConflict):
+        await EventService.update(db_session, event.id, {"starts_at": event.starts_at + timedelta(days=1)})
+
+# Test capacity cannot drop below the seats already taken
+async def test_update_event_capacity_below_registrations(db_session, approved_event, verified_user, user):
+    await EventService.register_user(db_session, approved_event.id, verified_user.id)
+    await EventService.register_user(db_session, approved_event.id, user.id)
+    with pytest.raises(EventUpdateConflict):
+        await EventService.update(db_session, approved_event.id, {"capacity": 1})
+    updated = await EventService.update(db_session, approved_event.id, {"capacity": 2})
+    assert updated.capacity == 2
+
+# Test updating an event that does not exist
+async def test_update_missing_event(db_session):
+    assert await EventService.update(db_session, uuid4(), {"location": "Online"}) is None
+
+# Test deleting an event
+async def test_delete_event(db_session, event):
+    assert await EventService.delete(db_session, event.id) is True
+    assert await EventService.get_by_id(db_session, event.id) is None
+
+# Test registering for an approved event takes a seat
+async def test_register_user_for_event(db_session, approved_event, verified_user):
+    outcome = await EventService.register_user(db_session, approved_event.id, verified_user.id)
+    assert outcome == RegistrationOutcome.REGISTERED
+    await db_session.refresh(approved_event)
+    assert approved_event.registered_count == 1
+    assert await EventService.is_registered(db_session, approved_event.id, verified_user.id)
+
+# Test registering twice does not take a second seat
+async def test_register_user_twice(db_session, approved_event, verified_user):
+    await EventService.register_user(db_session, approved_event.id, verified_user.id)
+    outcome = await EventService.register_user(db_session, approved_event.id, verified_user.id)
+    assert outcome == RegistrationOutcome.ALREADY_REGISTERED
+    await db_session.refresh(approved_event)
+    assert approved_event.registered_count == 1
+
+# Test registering for a pending event is refused
+async def test_register_user_for_pending_event(db_session, event, verified_user):
+    outcome = await EventService.register_user(db_session, event.id, verified_user.id)
+    assert outcome == RegistrationOutcome.NOT_OPEN
+    assert not await EventService.is_registered(db_session, event.id, verified_user.id)
+
+# Test a full event refuses further registrations
+async def test_register_user_when_event_full(db_session, approved_event, verified_user, user):
+    approved_event.capacity = 1
+    await db_session.commit()
+    assert await EventService.register_user(db_session, approved_event.id, verified_user.id) == RegistrationOutcome.REGISTERED
+    assert await EventService.register_user(db_session, approved_event.id, user.id) == RegistrationOutcome.EVENT_FULL
+    assert not await EventService.is_registered(db_session, approved_event.id, user.id)
+
+# Test cancelling a registration frees the seat
+async def test_cancel_registration(db_session, approved_event, verified_user):
+    await EventService.register_user(db_session, approved_event.id, verified_user.id)
+    assert await EventService.cancel_registration(db_session, approved_event.id, verified_user.id) is True
+    await db_session.refresh(approved_event)
+    assert approved_event.registered_count == 0
+    assert await EventService.cancel_registration(db_session, approved_event.id, verified_user.id) is False
+
+# Load test: many users race for a popular event the moment it opens
+@pytest.mark.slow
+async def test_concurrent_registrations_never_overbook(db_session, approved_event):
+    capacity, contenders = 50, 400
+    approved_event.capacity = capacity
+    await db_session.commit()
+    user_ids = await _create_users(db_session, contenders)
+
+    async def register(user_id):
+        async with AsyncTestingSessionLocal() as session:
+            return await EventService.register_user(session, approved_event.id, user_id)
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(register(user_id) for user_id in user_ids))
+    elapsed = time.perf_counter() - started
+    print(f"{contenders} registration attempts in {elapsed:.2f}s ({contenders / elapsed:.0f}/s)")
+
+    assert outcomes.count(RegistrationOutcome.REGISTERED) == capacity
+    assert outcomes.count(RegistrationOutcome.EVENT_FULL) == contenders - capacity
+    registrations = await db_session.execute(
+        select(func.count()).select_from(EventRegistration).where(EventRegistration.event_id == approved_event.id)
+    )
+    assert registrations.scalar() == capacity
+    counter = await db_session.execute(select(Event.registered_count).where(Event.id == approved_event.id))
+    assert counter.scalar() == capacity
+
+async def _add_pending_events(db_session, count):
+    rows = [
+        {"title": f"Pending {i}", "starts_at": datetime.now(timezone.utc) + timedelta(days=5), "capacity": 10,
+         "status": EventStatus.PENDING, "created_at": datetime.now(timezone.utc) - timedelta(minutes=count - i)}
+        for i in range(count)
+    ]
+    result = await db_session.execute(insert(Event).returning(Event.id), rows)
+    await db_session.commit()
+    return result.scalars().all()
+
+# Test the review queue pages through pending events oldest first
+async def test_list_pending_oldest_first(db_session, approved_event):
+    pending_ids = await _add_pending_events(db_session, 5)
+    first, cursor = await EventService.list_pending(db_session, limit=3)
+    rest, last_cursor = await EventService.list_pending(db_session, limit=3, after=(first[-1].created_at, first[-1].id))
+    assert [e.id for e in first + rest] == pending_ids
+    assert cursor is not None and last_cursor is None
+
+# Test rejecting records the feedback and removes the event from the queue
+async def test_reject_event_with_feedback(db_session, event, manager_user):
+    rejected = await EventService.reject(db_session, event.id, manager_user.id, "Missing room number.")
+    assert rejected.status == EventStatus.REJECTED
+    assert rejected.review_feedback == "Missing room number."
+    assert rejected.reviewed_by == manager_user.id
+    assert await EventService.approve(db_session, event.id) is None
+    assert (await EventService.list_pending(db_session))[0] == []
+
+# Test an event claimed by one manager cannot be decided by another until the claim expires
+async def test_claim_blocks_other_reviewers(db_session, event, manager_user, admin_user):
+    claimed = await EventService.claim_for_review(db_session, manager_user.id)
+    assert [e.id for e in claimed] == [event.id]
+    assert await EventService.claim_for_review(db_session, admin_user.id) == []
+    assert await EventService.approve(db_session, event.id, admin_user.id) is None
+    approved = await EventService.approve(db_session, event.id, manager_user.id, "Looks good.")
+    assert approved.status == EventStatus.APPROVED
+    assert approved.claimed_by is None
+
+# Test an expired claim can be taken over
+async def test_expired_claim_can_be_reclaimed(db_session, event, manager_user, admin_user):
+    await EventService.claim_for_review(db_session, manager_user.id, claim_seconds=0)
+    claimed = await EventService.claim_for_review(db_session, admin_user.id)
+    assert [e.claimed_by for e in claimed] == [admin_user.id]
+
+# Test managers claiming concurrently never receive the same event
+async def test_concurrent_claims_are_disjoint(db_session):
+    pending_ids = await _add_pending_events(db_session, 30)
+    reviewer_ids = await _create_users(db_session, 10)
+
+    async def claim(reviewer_id):
+        async with AsyncTestingSessionLocal() as session:
+            return [event.id for event in await EventService.claim_for_review(session, reviewer_id, limit=4)]
+
+    claims = await asyncio.gather(*(claim(reviewer_id) for reviewer_id in reviewer_ids))
+    claimed = [event_id for batch in claims for event_id in batch]
+    assert len(claimed) == len(set(claimed)) == 30
+    assert set(claimed) == set(pending_ids)
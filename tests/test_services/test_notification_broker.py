@@ -0,0 +1,75 @@
+from builtins import len, range
+import json
+import uuid
+import pytest
+from app.routers.notification_routes import _stream_events
+from app.services.notification_broker import RESYNC, NotificationBroker
+from tests.conftest import TEST_DATABASE_URL
+
+pytestmark = pytest.mark.asyncio
+
+# Messages reach only the addressed user's subscriptions, and unsubscribing forgets the user
+async def test_deliver_to_subscribers():
+    broker = NotificationBroker(max_pending=10)
+    alice, bob = uuid.uuid4(), uuid.uuid4()
+    first, second, other = broker.subscribe(alice), broker.subscribe(alice), broker.subscribe(bob)
+    assert broker.deliver([alice], {"type": "notification", "title": "Hi"}) == 2
+    assert await first.get(timeout=0.1) == {"type": "notification", "title": "Hi"}
+    assert await second.get(timeout=0.1) == {"type": "notification", "title": "Hi"}
+    assert await other.get(timeout=0.01) is None
+    for subscription in (first, second, other):
+        broker.unsubscribe(subscription)
+    assert len(broker) == 0 and broker._subscribers == {}
+
+# A consumer that falls behind loses its backlog for one resync message instead of growing without bound
+async def test_slow_consumer_gets_resync():
+    broker = NotificationBroker(max_pending=3)
+    user_id = uuid.uuid4()
+    subscription = broker.subscribe(user_id)
+    for i in range(5):
+        broker.deliver([user_id], {"type": "notification", "title": str(i)})
+    assert subscription.queue.qsize() == 2
+    assert broker.dropped == 1
+    assert await subscription.get(timeout=0.1) == RESYNC
+    assert (await subscription.get(timeout=0.1))["title"] == "4"
+
+# Recipient lists are split so each NOTIFY payload stays under PostgreSQL's limit
+async def test_payloads_fit_in_notify():
+    user_ids = [uuid.uuid4() for _ in range(1000)]
+    payloads = NotificationBroker._payloads(user_ids, {"type": "notification", "title": "x" * 200})
+    assert len(payloads) > 1
+    assert all(len(payload.encode("utf-8")) < 8000 for payload in payloads)
+    assert [user_id for payload in payloads for user_id in json.loads(payload)["user_ids"]] == [str(u) for u in user_ids]
+
+# A committed publish reaches a subscriber through LISTEN/NOTIFY; nothing is sent for a rollback
+async def test_publish_is_delivered_after_commit(db_session, verified_user):
+    broker = NotificationBroker(channel="test_user_notifications", max_pending=10, reconnect_delay=0.1)
+    broker.start(TEST_DATABASE_URL)
+    try:
+        assert await broker.wait_listening(timeout=5)
+        user_id = verified_user.id
+        subscription = broker.subscribe(user_id)
+        await broker.publish(db_session, [user_id], {"type": "notification", "title": "Rolled back"})
+        await db_session.rollback()
+        await broker.publish(db_session, [user_id], {"type": "notification", "title": "Committed"})
+        await db_session.commit()
+        message = await subscription.get(timeout=5)
+        assert message == {"type": "notification", "title": "Committed"}
+        assert await subscription.get(timeout=0.2) is None
+    finally:
+        await broker.stop()
+
+# The SSE stream opens with the unread count, then relays messages and heartbeats
+async def test_stream_events():
+    broker = NotificationBroker(max_pending=10)
+    user_id = uuid.uuid4()
+    subscription = broker.subscribe(user_id)
+    stream = _stream_events(subscription, 4, heartbeat=0.05)
+    assert await stream.__anext__() == 'event: unread\ndata: {"unread_count": 4}\n\n'
+    assert await stream.__anext__() == ": keep-alive\n\n"
+    broker.deliver([user_id], {"type": "notification", "title": "Moved"})
+    assert await stream.__anext__() == 'event: notification\ndata: {"type": "notification", "title": "Moved"}\n\n'
+    await stream.aclose()
+
+async def test_stream_requires_login(async_client):
+    assert (await async_client.get("/me/notifications/stream")).status_code == 401
@@ -0,0 +1,117 @@
+from builtins import len, range
+import pytest
+from sqlalchemy import delete, func, insert, select, update
+from app.models.email_outbox_model import EmailOutbox
+from app.models.event_model import Event, EventRegistration
+from app.models.notification_model import Notification, NotificationKind
+from app.models.user_model import NotificationPreference, User, UserRole
+from app.services.notification_service import NotificationService
+
+pytestmark = pytest.mark.asyncio
+
+async def _register_users(db_session, event, count, verified_every=1):
+    rows = [
+        {"nickname": f"fan_out_{i}", "email": f"fan_out_{i}@example.com", "first_name": f"Fan{i}", "hashed_password": "x",
+         "role": UserRole.AUTHENTICATED, "email_verified": i % verified_every == 0, "is_locked": False}
+        for i in range(count)
+    ]
+    user_ids = (await db_session.execute(insert(User).returning(User.id), rows)).scalars().all()
+    await db_session.execute(insert(EventRegistration), [{"event_id": event.id, "user_id": user_id} for user_id in user_ids])
+    await db_session.execute(update(Event).where(Event.id == event.id).values(registered_count=count))
+    await db_session.commit()
+    await db_session.refresh(event)
+    return sorted(user_ids)
+
+async def _count(db_session, model):
+    return (await db_session.execute(select(func.count()).select_from(model))).scalar()
+
+# Every registrant gets a dashboard notification; only verified ones get an email
+async def test_fan_out_event_update_notifies_all_registrants(db_session, approved_event):
+    approved_event.capacity = 500
+    await db_session.commit()
+    user_ids = await _register_users(db_session, approved_event, 250, verified_every=2)
+    progress = []
+    notified = await NotificationService.fan_out_event_update(
+        db_session, approved_event, "The venue moved.", chunk_size=100,
+        progress=lambda done, total, last_user_id: progress.append((done, total, last_user_id)),
+    )
+    assert notified == 250
+    assert [(done, total) for done, total, _ in progress] == [(100, 250), (200, 250), (250, 250)]
+    assert progress[-1][2] == user_ids[-1]
+    assert await _count(db_session, Notification) == 250
+    assert await _count(db_session, EmailOutbox) == 125
+    notification = (await db_session.execute(select(Notification).limit(1))).scalars().first()
+    assert notification.kind == NotificationKind.EVENT_UPDATE
+    assert notification.event_id == approved_event.id
+    outbox = (await db_session.execute(select(EmailOutbox).limit(1))).scalars().first()
+    assert outbox.email_type == "event_update"
+    assert outbox.context["message"] == "The venue moved."
+
+# An interrupted fan-out can resume after the last user it reported
+async def test_fan_out_event_update_resume(db_session, approved_event):
+    user_ids = await _register_users(db_session, approved_event, 10)
+    reported = []
+    await NotificationService.fan_out_event_update(
+        db_session, approved_event, "First run.", chunk_size=3, progress=lambda done, total, last_user_id: reported.append(last_user_id)
+    )
+    await db_session.execute(delete(Notification))
+    await db_session.commit()
+    notified = await NotificationService.fan_out_event_update(db_session, approved_event, "Resumed.", chunk_size=3, resume_after=reported[1])
+    assert reported[1] == user_ids[5]
+    assert notified == 4
+    recipients = (await db_session.execute(select(Notification.user_id))).scalars().all()
+    assert sorted(recipients) == user_ids[6:]
+
+# An event without registrants produces nothing
+async def test_fan_out_event_update_no_registrants(db_session, approved_event):
+    assert await NotificationService.fan_out_event_update(db_session, approved_event, "Nobody here.") == 0
+    assert await _count(db_session, Notification) == 0
+
+# Registrants only get the channels they opted in to
+async def test_fan_out_event_update_respects_preferences(db_session, approved_event):
+    user_ids = await _register_users(db_session, approved_event, 3)
+    email_only, dashboard_only, neither = user_ids
+    await db_session.execute(update(User).where(User.id == email_only).values(notification_preferences=NotificationPreference.EVENT_UPDATES_EMAIL))
+    await db_session.execute(update(User).where(User.id == dashboard_only).values(notification_preferences=NotificationPreference.EVENT_UPDATES_DASHBOARD))
+    await db_session.execute(update(User).where(User.id == neither).values(notification_preferences=NotificationPreference.PRO_STATUS_EMAIL))
+    await db_session.commit()
+    assert await NotificationService.fan_out_event_update(db_session, approved_event, "Moved online.") == 2
+    assert (await db_session.execute(select(Notification.user_id))).scalars().all() == [dashboard_only]
+    email = (await db_session.execute(select(User.email).where(User.id == email_only))).scalar()
+    assert (await db_session.execute(select(EmailOutbox.recipient))).scalars().all() == [email]
+
+
+async def _unread_counts(db_session, user_ids):
+    result = await db_session.execute(select(User.unread_notification_count).where(User.id.in_(user_ids)))
+    return result.scalars().all()
+
+# The fan-out bumps the unread counter of every registrant it notifies on the dashboard
+async def test_fan_out_counts_unread(db_session, approved_event):
+    user_ids = await _register_users(db_session, approved_event, 5)
+    await NotificationService.fan_out_event_update(db_session, approved_event, "First.", chunk_size=2)
+    await NotificationService.fan_out_event_update(db_session, approved_event, "Second.", chunk_size=2)
+    assert await _unread_counts(db_session, user_ids) == [2] * 5
+
+# The feed pages newest first and can be limited to unread notifications
+async def test_list_for_user(db_session, approved_event):
+    [user_id] = await _register_users(db_session, approved_event, 1)
+    for i in range(5):
+        await NotificationService.fan_out_event_update(db_session, approved_event, f"Update {i}.")
+    first, cursor = await NotificationService.list_for_user(db_session, user_id, limit=3)
+    assert [n.body for n in first] == ["Update 4.", "Update 3.", "Update 2."]
+    rest, cursor = await NotificationService.list_for_user(db_session, user_id, limit=3, after=(first[-1].created_at, first[-1].id))
+    assert [n.body for n in rest] == ["Update 1.", "Update 0."] and cursor is None
+    await NotificationService.mark_read(db_session, user_id, [first[0].id])
+    unread, _ = await NotificationService.list_for_user(db_session, user_id, unread_only=True)
+    assert len(unread) == 4
+
+# Marking read only counts notifications that were unread and belong to the user
+async def test_mark_read_keeps_counter_exact(db_session, approved_event):
+    user_ids = await _register_users(db_session, approved_event, 2)
+    for _ in range(3):
+        await NotificationService.fan_out_event_update(db_session, approved_event, "Changed.")
+    mine, _ = await NotificationService.list_for_user(db_session, user_ids[0])
+    theirs, _ = await NotificationService.list_for_user(db_session, user_ids[1])
+    assert await NotificationService.mark_read(db_session, user_ids[0], [mine[0].id, mine[1].id, theirs[0].id]) == 1
+    assert await NotificationService.mark_read(db_session, user_ids[0], [mine[0].id, mine[2].id]) == 0
+    assert await _unread_counts(db_session, user_ids[1:]) == [3]
@@ -0,0 +1,99 @@
+from builtins import RuntimeError, len, range
+from unittest.mock import AsyncMock
+import pytest
+from sqlalchemy import select
+from app.models.email_outbox_model import EmailOutbox, OutboxStatus
+from app.services.email_service import EmailService
+from app.services.outbox_service import OutboxService, OutboxWorker
+from app.services.user_service import UserService
+from app.utils.rate_limiter import RateLimiter
+from app.utils.smtp_connection import SMTPClient
+from app.utils.template_manager import TemplateManager
+from tests.conftest import AsyncTestingSessionLocal
+from benchmarks.smtp_sink import SMTPSink
+
+pytestmark = pytest.mark.asyncio
+
+async def _outbox_rows(db_session):
+    result = await db_session.execute(select(EmailOutbox).execution_options(populate_existing=True))
+    return result.scalars().all()
+
+# Creating a user queues the verification email instead of sending it inline
+async def test_create_user_enqueues_verification_email(db_session, email_service):
+    email_service.smtp_client.send_email = AsyncMock()
+    user_data = {
+        "email": "outbox_user@example.com",
+        "password": "ValidPassword123!",
+        "nickname": "outbox_user_nick",
+    }
+    user = await UserService.create(db_session, user_data, email_service)
+    assert user is not None
+    email_service.smtp_client.send_email.assert_not_awaited()
+    rows = await _outbox_rows(db_session)
+    assert len(rows) == 1
+    assert rows[0].recipient == user.email
+    assert rows[0].status == OutboxStatus.PENDING
+    assert str(user.id) in rows[0].context["verification_url"]
+
+# Claimed rows are leased so a second claim does not return them again
+async def test_claim_batch_leases_rows(db_session, email_service):
+    for i in range(3):
+        email_service.enqueue_user_email(db_session, {"email": f"user{i}@example.com", "name": "x", "verification_url": "u"}, "email_verification")
+    await db_session.commit()
+    claimed = await OutboxService.claim_batch(db_session, batch_size=2, lease_seconds=60)
+    assert len(claimed) == 2
+    assert all(entry.attempts == 1 for entry in claimed)
+    remaining = await OutboxService.claim_batch(db_session, batch_size=10, lease_seconds=60)
+    assert len(remaining) == 1
+
+# The worker delivers queued emails and records them as sent
+async def test_worker_marks_emails_sent(db_session):
+    email_service = AsyncMock()
+    for i in range(3):
+        db_session.add(EmailOutbox(email_type="email_verification", recipient=f"user{i}@example.com", context={"email": f"user{i}@example.com"}))
+    await db_session.commit()
+    worker = OutboxWorker(AsyncTestingSessionLocal, email_service, batch_size=10)
+    assert await worker.run_once() == 3
+    assert email_service.send_user_email.await_count == 3
+    rows = await _outbox_rows(db_session)
+    assert all(row.status == OutboxStatus.SENT and row.sent_at is not None for row in rows)
+    assert await OutboxService.pending_count(db_session) == 0
+
+# Failed sends are retried with backoff and eventually marked failed
+async def test_worker_retries_then_fails(db_session):
+    email_service = AsyncMock()
+    email_service.send_user_email.side_effect = RuntimeError("SMTP unavailable")
+    db_session.add(EmailOutbox(email_type="email_verification", recipient="user@example.com", context={"email": "user@example.com"}))
+    await db_session.commit()
+    worker = OutboxWorker(AsyncTestingSessionLocal, email_service, batch_size=10, max_attempts=2)
+    assert await worker.run_once() == 1
+    row = (await _outbox_rows(db_session))[0]
+    assert row.status == OutboxStatus.PENDING
+    assert row.last_error == "SMTP unavailable"
+    # Not due yet because of the backoff delay
+    assert await worker.run_once() == 0
+    row.available_at = row.created_at
+    await db_session.commit()
+    assert await worker.run_once() == 1
+    row = (await _outbox_rows(db_session))[0]
+    assert row.status == OutboxStatus.FAILED
+    assert row.attempts == 2
+
+# A batch larger than the SMTP pool is sent a pool's worth at a time, with no spurious failures
+async def test_worker_batch_larger_than_pool(db_session):
+    for i in range(12):
+        db_session.add(EmailOutbox(email_type="email_verification", recipient=f"user{i}@example.com",
+                                   context={"email": f"user{i}@example.com", "name": "x", "verification_url": "u"}))
+    await db_session.commit()
+    with SMTPSink(delay=0.1) as sink:
+        email_service = EmailService(template_manager=TemplateManager())
+        email_service.smtp_client = SMTPClient(sink.host, sink.port, "sender@example.com", "secret", use_tls=False,
+                                               pool_size=2, checkout_timeout=0.15)
+        email_service.rate_limiter = RateLimiter(0)
+        worker = OutboxWorker(AsyncTestingSessionLocal, email_service, batch_size=12, concurrency=2)
+        assert await worker.run_once() == 12
+        await email_service.close()
+        assert len(sink.messages) == 12
+    rows = await _outbox_rows(db_session)
+    assert all(row.status == OutboxStatus.SENT and row.attempts == 1 for row in rows)
+
@@ -1,8 +1,11 @@
 from builtins import range
+from datetime import timedelta
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
 from app.dependencies import get_settings
-from app.models.user_model import User
+from app.models.user_model import User, UserRole
 from app.services.user_service import UserService
 
 pytestmark = pytest.mark.asyncio
@@ -155,4 +158,114 @@ async def test_unlock_user_account(db_session, locked_user):
     unlocked = await UserService.unlock_user_account(db_session, locked_user.id)
     assert unlocked, "The account should be unlocked"
     refreshed_user = await UserService.get_by_id(db_session, locked_user.id)
-    assert not refreshed_user.is_locked, "The user should no longer be locked"
\ No newline at end of file
+    assert not refreshed_user.is_locked, "The user should no longer be locked"
+
+# Test switching notification preferences only touches the ones given
+async def test_update_notification_preferences(db_session, user):
+    preferences = await UserService.update_notification_preferences(
+        db_session, user.id, {"event_updates_email": False, "pro_status_email": False}
+    )
+    assert preferences == {
+        "event_updates_email": False, "event_updates_dashboard": True,
+        "event_approval_email": True, "pro_status_email": False,
+    }
+    preferences = await UserService.update_notification_preferences(db_session, user.id, {"pro_status_email": True})
+    assert preferences["pro_status_email"] is True
+    assert preferences["event_updates_email"] is False
+    await db_session.refresh(user)
+    assert user.notification_preferences == 0b1110
+
+# Test updating the preferences of an unknown user
+async def test_update_notification_preferences_user_not_found(db_session):
+    assert await UserService.update_notification_preferences(db_session, "bd4bd8a2-3e3f-4a7b-9d3a-0f0a7d1e2c11", {"pro_status_email": True}) is None
+
+
+# Test emails are stored normalized and matched in any letter case
+async def test_email_is_case_insensitive(db_session, email_service):
+    user_data = {"email": "Mixed.Case@Example.COM", "password": "ValidPassword123!", "nickname": "mixed_case"}
+    user = await UserService.create(db_session, user_data, email_service)
+    assert user.email == "mixed.case@example.com"
+    assert (await UserService.get_by_email(db_session, " MIXED.case@example.com ")).id == user.id
+    duplicate = {"email": "mixed.CASE@example.com", "password": "ValidPassword123!", "nickname": "mixed_case_2"}
+    assert await UserService.create(db_session, duplicate, email_service) is None
+
+# Test email changes are normalized too
+async def test_update_normalizes_email(db_session, user):
+    updated_user = await UserService.update(db_session, user.id, {"email": "New.Address@Example.com"})
+    assert updated_user.email == "new.address@example.com"
+
+# Test login accepts the email in another letter case
+async def test_login_user_email_case_insensitive(db_session, verified_user):
+    assert await UserService.login_user(db_session, verified_user.email.upper(), "MySuperPassword$1234") is not None
+
+# Test the database itself rejects a second account differing only in case
+async def test_email_unique_ignoring_case(db_session, user):
+    with pytest.raises(IntegrityError):
+        await db_session.execute(text(
+            "INSERT INTO users (id, nickname, email, hashed_password, role, email_verified) "
+            "VALUES (gen_random_uuid(), 'case_clash', upper(:email), 'x', 'AUTHENTICATED', true)"
+        ), {"email": user.email})
+    await db_session.rollback()
+
+# Test lookups by email probe the functional index
+async def test_get_by_email_uses_functional_index(db_session, user):
+    query = select(User.id).where(User.email_matches(user.email.upper()))
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = (await db_session.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    assert any("ix_users_email_lower" in line for line in plan)
+
+def _triage_user(key: str, **fields) -> User:
+    return User(nickname=f"triage_{key}", email=f"triage_{key}@example.com", hashed_password="x",
+                role=UserRole.AUTHENTICATED, **fields)
+
+# Test the locked-accounts list pages newest first and leaves out unlocked users
+async def test_list_locked_pages_newest_first(db_session, verified_user):
+    locked = [_triage_user(str(n), email_verified=True) for n in range(3)]
+    db_session.add_all(locked)
+    await db_session.commit()
+    for age, user in enumerate(locked):
+        await db_session.execute(update(User).where(User.id == user.id).values(
+            is_locked=True, updated_at=text(f"now() - interval '{age} hours'")))
+    await db_session.commit()
+    first, cursor = await UserService.list_locked(db_session, limit=2)
+    assert [user.id for user in first] == [locked[0].id, locked[1].id]
+    assert cursor is not None
+    second, cursor = await UserService.list_locked(db_session, limit=2, after=(first[-1].updated_at, first[-1].id))
+    assert [user.id for user in second] == [locked[2].id]
+    assert cursor is None
+
+# Test unverified accounts are listed only once they are older than the cutoff
+async def test_list_unverified_older_than(db_session, unverified_user, verified_user):
+    users, _ = await UserService.list_unverified(db_session, timedelta(days=7))
+    assert users == []
+    await db_session.execute(update(User).where(User.id.in_([unverified_user.id, verified_user.id]))
+                             .values(created_at=text("now() - interval '10 days'")))
+    await db_session.commit()
+    users, cursor = await UserService.list_unverified(db_session, timedelta(days=7))
+    assert [user.id for user in users] == [unverified_user.id]
+    assert cursor is None
+
+# Test pro candidates are verified, unlocked, not professional and have a profile link
+async def test_list_pro_candidates(db_session, verified_user, unverified_user, locked_user):
+    for user in (verified_user, unverified_user, locked_user):
+        user.linkedin_profile_url = "https://linkedin.com/in/candidate"
+    await db_session.commit()
+    users, _ = await UserService.list_pro_candidates(db_session)
+    assert [user.id for user in users] == [verified_user.id]
+    await UserService.set_professional_status(db_session, verified_user.id, True)
+    users, _ = await UserService.list_pro_candidates(db_session)
+    assert users == []
+
+# Test each triage list is answered from its partial index
+@pytest.mark.parametrize("predicate, order, index", [
+    (User.locked, User.updated_at.desc(), "ix_users_locked_updated_at"),
+    (User.unverified, User.created_at, "ix_users_unverified_created_at"),
+    (User.pro_candidate, User.created_at, "ix_users_pro_candidates_created_at"),
+])
+async def test_triage_lists_use_partial_indexes(db_session, predicate, order, index):
+    query = select(User.id).where(predicate()).order_by(order).limit(21)
+    compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = (await db_session.execute(text(f"EXPLAIN {compiled}"))).scalars().all()
+    assert any(index in line for line in plan)
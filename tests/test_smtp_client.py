@@ -0,0 +1,102 @@
+import asyncio
+import socket
+import pytest
+from app.utils.smtp_connection import SMTPClient
+from benchmarks.smtp_sink import SMTPSink
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def smtp_sink():
+    with SMTPSink() as sink:
+        yield sink
+
+
+def make_client(sink, pool_size=2, **kwargs):
+    return SMTPClient(
+        server=sink.host,
+        port=sink.port,
+        username="sender@example.com",
+        password="secret",
+        use_tls=False,
+        pool_size=pool_size,
+        timeout=5.0,
+        **kwargs
+    )
+
+
+# Sequential sends should reuse one authenticated connection
+async def test_connection_reused_between_messages(smtp_sink):
+    client = make_client(smtp_sink)
+    for i in range(5):
+        await client.send_email("Hello", f"<p>message {i}</p>", f"user{i}@example.com")
+    await client.close()
+    assert len(smtp_sink.messages) == 5
+    assert smtp_sink.connections == 1
+    assert client.connections_opened == 1
+
+
+# Concurrent sends never open more connections than the pool size
+async def test_concurrent_sends_bounded_by_pool(smtp_sink):
+    client = make_client(smtp_sink, pool_size=3)
+    await asyncio.gather(*(
+        client.send_email("Hello", "<p>hi</p>", f"user{i}@example.com") for i in range(30)
+    ))
+    await client.close()
+    assert len(smtp_sink.messages) == 30
+    assert client.connections_opened <= 3
+
+
+# A connection dropped by the server is replaced and the message still delivered
+async def test_reconnects_after_server_disconnect(smtp_sink):
+    client = make_client(smtp_sink)
+    await client.send_email("Hello", "<p>first</p>", "first@example.com")
+    stale = client._idle.get_nowait()
+    stale.sock.shutdown(socket.SHUT_RDWR)
+    client._idle.put(stale)
+    await client.send_email("Hello", "<p>second</p>", "second@example.com")
+    await client.close()
+    assert [m["recipients"] for m in smtp_sink.messages] == [["first@example.com"], ["second@example.com"]]
+    assert client.connections_opened == 2
+
+
+# Connections are recycled after the configured number of messages
+async def test_connection_recycled_after_message_limit(smtp_sink):
+    client = make_client(smtp_sink, max_messages_per_connection=2)
+    for i in range(4):
+        await client.send_email("Hello", "<p>hi</p>", f"user{i}@example.com")
+    await client.close()
+    assert client.connections_opened == 2
+
+
+# Sends waiting for the pool hold no executor threads, so other to_thread work is not starved
+async def test_waiting_sends_do_not_occupy_threads():
+    with SMTPSink(delay=0.05) as slow_sink:
+        client = make_client(slow_sink, pool_size=2)
+        sends = asyncio.gather(*(
+            client.send_email("Hello", "<p>hi</p>", f"user{i}@example.com") for i in range(40)
+        ))
+        await asyncio.sleep(0.1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await asyncio.to_thread(lambda: None)
+        assert loop.time() - started < 0.5
+        await sends
+        await client.close()
+        assert len(slow_sink.messages) == 40
+        assert client.connections_opened <= 2
+
+
+# A send that cannot get a connection within checkout_timeout fails without waiting for the socket timeout
+async def test_checkout_timeout():
+    with SMTPSink(delay=0.5) as slow_sink:
+        client = make_client(slow_sink, pool_size=1, checkout_timeout=0.1)
+        results = await asyncio.gather(
+            client.send_email("Hello", "<p>hi</p>", "first@example.com"),
+            client.send_email("Hello", "<p>hi</p>", "second@example.com"),
+            return_exceptions=True,
+        )
+        await client.close()
+        assert results[0] is None
+        assert "free SMTP connection" in str(results[1])
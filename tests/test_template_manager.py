@@ -0,0 +1,64 @@
+import os
+import markdown2
+import pytest
+from app.utils.template_manager import TemplateManager
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    (tmp_path / "header.md").write_text("# Header\n", encoding="utf-8")
+    (tmp_path / "footer.md").write_text("Footer {not a field}\n", encoding="utf-8")
+    (tmp_path / "greeting.md").write_text("Hello {name}, see [link]({url}) and {{braces}}.\n", encoding="utf-8")
+    return tmp_path
+
+
+def legacy_render(template_manager, template_name, **context):
+    """The original read-every-time rendering path, used as the reference output."""
+    header = template_manager._read_template('header.md')
+    footer = template_manager._read_template('footer.md')
+    main_content = template_manager._read_template(f'{template_name}.md').format(**context)
+    return template_manager._apply_email_styles(markdown2.markdown(f"{header}\n{main_content}\n{footer}"))
+
+
+def test_compiled_render_matches_legacy_output():
+    template_manager = TemplateManager()
+    context = {"name": "Ann", "email": "ann@example.com", "verification_url": "http://localhost/verify-email/1/abc"}
+    rendered = template_manager.render_template('email_verification', **context)
+    assert rendered == legacy_render(template_manager, 'email_verification', **context)
+
+
+def test_placeholders_substituted_and_literal_braces_kept(templates_dir):
+    template_manager = TemplateManager(templates_dir)
+    rendered = template_manager.render_template("greeting", name="Bob", url="http://example.com/x")
+    assert "Hello Bob" in rendered
+    assert 'href="http://example.com/x"' in rendered
+    assert "{braces}" in rendered
+    assert "Footer {not a field}" in rendered
+
+
+def test_context_values_are_html_escaped(templates_dir):
+    template_manager = TemplateManager(templates_dir)
+    rendered = template_manager.render_template("greeting", name="<b>Eve</b>", url="http://example.com")
+    assert "&lt;b&gt;Eve&lt;/b&gt;" in rendered
+
+
+def test_template_compiled_once_until_file_changes(templates_dir, mocker):
+    template_manager = TemplateManager(templates_dir)
+    compile_spy = mocker.spy(template_manager, "_compile")
+    for _ in range(3):
+        template_manager.render_template("greeting", name="Bob", url="u")
+    assert compile_spy.call_count == 1
+
+    greeting = templates_dir / "greeting.md"
+    greeting.write_text("Bye {name}.\n", encoding="utf-8")
+    stat = greeting.stat()
+    os.utime(greeting, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    rendered = template_manager.render_template("greeting", name="Bob")
+    assert "Bye Bob." in rendered
+    assert compile_spy.call_count == 2
+
+
+def test_precompile_compiles_every_template_but_the_partials(templates_dir):
+    template_manager = TemplateManager(templates_dir)
+    assert template_manager.precompile() == ["greeting"]
+    assert set(template_manager._compiled) == {"greeting"}
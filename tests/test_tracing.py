@@ -0,0 +1,60 @@
+import json
+from unittest.mock import patch
+import pytest
+from app.utils.smtp_connection import SMTPClient
+from app.utils.tracing import FileExporter, InMemoryExporter, Tracer, tracer
+from benchmarks.smtp_sink import SMTPSink
+
+pytestmark = pytest.mark.asyncio
+
+@pytest.fixture
+def collector():
+    exporter = InMemoryExporter()
+    with patch.object(tracer, "exporter", exporter), patch.object(tracer, "sample_rate", 1.0):
+        yield exporter
+
+async def test_unsampled_requests_record_nothing(async_client):
+    exporter = InMemoryExporter()
+    with patch.object(tracer, "exporter", exporter), patch.object(tracer, "sample_rate", 0.0):
+        await async_client.get("/events")
+    assert list(exporter.spans) == []
+
+async def test_register_is_traced_through_service_bcrypt_and_sql(async_client, collector):
+    user_data = {"email": "traced@example.com", "password": "ValidPassword123!", "nickname": "traced_nick"}
+    response = await async_client.post("/register/", json=user_data)
+    assert response.status_code == 200
+    spans = {span.name: span for span in collector.spans}
+    root = spans["HTTP POST /register/"]
+    assert root.parent_id is None and root.attributes["status"] == 200
+    assert spans["UserService.register_user"].parent_id == root.span_id
+    assert spans["UserService.create"].parent_id == spans["UserService.register_user"].span_id
+    assert spans["bcrypt.hashpw"].parent_id == spans["UserService.create"].span_id
+    queries = [span for span in collector.spans if span.name == "db.query"]
+    assert any(span.attributes["statement"].startswith("INSERT INTO users") for span in queries)
+    assert all(span.trace_id == root.trace_id for span in collector.spans)
+    assert root.duration >= spans["UserService.register_user"].duration
+
+async def test_smtp_send_span():
+    exporter = InMemoryExporter()
+    local = Tracer(sample_rate=1.0, exporter=exporter)
+    with SMTPSink() as sink, patch("app.utils.smtp_connection.tracer", local):
+        client = SMTPClient(server=sink.host, port=sink.port, username="sender@example.com", password="secret",
+                            use_tls=False, pool_size=1, timeout=5.0)
+        with local.span("job", root=True):
+            await client.send_email("Hello", "<p>hi</p>", "someone@example.com")
+        await client.close()
+    names = [span.name for span in exporter.spans]
+    assert names == ["smtp.send", "job"]
+    assert exporter.spans[0].attributes == {"recipient_domain": "example.com"}
+
+async def test_file_exporter_writes_json_lines(tmp_path):
+    exporter = FileExporter(str(tmp_path / "spans.jsonl"))
+    local = Tracer(sample_rate=1.0, exporter=exporter)
+    with local.span("outer", root=True):
+        with local.span("inner", step=1):
+            pass
+    exporter.close()
+    lines = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["inner", "outer"]
+    assert lines[0]["parent_id"] == lines[1]["span_id"]
+    assert lines[0]["attributes"] == {"step": 1}
@@ -0,0 +1,38 @@
+from unittest.mock import patch
+import pytest
+from app.database import Database
+from app.main import app
+from app.services.event_service import upcoming_events_cache
+from app.utils.metrics import metrics
+from app.utils.warmup import record_startup, warm_up
+from tests.conftest import engine
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_pool_warm_up_leaves_connections_idle_in_pool():
+    with patch.object(Database, "_engine", engine):
+        assert await Database.warm_up(3) == 3
+        assert engine.pool.checkedin() >= 3 and engine.pool.checkedout() == 0
+        # Never more than the pool keeps
+        assert await Database.warm_up(100) == engine.pool.size()
+
+
+async def test_warm_up_runs_every_step_and_fills_listing_cache(async_client):
+    with patch.object(Database, "_engine", engine):
+        timings = await warm_up(app)
+    assert set(timings) == {"pool", "templates", "crypto", "routes"}
+    assert len(upcoming_events_cache) == 1
+
+
+async def test_failed_step_does_not_stop_startup(async_client):
+    with patch.object(Database, "_engine", engine), patch("app.utils.warmup._warm_templates", side_effect=OSError("gone")):
+        timings = await warm_up(app)
+    assert "templates" not in timings and "routes" in timings
+
+
+async def test_startup_times_are_exposed():
+    record_startup(0.8, 0.25, {"pool": 0.05})
+    rendered = metrics.render()
+    assert 'app_startup_seconds{phase="import"} 0.8' in rendered
+    assert 'app_startup_seconds{phase="warmup_pool"} 0.05' in rendered